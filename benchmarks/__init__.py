@@ -0,0 +1,6 @@
+"""
+Benchmarks for the ontology validation tooling.
+
+See pipeline_benchmark.py for the standalone runner and
+test_pipeline_benchmark.py for the pytest-benchmark variant.
+"""
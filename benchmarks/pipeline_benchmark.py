@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark - Stage Timings of the SHACL Validation Pipeline
+
+Times every stage of ShaclValidator.validate() separately on catalog test
+data of representative domains and on synthetic, scaled copies of it, and
+writes the results as JSON so that runs of different commits can be compared.
+
+FEATURE SET:
+============
+1. time_stages - Time load_data, load_schemas, inference and validation once
+2. make_synthetic_dataset - Scale a domain's test data by copying its nodes
+3. run_benchmarks - Benchmark domains and scales, returning a JSON-ready dict
+4. compare_results - Compare two benchmark results stage by stage
+
+USAGE:
+======
+    python3 -m benchmarks.pipeline_benchmark --output bench.json
+    python3 -m benchmarks.pipeline_benchmark --domain hdmap --scale 1 50 --repeat 5
+    python3 -m benchmarks.pipeline_benchmark --compare main.json --output bench.json
+
+    # With pytest-benchmark installed
+    pytest benchmarks/ --benchmark-json bench.json
+
+STANDALONE TESTING:
+==================
+    python3 -m benchmarks.pipeline_benchmark [--test]
+
+DEPENDENCIES:
+=============
+- rdflib, pyshacl: Validation pipeline under test
+- pytest-benchmark (optional): Only for benchmarks/test_pipeline_benchmark.py
+
+NOTES:
+======
+- Stages are read from the metrics of ShaclValidator.validate()
+  (result.metrics.stages, see src/tools/core/metrics.py):
+    * load_data: load_data (JSON-LD parsing and fixture resolution)
+    * load_schemas: schema_discovery (schema discovery and _load_schemas)
+    * apply_inference: inference (ontology module extraction and the
+      inference step, including the cleanup of the RDFS overlay)
+    * run_validation: validation (pyshacl)
+- Scale 1 uses the valid catalog test files of a domain. Scale N > 1 uses N
+  copies of them in which every described node gets a new @id, so the data
+  grows while schemas and fixture references stay the same.
+- The first repetition runs with empty in-process caches (compiled shapes);
+  later repetitions show the warm numbers. The on-disk graph cache is left
+  as configured (set ONTOLOGY_GRAPH_CACHE=0 to time raw parsing).
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.tools.utils.graph_cache import get_graph_cache
+from src.tools.utils.graph_loader import FAST_STORE
+from src.tools.utils.registry_resolver import get_registry_resolver
+from src.tools.validators.shacl.compiled_shapes import clear_compiled_shapes
+from src.tools.validators.shacl.validator import ShaclValidator
+
+# Repository root (benchmarks/ lives directly below it)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Representative domains benchmarked by default
+BENCHMARK_DOMAINS = ("gx", "hdmap", "openlabel", "manifest")
+
+# Data scale factors benchmarked by default (1 = catalog test data as-is)
+BENCHMARK_SCALES = (1, 10)
+
+# Stage names in pipeline order
+STAGES = ("load_data", "load_schemas", "apply_inference", "run_validation")
+
+# ValidationMetrics stage measured for each benchmark stage
+STAGE_METRICS = {
+    "load_data": "load_data",
+    "load_schemas": "schema_discovery",
+    "apply_inference": "inference",
+    "run_validation": "validation",
+}
+
+# Bump when the JSON layout changes
+RESULT_FORMAT_VERSION = 1
+
+
+def time_stages(validator: ShaclValidator, jsonld_files: List[Path]) -> Dict:
+    """
+    Run the validation pipeline once, timing every stage.
+
+    The timings are the stage metrics ShaclValidator.validate() records
+    itself, so the benchmark always times exactly what the validator runs.
+
+    Args:
+        validator: ShaclValidator to benchmark (should be non-verbose)
+        jsonld_files: JSON-LD files validated together
+
+    Returns:
+        Dict with per-stage seconds, triple counts and the conformance result
+    """
+    result = validator.validate(jsonld_files)
+    stages = result.metrics.stages
+    triples = result.metrics.triples
+
+    return {
+        "seconds": {
+            stage: stages[metric].wall_seconds
+            for stage, metric in STAGE_METRICS.items()
+        },
+        "data_triples": triples["data"],
+        "ontology_triples": triples["ontology"],
+        "ontology_module_triples": triples.get("ontology_module"),
+        "shacl_triples": triples["shacl"],
+        "inferred_triples": result.inferred_count,
+        "validated_triples": result.triples_count,
+        "conforms": result.conforms,
+    }
+
+
+def _rename_nodes(value: Any, renames: Dict[str, str]) -> Any:
+    """Replace node identifiers in a JSON-LD value (outside of @context)."""
+    if isinstance(value, dict):
+        return {
+            key: item if key == "@context" else _rename_nodes(item, renames)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_rename_nodes(item, renames) for item in value]
+    if isinstance(value, str):
+        return renames.get(value, value)
+    return value
+
+
+def _defined_node_ids(value: Any, ids: Optional[set] = None) -> set:
+    """Collect @id values of nodes with properties besides @id and @type."""
+    ids = set() if ids is None else ids
+    if isinstance(value, dict):
+        if isinstance(value.get("@id"), str) and set(value) - {"@id", "@type"}:
+            ids.add(value["@id"])
+        for key, item in value.items():
+            if key != "@context":
+                _defined_node_ids(item, ids)
+    elif isinstance(value, list):
+        for item in value:
+            _defined_node_ids(item, ids)
+    return ids
+
+
+def make_synthetic_dataset(
+    source_files: List[Path], scale: int, output_dir: Path
+) -> List[Path]:
+    """
+    Write scale copies of JSON-LD files with renamed nodes.
+
+    Every node described in a source file (with properties besides @id and
+    @type) gets a copy-specific @id, and references to it are renamed as
+    well. Vocabulary individuals and external references such as fixtures
+    are kept, so all copies validate against the same schemas.
+
+    Args:
+        source_files: JSON-LD files to copy
+        scale: Number of copies per file
+        output_dir: Directory receiving the copies
+
+    Returns:
+        Paths of the written files
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for source in source_files:
+        document = json.loads(Path(source).read_text(encoding="utf-8"))
+        node_ids = _defined_node_ids(document)
+        for copy in range(scale):
+            renames = {node_id: f"{node_id}-copy{copy}" for node_id in node_ids}
+            target = output_dir / f"{Path(source).stem}-copy{copy}.json"
+            target.write_text(
+                json.dumps(_rename_nodes(document, renames)), encoding="utf-8"
+            )
+            written.append(target)
+    return written
+
+
+def _summarize(values: List[float]) -> Dict[str, Any]:
+    """Return runs and summary statistics of timing values."""
+    return {
+        "runs": [round(v, 6) for v in values],
+        "min": round(min(values), 6),
+        "median": round(statistics.median(values), 6),
+        "max": round(max(values), 6),
+    }
+
+
+def _benchmark_files(
+    name: str,
+    domain: str,
+    scale: int,
+    jsonld_files: List[Path],
+    repeat: int,
+    inference_mode: str,
+    root_dir: Path,
+) -> Dict:
+    """Benchmark one dataset with repeat pipeline runs."""
+    clear_compiled_shapes()
+    runs = []
+    for _ in range(repeat):
+        validator = ShaclValidator(
+            root_dir, inference_mode=inference_mode, verbose=False
+        )
+        runs.append(time_stages(validator, jsonld_files))
+
+    stages = {
+        stage: _summarize([run["seconds"][stage] for run in runs]) for stage in STAGES
+    }
+    last = runs[-1]
+    return {
+        "name": name,
+        "domain": domain,
+        "scale": scale,
+        "files": len(jsonld_files),
+        "stages": stages,
+        "total": _summarize([sum(run["seconds"].values()) for run in runs]),
+        "data_triples": last["data_triples"],
+        "ontology_triples": last["ontology_triples"],
+        "ontology_module_triples": last["ontology_module_triples"],
+        "shacl_triples": last["shacl_triples"],
+        "inferred_triples": last["inferred_triples"],
+        "validated_triples": last["validated_triples"],
+        "conforms": last["conforms"],
+    }
+
+
+def _git_commit(root_dir: Path) -> Optional[str]:
+    """Return the checked out commit, or None outside of a git repository."""
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=root_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def run_benchmarks(
+    domains: List[str] = BENCHMARK_DOMAINS,
+    scales: List[int] = BENCHMARK_SCALES,
+    repeat: int = 3,
+    inference_mode: str = "rdfs",
+    root_dir: Path = ROOT_DIR,
+) -> Dict:
+    """
+    Benchmark the validation pipeline for domains and data scales.
+
+    Args:
+        domains: Catalog test domains (their valid test data is used)
+        scales: Data scale factors (1 = test data as-is)
+        repeat: Pipeline runs per dataset
+        inference_mode: Inference mode passed to ShaclValidator
+        root_dir: Repository root
+
+    Returns:
+        JSON-serializable dict with metadata and one entry per dataset
+    """
+    import pyshacl
+    import rdflib
+
+    resolver = get_registry_resolver(root_dir)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="onto-bench-") as tmpdir:
+        for domain in domains:
+            files = resolver.get_test_files(domain, test_type="valid")
+            if not files:
+                print(f"⚠️ No valid test data for domain '{domain}'", file=sys.stderr)
+                continue
+            for scale in scales:
+                name = domain if scale == 1 else f"{domain}@x{scale}"
+                if scale > 1:
+                    files_for_scale = make_synthetic_dataset(
+                        files, scale, Path(tmpdir) / name
+                    )
+                else:
+                    files_for_scale = files
+                print(f"⏱️ {name} ({len(files_for_scale)} files)", flush=True)
+                results.append(
+                    _benchmark_files(
+                        name,
+                        domain,
+                        scale,
+                        files_for_scale,
+                        repeat,
+                        inference_mode,
+                        root_dir,
+                    )
+                )
+
+    return {
+        "version": RESULT_FORMAT_VERSION,
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": _git_commit(root_dir),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rdflib": rdflib.__version__,
+            "pyshacl": pyshacl.__version__,
+            "fast_store": FAST_STORE,
+            "graph_cache": get_graph_cache(root_dir) is not None,
+            "inference_mode": inference_mode,
+            "repeat": repeat,
+        },
+        "benchmarks": results,
+    }
+
+
+def _median(entry: Dict, stage: str) -> float:
+    """Return the median seconds of a stage (or "total") of a benchmark entry."""
+    timings = entry["total"] if stage == "total" else entry["stages"][stage]
+    return timings["median"]
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 1.2) -> List[str]:
+    """
+    Compare median stage timings of two benchmark results.
+
+    Args:
+        baseline: Result of an earlier run_benchmarks() call
+        current: Result to compare against the baseline
+        threshold: Ratio (current / baseline) from which a stage regressed
+
+    Returns:
+        Human-readable lines, regressions marked with "❌"
+    """
+    previous = {entry["name"]: entry for entry in baseline.get("benchmarks", [])}
+    lines = []
+    for entry in current.get("benchmarks", []):
+        old = previous.get(entry["name"])
+        if old is None:
+            continue
+        for stage in STAGES + ("total",):
+            new_seconds = _median(entry, stage)
+            old_seconds = _median(old, stage)
+            ratio = new_seconds / old_seconds if old_seconds > 0 else 1.0
+            marker = "❌" if ratio >= threshold else "  "
+            lines.append(
+                f"{marker} {entry['name']:<20} {stage:<16} "
+                f"{old_seconds:9.3f}s -> {new_seconds:9.3f}s  (x{ratio:.2f})"
+            )
+    return lines
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    print("Running pipeline_benchmark self-tests...")
+    all_passed = True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        # Test 1: Synthetic copies rename described nodes but keep references
+        source = tmppath / "instance.json"
+        source.write_text(
+            json.dumps(
+                {
+                    "@context": {"ex": "http://example.org/"},
+                    "@id": "ex:a",
+                    "ex:knows": {"@id": "ex:b", "ex:name": "B"},
+                    "ex:role": {"@id": "ex:public", "@type": "ex:Role"},
+                    "ex:ref": {"@id": "did:web:fixture"},
+                }
+            )
+        )
+        copies = make_synthetic_dataset([source], 2, tmppath / "out")
+        second = json.loads(copies[1].read_text())
+        if (
+            len(copies) != 2
+            or second["@id"] != "ex:a-copy1"
+            or second["ex:knows"]["@id"] != "ex:b-copy1"
+            or second["ex:role"]["@id"] != "ex:public"
+            or second["ex:ref"]["@id"] != "did:web:fixture"
+        ):
+            print(f"FAIL: Synthetic dataset - {second}")
+            all_passed = False
+        else:
+            print("PASS: Synthetic dataset renames described nodes only")
+
+    # Test 2: Comparison flags slower stages
+    def _result(seconds):
+        stage = {"median": seconds}
+        return {
+            "benchmarks": [
+                {
+                    "name": "d",
+                    "stages": {s: stage for s in STAGES},
+                    "total": {"median": seconds * len(STAGES)},
+                }
+            ]
+        }
+
+    lines = compare_results(_result(1.0), _result(2.0))
+    if len(lines) != len(STAGES) + 1 or not all(
+        line.startswith("❌") for line in lines
+    ):
+        print(f"FAIL: Comparison - {lines}")
+        all_passed = False
+    else:
+        print("PASS: Comparison flags regressions")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main(args=None):
+    """CLI entry point for pipeline_benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the stages of the SHACL validation pipeline."
+    )
+    parser.add_argument(
+        "--domain",
+        nargs="+",
+        default=list(BENCHMARK_DOMAINS),
+        help=f"Test domains to benchmark (default: {' '.join(BENCHMARK_DOMAINS)})",
+    )
+    parser.add_argument(
+        "--scale",
+        nargs="+",
+        type=int,
+        default=list(BENCHMARK_SCALES),
+        help="Data scale factors (default: 1 10)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Pipeline runs per dataset"
+    )
+    parser.add_argument(
+        "--inference-mode",
+        choices=["rdfs", "owlrl", "none", "both"],
+        default="rdfs",
+        help="Inference mode (default: rdfs)",
+    )
+    parser.add_argument(
+        "--output", "-o", type=Path, help="Write JSON results to this file"
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="BASELINE",
+        help="Compare with an earlier JSON result; exit 1 on regressions",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Slowdown ratio counted as regression (default: 1.2)",
+    )
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    if parsed_args.repeat < 1 or any(scale < 1 for scale in parsed_args.scale):
+        parser.error("--repeat and --scale must be at least 1")
+
+    result = run_benchmarks(
+        parsed_args.domain,
+        parsed_args.scale,
+        parsed_args.repeat,
+        parsed_args.inference_mode,
+    )
+
+    payload = json.dumps(result, indent=2)
+    if parsed_args.output:
+        parsed_args.output.write_text(payload + "\n", encoding="utf-8")
+        print(f"📄 Results written to {parsed_args.output}")
+    else:
+        print(payload)
+
+    if parsed_args.compare:
+        baseline = json.loads(parsed_args.compare.read_text(encoding="utf-8"))
+        lines = compare_results(baseline, result, parsed_args.threshold)
+        print("\n".join(lines))
+        if any(line.startswith("❌") for line in lines):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+pytest-benchmark variant of the pipeline stage benchmarks.
+
+Run explicitly (benchmarks/ is not part of the default test paths):
+
+    pytest benchmarks/ --benchmark-json bench.json
+"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.pipeline_benchmark import (
+    BENCHMARK_DOMAINS,
+    ROOT_DIR,
+    make_synthetic_dataset,
+    time_stages,
+)
+from src.tools.core.metrics import ValidationMetrics
+from src.tools.utils.registry_resolver import get_registry_resolver
+from src.tools.validators.shacl.schema_discovery import (
+    extract_datatype_iris,
+    extract_predicates,
+    extract_rdf_types,
+)
+from src.tools.validators.shacl.validator import ShaclValidator
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _domain_files(domain: str):
+    files = get_registry_resolver(ROOT_DIR).get_test_files(domain, test_type="valid")
+    if not files:
+        pytest.skip(f"No valid test data for domain '{domain}'")
+    return files
+
+
+def _validator() -> ShaclValidator:
+    return ShaclValidator(ROOT_DIR, verbose=False)
+
+
+@pytest.mark.parametrize("domain", BENCHMARK_DOMAINS)
+def test_load_data(benchmark, domain):
+    files = _domain_files(domain)
+    validator = _validator()
+    benchmark(validator._load_data, files)
+
+
+@pytest.mark.parametrize("domain", BENCHMARK_DOMAINS)
+def test_load_schemas(benchmark, domain):
+    validator = _validator()
+    data_graph, _ = validator._load_data(_domain_files(domain))
+    iris = (
+        extract_rdf_types(data_graph),
+        extract_predicates(data_graph),
+        extract_datatype_iris(data_graph),
+    )
+    benchmark(validator._load_schemas, *iris)
+
+
+@pytest.mark.parametrize("domain", BENCHMARK_DOMAINS)
+def test_apply_inference(benchmark, domain):
+    validator = _validator()
+    data_graph, _ = validator._load_data(_domain_files(domain))
+    ontology_graph, _ = validator._load_schemas(
+        extract_rdf_types(data_graph),
+        extract_predicates(data_graph),
+        extract_datatype_iris(data_graph),
+    )
+
+    def _infer():
+        # Same work as the "inference" stage of ShaclValidator._validate_graph
+        module = validator._ontology_module(
+            data_graph, ontology_graph, ValidationMetrics()
+        )
+        with validator._inference_context(data_graph, module) as result:
+            return result
+
+    benchmark(_infer)
+
+
+@pytest.mark.parametrize("domain", BENCHMARK_DOMAINS)
+def test_run_validation(benchmark, domain):
+    validator = _validator()
+    data_graph, _ = validator._load_data(_domain_files(domain))
+    ontology_graph, shacl_graph = validator._load_schemas(
+        extract_rdf_types(data_graph),
+        extract_predicates(data_graph),
+        extract_datatype_iris(data_graph),
+    )
+
+    ontology_graph = validator._ontology_module(
+        data_graph, ontology_graph, ValidationMetrics()
+    )
+
+    with validator._inference_context(data_graph, ontology_graph) as (combined, _):
+        benchmark(validator._run_validation, combined, ontology_graph, shacl_graph)
+
+
+@pytest.mark.parametrize("scale", [10])
+@pytest.mark.parametrize("domain", ["manifest", "hdmap"])
+def test_pipeline_synthetic(benchmark, domain, scale, tmp_path: Path):
+    files = make_synthetic_dataset(_domain_files(domain), scale, tmp_path)
+    result = benchmark.pedantic(
+        lambda: time_stages(_validator(), files), rounds=3, iterations=1
+    )
+    assert result["conforms"]
@@ -14,7 +14,6 @@ from __future__ import annotations
 import os
 import re
 import shutil
-import subprocess
 import sys
 from pathlib import Path
 
@@ -123,14 +122,19 @@ def _run_docs_generators() -> None:
     """
     Run documentation generators before building docs.
 
+    Both generators run in this process on one shared DocsModel, so every
+    artifact file is parsed once per build.
+
     DOCS_SITE_URL is optional and overrides the base URL used for local diagrams.
+    ONTOLOGY_DOCS_JOBS is optional and sets the worker processes rendering
+    class pages (default: 1, rendered in this process).
     """
-    subprocess.run(
-        [sys.executable, "-m", "src.tools.utils.properties_updater"], check=True
-    )
-    subprocess.run(
-        [sys.executable, "-m", "src.tools.utils.class_page_generator"], check=True
-    )
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+
+    from src.tools.utils.docs_model import generate_docs, get_docs_jobs
+
+    generate_docs(jobs=get_docs_jobs())
 
 
 def _build_class_page_nav(docs_dir: Path) -> dict:
@@ -10,6 +10,9 @@ Contents:
     - result: ValidationResult dataclass and ReturnCodes enum
     - logging: Centralized logger configuration
     - iri_utils: IRI string manipulation utilities
+    - metrics: Per-stage timing and memory metrics (ValidationMetrics)
+    - profiling: cProfile output per phase and domain (profile_section)
+    - file_utils: File hashes, stat stamps and atomic writes of the caches
 
 Usage:
     from src.tools.core import ValidationResult, ReturnCodes
@@ -21,6 +24,7 @@ Usage:
 from .constants import FAST_STORE
 from .iri_utils import get_local_name, get_namespace, is_did_web, parse_did_web
 from .logging import LogLevel, configure_logging, get_logger
+from .metrics import StageMetrics, ValidationMetrics
 from .result import ReturnCodes, ValidationResult
 
 __all__ = [
@@ -29,6 +33,9 @@ __all__ = [
     # Result types
     "ReturnCodes",
     "ValidationResult",
+    # Metrics
+    "StageMetrics",
+    "ValidationMetrics",
     # Logging
     "get_logger",
     "configure_logging",
@@ -7,6 +7,7 @@ FEATURE SET:
 1. FAST_STORE - Auto-detected RDF store for performance optimization
 2. Standard namespace prefixes used across the project
 3. File extension constants for consistent pattern matching
+4. env_disabled - Opt-out check for the cache and store environment variables
 
 USAGE:
 ======
@@ -15,6 +16,10 @@ USAGE:
     # Use FAST_STORE when creating graphs
     graph = Graph(store=FAST_STORE)
 
+    # Honour ONTOLOGY_GRAPH_CACHE=0 and friends
+    if env_disabled("ONTOLOGY_GRAPH_CACHE"):
+        ...
+
 STANDALONE TESTING:
 ==================
     python3 -m src.tools.core.constants [--test]
@@ -29,6 +34,8 @@ NOTES:
 - Oxigraph provides significantly better performance for large graphs
 """
 
+import os
+
 # Try to import performance optimization
 try:
     import oxrdflib  # noqa: F401
@@ -64,6 +71,14 @@ class Namespaces:
 # Validation-related constants
 MAX_INFERENCE_ITERATIONS = 10  # Maximum iterations for RDFS inference
 
+# Environment variable values that disable an optional cache or store
+DISABLED_VALUES = ("0", "false", "no", "off")
+
+
+def env_disabled(name: str) -> bool:
+    """Check whether an opt-out environment variable disables a feature."""
+    return os.environ.get(name, "1").strip().lower() in DISABLED_VALUES
+
 
 if __name__ == "__main__":
     import argparse
@@ -78,6 +93,10 @@ if __name__ == "__main__":
         assert Extensions.TURTLE == ".ttl"
         assert ".json" in Extensions.JSONLD
         assert Namespaces.RDF.startswith("http://")
+        os.environ["ONTOLOGY_CONSTANTS_TEST"] = " Off "
+        assert env_disabled("ONTOLOGY_CONSTANTS_TEST")
+        del os.environ["ONTOLOGY_CONSTANTS_TEST"]
+        assert not env_disabled("ONTOLOGY_CONSTANTS_TEST")
         print("All tests passed!")
     else:
         print(f"FAST_STORE: {FAST_STORE}")
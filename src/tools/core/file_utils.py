@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+File Utils - Content Hashes, Stat Stamps and Atomic Writes
+
+Shared helpers of the on-disk caches (graph cache, graph store, failing test
+cache, coherence cache) and the in-memory schema caches, so that all of them
+hash files, detect changed files and write cache files the same way.
+
+FEATURE SET:
+============
+1. file_sha256 - SHA-256 of a file's content, memoized per (mtime, size)
+2. file_stamp / file_stamps - (mtime_ns, size) of files for staleness checks
+3. atomic_write - Write a file via a temp file and rename
+
+USAGE:
+======
+    from src.tools.core.file_utils import atomic_write, file_sha256, file_stamps
+
+    digest = file_sha256(Path("artifacts/gx/gx.owl.ttl"))
+
+    stamps = file_stamps(shacl_files)
+    ...
+    if file_stamps(shacl_files) != stamps:
+        ...  # reload
+
+    atomic_write(cache_file, lambda p: p.write_text(payload, encoding="utf-8"))
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.core.file_utils [--test]
+
+DEPENDENCIES:
+=============
+- hashlib, os, tempfile (stdlib)
+
+NOTES:
+======
+- file_sha256 keeps the digests of this process keyed by path, mtime and
+  size, so a file is read again only when its stat information changed.
+  This is the same trust the caches already place in (mtime, size) when
+  they skip re-hashing unchanged files.
+- Missing or unreadable files hash to None and stamp to (-1, -1).
+- atomic_write removes its temp file if writing fails, so concurrent
+  processes only ever see complete files.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# (mtime_ns, size) of a file, (-1, -1) if it cannot be stat'ed
+FileStamp = Tuple[int, int]
+
+# Digests computed in this process, keyed by (absolute path, stamp)
+_digests: Dict[Tuple[str, FileStamp], str] = {}
+
+
+def file_stamp(path: Path) -> FileStamp:
+    """Return (mtime_ns, size) of a file, or (-1, -1) if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (-1, -1)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def file_stamps(files: Iterable[Path]) -> Dict[str, FileStamp]:
+    """Return the stamp of every file, keyed by its path string."""
+    return {str(f): file_stamp(f) for f in files}
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    """
+    Return the SHA-256 hex digest of a file's content.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest, or None if the file is missing or unreadable
+    """
+    path = Path(path)
+    stamp = file_stamp(path)
+    if stamp == (-1, -1):
+        return None
+    key = (os.path.abspath(path), stamp)
+    digest = _digests.get(key)
+    if digest is not None:
+        return digest
+
+    sha = hashlib.sha256()
+    try:
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+    except OSError:
+        return None
+    digest = sha.hexdigest()
+    _digests[key] = digest
+    return digest
+
+
+def atomic_write(target: Path, writer: Callable[[Path], None]) -> None:
+    """
+    Write a file atomically by writing to a temp file and renaming it.
+
+    Args:
+        target: File to (re)place; its directory must exist
+        writer: Callable writing the content to the path it is given
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, target)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    print("Running file_utils self-tests...")
+    all_passed = True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "data.txt"
+
+        # Test 1: Atomic write leaves only the target file
+        atomic_write(path, lambda p: p.write_text("first", encoding="utf-8"))
+        if path.read_text() != "first" or len(list(Path(tmpdir).iterdir())) != 1:
+            print("FAIL: atomic_write")
+            all_passed = False
+        else:
+            print("PASS: atomic_write")
+
+        # Test 2: Digest follows content changes (new stamp)
+        first = file_sha256(path)
+        path.write_text("second, longer", encoding="utf-8")
+        second = file_sha256(path)
+        if first == second or second != hashlib.sha256(b"second, longer").hexdigest():
+            print(f"FAIL: file_sha256 - {first} {second}")
+            all_passed = False
+        else:
+            print("PASS: file_sha256")
+
+        # Test 3: Missing files
+        missing = Path(tmpdir) / "missing"
+        if file_sha256(missing) is not None or file_stamp(missing) != (-1, -1):
+            print("FAIL: Missing file")
+            all_passed = False
+        else:
+            print("PASS: Missing file")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point for file_utils."""
+    parser = argparse.ArgumentParser(description="File hashing and write helpers")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    parser.add_argument("files", nargs="*", type=Path, help="Files to hash")
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    for path in args.files:
+        print(f"{file_sha256(path) or '<unreadable>'}  {path}")
+
+
+if __name__ == "__main__":
+    main()
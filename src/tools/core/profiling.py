@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Profiling - cProfile Output per Validation Phase and Domain
+
+Wraps sections of a run (a validation phase, one domain of a phase) in
+cProfile and writes one .prof file per section, so a slow CI run can be
+profiled with a command line flag instead of patching the suite.
+
+FEATURE SET:
+============
+1. profile_section - Profile a block and dump it to <dir>/<name>.prof
+2. get_profile_dir - Profile directory configured via ONTOLOGY_PROFILE_DIR
+3. profile_name - File-system safe profile name from phase/domain parts
+4. print_profile - Show the most expensive functions of a .prof file
+
+USAGE:
+======
+    from src.tools.core.profiling import profile_name, profile_section
+
+    with profile_section(profile_name("check-data-conformance", "manifest")):
+        validate_domain("manifest")
+
+    # Inspect a profile
+    python3 -m src.tools.core.profiling profiles/check-data-conformance.manifest.prof
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.core.profiling [--test] [PROF_FILE] [--top N]
+
+DEPENDENCIES:
+=============
+- cProfile, pstats (stdlib): Deterministic profiling and reports
+
+NOTES:
+======
+- Without a profile directory (argument or ONTOLOGY_PROFILE_DIR)
+  profile_section does nothing, so call sites need no conditionals.
+- Only one cProfile profiler can be active per process. A nested section
+  pauses the enclosing one, so a phase profile holds the phase work outside
+  its domains and each domain profile holds only that domain.
+- The directory is passed via the environment so that worker processes
+  started by --jobs write their domain profiles as well.
+- .prof files work with pstats, snakeviz, and flameprof/gprof2dot for
+  flamegraphs.
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+# Environment variable naming the directory that receives .prof files
+PROFILE_DIR_ENV = "ONTOLOGY_PROFILE_DIR"
+
+# Profilers of the enclosing sections (innermost last)
+_active_profilers: List[cProfile.Profile] = []
+
+
+def get_profile_dir() -> Optional[Path]:
+    """Return the profile directory configured via ONTOLOGY_PROFILE_DIR (or None)."""
+    value = os.environ.get(PROFILE_DIR_ENV, "").strip()
+    return Path(value) if value else None
+
+
+def profile_name(*parts: str) -> str:
+    """
+    Build a file-system safe profile name from its parts.
+
+    Args:
+        *parts: Name parts, e.g. phase and domain
+
+    Returns:
+        Lowercase parts joined with "." (e.g. "check-syntax.manifest")
+    """
+    return ".".join(
+        re.sub(r"[^a-z0-9_-]+", "-", part.strip().lower()).strip("-") for part in parts
+    )
+
+
+@contextmanager
+def profile_section(
+    name: str, profile_dir: Optional[Path] = None
+) -> Iterator[Optional[Path]]:
+    """
+    Profile the enclosed block and write it to <profile_dir>/<name>.prof.
+
+    Args:
+        name: Profile name (see profile_name)
+        profile_dir: Output directory (default: ONTOLOGY_PROFILE_DIR)
+
+    Yields:
+        Path of the .prof file, or None if profiling is disabled
+    """
+    profile_dir = profile_dir or get_profile_dir()
+    if profile_dir is None:
+        yield None
+        return
+
+    profile_path = Path(profile_dir) / f"{name}.prof"
+    if _active_profilers:
+        _active_profilers[-1].disable()
+    profiler = cProfile.Profile()
+    _active_profilers.append(profiler)
+    profiler.enable()
+    try:
+        yield profile_path
+    finally:
+        profiler.disable()
+        _active_profilers.pop()
+        profile_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(profile_path))
+        if _active_profilers:
+            _active_profilers[-1].enable()
+
+
+def print_profile(
+    profile_path: Path, top: int = 25, sort: str = "cumulative", file=None
+) -> None:
+    """
+    Print the most expensive functions of a .prof file.
+
+    Args:
+        profile_path: cProfile output file
+        top: Number of functions to show
+        sort: pstats sort key (cumulative, tottime, calls, ...)
+        file: Output stream (default: stdout)
+    """
+    stats = pstats.Stats(str(profile_path), stream=file or sys.stdout)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    import io
+    import tempfile
+
+    print("Running profiling self-tests...")
+    all_passed = True
+
+    # Test 1: Nested sections write separate profiles
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out = Path(tmpdir)
+        with profile_section("phase", out):
+            with profile_section(profile_name("phase", "Domain A"), out):
+                sum(range(1000))
+        written = sorted(p.name for p in out.glob("*.prof"))
+        if written != ["phase.domain-a.prof", "phase.prof"]:
+            print(f"FAIL: Nested profiles - {written}")
+            all_passed = False
+        else:
+            print("PASS: Nested profiles")
+
+        # Test 2: Profiles are readable by pstats
+        buffer = io.StringIO()
+        print_profile(out / "phase.prof", top=5, file=buffer)
+        if "function calls" not in buffer.getvalue():
+            print("FAIL: pstats report")
+            all_passed = False
+        else:
+            print("PASS: pstats report")
+
+    # Test 3: Disabled without a directory
+    saved = os.environ.pop(PROFILE_DIR_ENV, None)
+    try:
+        with profile_section("phase") as path:
+            if path is not None:
+                print("FAIL: Profiling should be disabled")
+                all_passed = False
+            else:
+                print("PASS: Disabled without directory")
+    finally:
+        if saved is not None:
+            os.environ[PROFILE_DIR_ENV] = saved
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Show cProfile output files")
+    parser.add_argument("profile", nargs="?", type=Path, help=".prof file to show")
+    parser.add_argument(
+        "--top", type=int, default=25, help="Number of functions (default: 25)"
+    )
+    parser.add_argument(
+        "--sort",
+        default="cumulative",
+        help="pstats sort key, e.g. cumulative or tottime (default: cumulative)",
+    )
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    if not args.profile:
+        parser.print_help()
+        sys.exit(1)
+
+    print_profile(args.profile, args.top, args.sort)
+
+
+if __name__ == "__main__":
+    main()
@@ -46,6 +46,8 @@ from typing import List, Optional
 
 from rdflib import Graph
 
+from src.tools.core.metrics import ValidationMetrics
+
 
 class ReturnCodes(IntEnum):
     """
@@ -104,6 +106,7 @@ class ValidationResult:
         duration_seconds: Time taken for validation
         errors: List of specific error messages
         warnings: List of warning messages
+        metrics: Per-stage timing, memory, triple and file counts
     """
 
     conforms: bool
@@ -116,6 +119,7 @@ class ValidationResult:
     duration_seconds: float = 0.0
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    metrics: ValidationMetrics = field(default_factory=ValidationMetrics)
 
     @classmethod
     def success(
@@ -8,6 +8,10 @@ Key utilities:
 - RegistryResolver: Resolves ontology and SHACL paths from XML catalogs
 - file_collector: File discovery utilities
 - graph_loader: RDF graph loading utilities
+- graph_cache: Persistent parsed-graph cache used by graph_loader
+- graph_store: Persistent Oxigraph store with one named graph per catalog file
+- schema_index: Precomputed per-domain schema closures (docs/schema-index.json)
+- docs_model: Parsed artifact graphs shared by the documentation generators
 - print_formatter: Output formatting utilities
 
 The registry resolver is used by the SHACL validation pipeline (see
@@ -37,6 +41,7 @@ from .file_collector import (
     collect_test_files,
     collect_turtle_files,
 )
+from .graph_cache import GraphCache, get_graph_cache
 from .graph_loader import (
     FAST_STORE,
     extract_external_iris,
@@ -47,12 +52,14 @@ from .graph_loader import (
     load_jsonld_with_context,
     load_turtle_files,
 )
+from .graph_store import GraphStore, get_graph_store, read_graph
 from .print_formatter import normalize_path_for_display
-from .registry_resolver import RegistryResolver
+from .registry_resolver import RegistryResolver, get_registry_resolver
 
 __all__ = [
     # Registry
     "RegistryResolver",
+    "get_registry_resolver",
     # File collection
     "collect_files_by_extension",
     "collect_files_by_pattern",
@@ -63,6 +70,11 @@ __all__ = [
     "collect_turtle_files",
     # Graph loading
     "FAST_STORE",
+    "GraphCache",
+    "get_graph_cache",
+    "GraphStore",
+    "get_graph_store",
+    "read_graph",
     "extract_external_iris",
     "load_fixtures_for_iris",
     "load_graph",
@@ -17,13 +17,18 @@ FEATURE SET:
 
 USAGE:
 ======
+    from src.tools.utils.docs_model import DocsModel
     from src.tools.utils.class_page_generator import generate_all_class_pages
 
     generate_all_class_pages()
 
+    # Share parsed graphs with properties_updater
+    model = DocsModel()
+    generate_all_class_pages(model=model)
+
 STANDALONE TESTING:
 ==================
-    python3 -m src.tools.utils.class_page_generator [--verbose] [--domain DOMAIN]
+    python3 -m src.tools.utils.class_page_generator [--verbose] [--domain DOMAIN] [--force] [--jobs N]
 
 DEPENDENCIES:
 =============
@@ -33,23 +38,40 @@ NOTES:
 ======
 - gx domain redirects to official Gaia-X docs
 - Cross-domain references link to appropriate pages
+- Graphs are read through a DocsModel (src.tools.utils.docs_model); pass
+  the model shared with properties_updater to parse each file once
+- Generation is incremental: docs/ontologies/classes/.manifest.json records
+  an input key and the output SHA-256 of every page. A page is re-rendered
+  only when its key changed, i.e. the OWL, SHACL or context files of its
+  domain or of a domain it references, its usages index entries, the site
+  URL or this generator (or docs_model) changed. Unchanged content is not rewritten and pages that are
+  no longer generated are removed, so mkdocs serve only sees real changes.
+  Use --force to re-render every page.
+- With --jobs N the class pages to re-render are rendered in N worker
+  processes once all classes and the usages index are built. Pages are
+  collected in the worker's input order and written by the main process,
+  so the output does not depend on the number of jobs.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import re
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import quote
 
 import rdflib
 from rdflib import OWL, RDF, RDFS, URIRef
 
+from src.tools.core.file_utils import file_sha256
 from src.tools.core.logging import get_logger
+from src.tools.utils.docs_model import DocsModel
 
 logger = get_logger(__name__)
 
@@ -77,6 +99,15 @@ STANDARD_PREFIXES = {
 
 WEBVOWL_BASE_URL = "https://service.tib.eu/webvowl/#iri="
 
+# Manifest of the generated pages (a dotfile, so mkdocs does not publish it)
+MANIFEST_FILENAME = ".manifest.json"
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+# Modules whose code shapes every page (part of the generator key)
+GENERATOR_SOURCES = (Path(__file__), Path(__file__).with_name("docs_model.py"))
+
 
 def _load_site_url() -> Optional[str]:
     if not MKDOCS_YML.exists():
@@ -639,6 +670,7 @@ def render_class_page(
     usages_index: Dict[str, List[UsageInfo]],
     version_info: str,
     property_paths_by_domain: Dict[str, Set[str]],
+    source_lines: Optional[List[str]] = None,
 ) -> str:
     """
     Render a complete class documentation page.
@@ -648,6 +680,7 @@ def render_class_page(
         all_classes: All classes across domains for cross-linking
         usages_index: Reverse reference index
         property_paths_by_domain: Domain -> set of SHACL property paths
+        source_lines: Precomputed Source section (looked up in artifacts if None)
 
     Returns:
         Markdown content
@@ -771,8 +804,9 @@ def render_class_page(
         lines.append("")
 
     # Source files
-    link_prefix = f"../../../artifacts/{domain}/{version_info}"
-    source_lines = _build_source_lines(domain, link_prefix)
+    if source_lines is None:
+        link_prefix = f"../../../artifacts/{domain}/{version_info}"
+        source_lines = _build_source_lines(domain, link_prefix)
     lines.extend(["## Source", ""])
     if source_lines:
         lines.extend(source_lines)
@@ -982,22 +1016,336 @@ def generate_classes_index(all_domains: List[str]) -> str:
     return "\n".join(lines)
 
 
-def generate_all_class_pages(domains: Optional[List[str]] = None) -> None:
+def _sha256(data: bytes) -> str:
+    """Return the SHA-256 hex digest of bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _key(*parts: str) -> str:
+    """Combine key parts into a single SHA-256 hex digest."""
+    return _sha256("\n".join(parts).encode("utf-8"))
+
+
+def _generator_key() -> str:
+    """Return the key of everything that affects all pages alike."""
+    return _key(
+        str(MANIFEST_VERSION),
+        SITE_URL or "",
+        *(file_sha256(path) or "-" for path in GENERATOR_SOURCES),
+    )
+
+
+def _domain_input_hash(domain: str) -> str:
+    """
+    Hash the artifact files a domain's pages are rendered from.
+
+    Covers the names and content of all OWL, SHACL and context files of the
+    domain, i.e. every file listed in the Source and Artifacts sections.
+    """
+    domain_dir = ARTIFACTS_DIR / domain
+    parts: List[str] = []
+    for pattern in ("*.owl.ttl", "*.shacl.ttl", "*.context.jsonld"):
+        for path in sorted(domain_dir.glob(pattern)):
+            parts.append(f"{path.name}:{file_sha256(path) or '-'}")
+    return _key(*parts)
+
+
+def _referenced_domains(classes: Dict[str, ClassInfo]) -> Set[str]:
+    """Return the domains whose classes or properties a domain's pages link to."""
+    iris: Set[str] = set()
+    for class_info in classes.values():
+        iris.update(class_info.parents)
+        for prop in class_info.properties:
+            iris.add(prop.path)
+            iris.update(iri for iri in (prop.class_ref, prop.node_ref) if iri)
+    return {d for d in map(extract_domain_from_iri, iris) if d}
+
+
+def _domain_keys(
+    all_classes: Dict[str, Dict[str, ClassInfo]], generator_key: str
+) -> Dict[str, str]:
+    """
+    Compute the render key of every domain.
+
+    A domain's key covers its own inputs and those of all domains it
+    references (transitively, as ancestry paths cross domains).
+    """
+    references = {
+        domain: _referenced_domains(classes) for domain, classes in all_classes.items()
+    }
+    input_hashes: Dict[str, str] = {}
+
+    keys: Dict[str, str] = {}
+    for domain in all_classes:
+        closure = {domain}
+        stack = [domain]
+        while stack:
+            for ref in references.get(stack.pop(), ()):
+                if ref not in closure:
+                    closure.add(ref)
+                    stack.append(ref)
+
+        parts = [generator_key]
+        for ref in sorted(closure):
+            if ref not in input_hashes:
+                input_hashes[ref] = (
+                    _domain_input_hash(ref) if ref in all_classes else "-"
+                )
+            parts.append(f"{ref}:{input_hashes[ref]}")
+        keys[domain] = _key(*parts)
+    return keys
+
+
+def _usages_key(usages: Iterable[UsageInfo]) -> str:
+    """Return a key for the usages index entries of a class."""
+    return _key(
+        *sorted(
+            f"{u.source_domain} {u.source_class} {u.property_path} {u.property_name}"
+            for u in usages
+        )
+    )
+
+
+class PageWriter:
+    """
+    Incremental writer for the generated class pages.
+
+    Renders a page only when its key differs from the manifest, writes it
+    only when its content changed, and removes pages not generated in this
+    run.
+
+    Usage:
+        writer = PageWriter(CLASSES_DIR)
+        writer.page("hdmap/index.md", key, lambda: render(...))
+        writer.finish()
+    """
+
+    def __init__(self, classes_dir: Path, force: bool = False):
+        """
+        Initialize the writer from the manifest of the previous run.
+
+        Args:
+            classes_dir: Output directory of the class pages
+            force: Re-render every page regardless of its key
+        """
+        self.classes_dir = Path(classes_dir)
+        self.manifest_path = self.classes_dir / MANIFEST_FILENAME
+        self.force = force
+        self.previous = self._load_manifest()
+        self.pages: Dict[str, Dict[str, str]] = {}
+        self.rendered = 0
+        self.written = 0
+        self.removed = 0
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != MANIFEST_VERSION
+        ):
+            return {}
+        return manifest.get("pages", {})
+
+    def page(self, rel_path: str, key: str, render: Callable[[], str]) -> None:
+        """
+        Generate a page unless its key and file are unchanged.
+
+        Args:
+            rel_path: Page path relative to the classes directory
+            key: Input key of the page
+            render: Callable returning the page content
+        """
+        if self.keep_or_schedule(rel_path, key):
+            self.write(rel_path, key, render())
+
+    def keep_or_schedule(self, rel_path: str, key: str) -> bool:
+        """
+        Keep an unchanged page, or schedule it for rendering.
+
+        A page whose key and file are unchanged is recorded as generated in
+        this run (so finish() keeps it); any other page has to be rendered
+        and passed to write().
+
+        Args:
+            rel_path: Page path relative to the classes directory
+            key: Input key of the page
+
+        Returns:
+            True if the page must be rendered and passed to write()
+        """
+        previous = self.previous.get(rel_path, {})
+        if self.force or previous.get("key") != key:
+            return True
+        if not (self.classes_dir / rel_path).exists():
+            return True
+        self.pages[rel_path] = previous
+        return False
+
+    def write(self, rel_path: str, key: str, content: str) -> None:
+        """
+        Record a rendered page and write it if its content changed.
+
+        Args:
+            rel_path: Page path relative to the classes directory
+            key: Input key of the page
+            content: Rendered page content
+        """
+        path = self.classes_dir / rel_path
+        self.rendered += 1
+        digest = _sha256(content.encode("utf-8"))
+        # Without a (valid) manifest entry compare with the existing file
+        current = self.previous.get(rel_path, {}).get("sha256")
+        if not path.exists():
+            current = None
+        elif current is None:
+            current = _sha256(path.read_bytes())
+        if current != digest:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            self.written += 1
+        self.pages[rel_path] = {"key": key, "sha256": digest}
+
+    def finish(self) -> None:
+        """Remove pages not generated in this run and save the manifest."""
+        for path in sorted(self.classes_dir.rglob("*"), reverse=True):
+            rel_path = path.relative_to(self.classes_dir).as_posix()
+            if path.is_dir():
+                if not any(path.iterdir()):
+                    path.rmdir()
+            elif rel_path not in self.pages and path != self.manifest_path:
+                path.unlink()
+                self.removed += 1
+
+        manifest = {"version": MANIFEST_VERSION, "pages": self.pages}
+        self.manifest_path.write_text(
+            json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+        )
+        logger.info(
+            "Class pages: %d rendered, %d written, %d unchanged, %d removed",
+            self.rendered,
+            self.written,
+            len(self.pages) - self.rendered,
+            self.removed,
+        )
+
+
+# Rendering context of a worker process (set by _init_render_worker)
+_render_context: Optional[Tuple] = None
+
+
+def _init_render_worker(*context) -> None:
+    """Store the rendering context in a worker process."""
+    global _render_context
+    _render_context = context
+
+
+def _render_job(
+    job: Tuple[str, str],
+    all_classes: Dict[str, Dict[str, ClassInfo]],
+    usages_index: Dict[str, List[UsageInfo]],
+    domain_versions: Dict[str, str],
+    property_paths_by_domain: Dict[str, Set[str]],
+    source_lines_by_domain: Dict[str, List[str]],
+) -> str:
+    """Render the page of a (domain, class IRI) job."""
+    domain, class_iri = job
+    return render_class_page(
+        all_classes[domain][class_iri],
+        all_classes,
+        usages_index,
+        domain_versions.get(domain, "unknown"),
+        property_paths_by_domain,
+        source_lines_by_domain[domain],
+    )
+
+
+def _render_class_page_job(job: Tuple[str, str]) -> str:
+    """Render the page of a job from the worker's rendering context."""
+    return _render_job(job, *_render_context)
+
+
+def render_class_pages(
+    pages: List[Tuple[str, str]],
+    all_classes: Dict[str, Dict[str, ClassInfo]],
+    usages_index: Dict[str, List[UsageInfo]],
+    domain_versions: Dict[str, str],
+    property_paths_by_domain: Dict[str, Set[str]],
+    jobs: int = 1,
+) -> List[str]:
+    """
+    Render class pages, optionally in worker processes.
+
+    Args:
+        pages: (domain, class IRI) of the pages to render
+        all_classes: All classes across domains for cross-linking
+        usages_index: Reverse reference index
+        domain_versions: Domain -> version info
+        property_paths_by_domain: Domain -> set of SHACL property paths
+        jobs: Number of worker processes (1 renders in-process, 0 one per CPU)
+
+    Returns:
+        Page contents in the order of pages
+    """
+    # Look up the artifact files once per domain, not in every page (worker)
+    source_lines_by_domain = {
+        domain: _build_source_lines(
+            domain,
+            f"../../../artifacts/{domain}/{domain_versions.get(domain, 'unknown')}",
+        )
+        for domain in {domain for domain, _ in pages}
+    }
+    context = (
+        all_classes,
+        usages_index,
+        domain_versions,
+        property_paths_by_domain,
+        source_lines_by_domain,
+    )
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or len(pages) <= 1:
+        return [_render_job(job, *context) for job in pages]
+
+    # The context is sent once per worker instead of once per page
+    workers = min(jobs, len(pages))
+    chunksize = max(1, len(pages) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_render_worker, initargs=context
+    ) as executor:
+        return list(executor.map(_render_class_page_job, pages, chunksize=chunksize))
+
+
+def generate_all_class_pages(
+    domains: Optional[List[str]] = None,
+    model: Optional[DocsModel] = None,
+    force: bool = False,
+    jobs: int = 1,
+) -> Optional[PageWriter]:
     """
     Generate class pages for all (or specified) domains.
 
     Args:
         domains: Optional list of domains to process. If None, process all.
+        model: Shared docs model (a new one is created if None)
+        force: Re-render every page instead of only the changed ones
+        jobs: Worker processes for rendering class pages (0: one per CPU)
+
+    Returns:
+        PageWriter with the counts of this run (None without artifacts)
     """
     if not ARTIFACTS_DIR.exists():
         logger.error("Artifacts directory not found: %s", ARTIFACTS_DIR)
-        return
+        return None
+
+    model = model or DocsModel(ARTIFACTS_DIR)
 
     # Discover domains
     available_domains = []
-    for domain_dir in sorted(ARTIFACTS_DIR.iterdir()):
-        if not domain_dir.is_dir():
-            continue
+    for domain_dir in model.domain_dirs():
         owl_file = domain_dir / f"{domain_dir.name}.owl.ttl"
         if owl_file.exists():
             available_domains.append(domain_dir.name)
@@ -1024,13 +1372,13 @@ def generate_all_class_pages(domains: Optional[List[str]] = None) -> None:
             continue
 
         # Parse and extract
-        owl_graph = parse_owl_file(owl_file)
+        owl_graph = model.graph(owl_file)
         version_info = _extract_version_info(owl_graph)
         domain_versions[domain] = version_info
         classes = extract_classes(owl_graph, domain)
 
         if shacl_file.exists():
-            shacl_graph = parse_shacl_file(shacl_file)
+            shacl_graph = model.graph(shacl_file)
             extract_properties(shacl_graph, classes)
 
         all_classes[domain] = classes
@@ -1047,47 +1395,58 @@ def generate_all_class_pages(domains: Optional[List[str]] = None) -> None:
         apply_inherited_properties(classes)
 
     # Create output directory
-    if CLASSES_DIR.exists():
-        shutil.rmtree(CLASSES_DIR)
     CLASSES_DIR.mkdir(parents=True, exist_ok=True)
+    writer = PageWriter(CLASSES_DIR, force=force)
+    generator_key = _generator_key()
+    domain_keys = _domain_keys(all_classes, generator_key)
 
     # Generate pages for each domain
     all_domain_names = list(all_classes.keys()) + list(EXTERNAL_DOMAINS.keys())
 
+    pending: List[Tuple[str, str, str, str]] = []
     for domain, classes in all_classes.items():
-        domain_dir = CLASSES_DIR / domain
-        domain_dir.mkdir(exist_ok=True)
+        version_info = domain_versions.get(domain, "unknown")
+        domain_key = domain_keys[domain]
 
         # Generate index
-        index_content = generate_domain_index(
-            domain, classes, domain_versions.get(domain, "unknown")
+        writer.page(
+            f"{domain}/index.md",
+            domain_key,
+            lambda: generate_domain_index(domain, classes, version_info),
         )
-        (domain_dir / "index.md").write_text(index_content)
 
-        # Generate class pages
-        for class_iri, class_info in classes.items():
+        # Collect the class pages to render
+        for class_iri in classes:
             class_name = local_name(class_iri)
-            filename = f"{safe_filename(class_name)}.md"
-            content = render_class_page(
-                class_info,
-                all_classes,
-                usages_index,
-                domain_versions.get(domain, "unknown"),
-                property_paths_by_domain,
-            )
-            (domain_dir / filename).write_text(content)
-
-        logger.info("Generated %d class pages for %s", len(classes), domain)
+            rel_path = f"{domain}/{safe_filename(class_name)}.md"
+            key = _key(domain_key, _usages_key(usages_index.get(class_iri, [])))
+            if writer.keep_or_schedule(rel_path, key):
+                pending.append((rel_path, key, domain, class_iri))
+
+    # Render class pages (possibly in parallel) and write them in order
+    contents = render_class_pages(
+        [(domain, class_iri) for _, _, domain, class_iri in pending],
+        all_classes,
+        usages_index,
+        domain_versions,
+        property_paths_by_domain,
+        jobs,
+    )
+    for (rel_path, key, _, _), content in zip(pending, contents):
+        writer.write(rel_path, key, content)
 
     # Generate gx redirect
-    gx_dir = CLASSES_DIR / "gx"
-    gx_dir.mkdir(exist_ok=True)
-    (gx_dir / "index.md").write_text(generate_gx_redirect_page())
-    logger.info("Generated gx redirect page")
+    writer.page("gx/index.md", generator_key, generate_gx_redirect_page)
 
     # Generate main index
-    (CLASSES_DIR / "index.md").write_text(generate_classes_index(all_domain_names))
-    logger.info("Generated classes index")
+    writer.page(
+        "index.md",
+        _key(generator_key, *sorted(all_domain_names)),
+        lambda: generate_classes_index(all_domain_names),
+    )
+
+    writer.finish()
+    return writer
 
 
 def main():
@@ -1103,6 +1462,19 @@ def main():
         nargs="+",
         help="Specific domains to process (default: all)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render all pages, ignoring the manifest",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Render class pages in N worker processes (0: one per CPU)",
+    )
 
     args = parser.parse_args()
 
@@ -1111,7 +1483,7 @@ def main():
 
         logging.getLogger().setLevel(logging.DEBUG)
 
-    generate_all_class_pages(args.domain)
+    generate_all_class_pages(args.domain, force=args.force, jobs=args.jobs)
     print("Class page generation complete!")
 
 
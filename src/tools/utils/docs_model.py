@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Docs Model - Shared Artifact Graphs for the Documentation Generators
+
+Holds the parsed OWL and SHACL graphs of the artifact domains for one
+documentation build. properties_updater and class_page_generator read
+their classes, properties, hierarchy and usages from the same model, so
+each artifact file is parsed once per build instead of once per generator.
+
+FEATURE SET:
+============
+1. DocsModel - Parse-once access to the artifact graphs of a build
+2. generate_docs - Run both documentation generators in one process
+
+USAGE:
+======
+    from src.tools.utils.docs_model import DocsModel, generate_docs
+
+    # Run both generators (done by hooks/copy_artifacts.py)
+    generate_docs()
+
+    # Share a model between generator calls
+    model = DocsModel()
+    owl_graph = model.graph(Path("artifacts/hdmap/hdmap.owl.ttl"))
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.utils.docs_model [--test] [--verbose] [--jobs N]
+
+    # Parallel class page rendering in mkdocs builds
+    ONTOLOGY_DOCS_JOBS=4 mkdocs build
+
+DEPENDENCIES:
+=============
+- rdflib: RDF graph handling
+
+NOTES:
+======
+- Graphs are parsed into default-store graphs, exactly as the generators
+  did before, so the generated pages do not change (their order follows
+  the parser's triple order).
+- Graphs are read-only for the generators; a model is meant to live for a
+  single build. Create a new one when the artifacts may have changed
+  (e.g. on every mkdocs serve rebuild).
+- Class pages are rendered in-process by default: the current catalog
+  renders in about 0.1s, less than starting worker processes costs. Render
+  time grows with the number of pages and their usages, so forced rebuilds
+  of larger catalogs can opt in with --jobs or, for the mkdocs hook,
+  ONTOLOGY_DOCS_JOBS (0: one worker per CPU).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import rdflib
+
+from src.tools.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ROOT_DIR = Path(__file__).parent.parent.parent.parent.resolve()
+ARTIFACTS_DIR = ROOT_DIR / "artifacts"
+
+# Environment variable setting the class page render jobs of generate_docs()
+DOCS_JOBS_ENV = "ONTOLOGY_DOCS_JOBS"
+
+
+class DocsModel:
+    """
+    Parsed artifact graphs shared by the documentation generators.
+
+    Usage:
+        model = DocsModel()
+        generate_properties_docs(model)
+        generate_all_class_pages(model=model)
+    """
+
+    def __init__(self, artifacts_dir: Path = ARTIFACTS_DIR):
+        """
+        Initialize an empty model.
+
+        Args:
+            artifacts_dir: Directory holding the artifact domains
+        """
+        self.artifacts_dir = Path(artifacts_dir)
+        self._graphs: Dict[Path, rdflib.Graph] = {}
+        self.parses = 0
+
+    def graph(self, path: Path, fmt: str = "turtle") -> rdflib.Graph:
+        """
+        Return the parsed graph of an RDF file (parsed on first access).
+
+        Args:
+            path: RDF file path
+            fmt: RDFLib format string
+
+        Returns:
+            Parsed graph (shared, do not modify)
+        """
+        key = Path(path).resolve()
+        graph = self._graphs.get(key)
+        if graph is None:
+            graph = rdflib.Graph()
+            graph.parse(str(path), format=fmt)
+            self._graphs[key] = graph
+            self.parses += 1
+        return graph
+
+    def domain_dirs(self) -> List[Path]:
+        """Return the artifact domain directories, sorted by name."""
+        if not self.artifacts_dir.exists():
+            return []
+        return sorted(d for d in self.artifacts_dir.iterdir() if d.is_dir())
+
+
+def get_docs_jobs() -> int:
+    """Return the class page render jobs set in ONTOLOGY_DOCS_JOBS (default 1)."""
+    value = os.environ.get(DOCS_JOBS_ENV, "").strip()
+    if not value:
+        return 1
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        logger.warning("Ignoring invalid %s=%r", DOCS_JOBS_ENV, value)
+        return 1
+    return jobs
+
+
+def generate_docs(
+    domains: Optional[List[str]] = None, jobs: Optional[int] = None
+) -> DocsModel:
+    """
+    Run properties_updater and class_page_generator on one shared model.
+
+    Args:
+        domains: Optional domains for the class pages (default: all)
+        jobs: Worker processes for rendering class pages (0: one per CPU,
+            default: ONTOLOGY_DOCS_JOBS or 1)
+
+    Returns:
+        The model the generators read from
+    """
+    # Imported here: both generators import DocsModel from this module
+    from src.tools.utils import class_page_generator, properties_updater
+
+    if jobs is None:
+        jobs = get_docs_jobs()
+
+    model = DocsModel()
+    properties_updater.generate_all(model)
+    class_page_generator.generate_all_class_pages(domains, model=model, jobs=jobs)
+    logger.info("Parsed %d artifact files for the documentation", model.parses)
+    return model
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    print("Running docs_model self-tests...")
+    all_passed = True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        domain_dir = Path(tmpdir) / "demo"
+        domain_dir.mkdir()
+        owl_file = domain_dir / "demo.owl.ttl"
+        owl_file.write_text(
+            "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            "@prefix ex: <http://example.org/> .\n"
+            "ex:Thing a owl:Class .\n",
+            encoding="utf-8",
+        )
+
+        model = DocsModel(Path(tmpdir))
+        first = model.graph(owl_file)
+        second = model.graph(domain_dir / ".." / "demo" / "demo.owl.ttl")
+        if first is not second or model.parses != 1 or len(first) != 1:
+            print("FAIL: graph is parsed once per file")
+            all_passed = False
+        else:
+            print("PASS: graph is parsed once per file")
+
+        if model.domain_dirs() != [domain_dir]:
+            print(f"FAIL: domain_dirs - got {model.domain_dirs()}")
+            all_passed = False
+        else:
+            print("PASS: domain_dirs")
+
+    previous = os.environ.get(DOCS_JOBS_ENV)
+    try:
+        results = []
+        for value in ("", "4", "0", "many", "-2"):
+            os.environ[DOCS_JOBS_ENV] = value
+            results.append(get_docs_jobs())
+    finally:
+        if previous is None:
+            os.environ.pop(DOCS_JOBS_ENV, None)
+        else:
+            os.environ[DOCS_JOBS_ENV] = previous
+    if results != [1, 4, 0, 1, 1]:
+        print(f"FAIL: get_docs_jobs - got {results}")
+        all_passed = False
+    else:
+        print("PASS: get_docs_jobs")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate PROPERTIES.md files and class pages in one pass"
+    )
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Render class pages in N worker processes "
+            f"(0: one per CPU, default: {DOCS_JOBS_ENV} or 1)"
+        ),
+    )
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    if args.verbose:
+        logger.setLevel("DEBUG")
+
+    model = generate_docs(jobs=args.jobs)
+    print(f"Documentation generated ({model.parses} artifact files parsed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Graph Cache - Persistent Parsed-Graph Cache for RDF Artifacts
+
+Stores a canonical N-Triples serialization of every parsed artifact on disk so
+that unchanged ontology and SHACL files do not have to go through rdflib's
+Turtle parser on every run.
+
+FEATURE SET:
+============
+1. GraphCache - On-disk cache of parsed RDF files keyed by path and content
+2. get_graph_cache - Return the cache for a repository root (or None if disabled)
+3. GRAPH_CACHE_DIRNAME - Default cache directory name below the repository root
+
+USAGE:
+======
+    from src.tools.utils.graph_cache import GraphCache, get_graph_cache
+
+    cache = get_graph_cache(root_dir)
+    graph = Graph(store=FAST_STORE)
+    cache.parse_into(graph, Path("artifacts/gx/gx.owl.ttl"))
+
+    # Explicit cache location
+    cache = GraphCache(Path("/tmp/graph-cache"))
+    cache.clear()
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.utils.graph_cache [--test] [--clear] [--root DIR]
+
+DEPENDENCIES:
+=============
+- rdflib: For RDF parsing and N-Triples serialization
+- oxrdflib (optional): Native N-Triples parser for fast cache hits
+
+NOTES:
+======
+- Cache entries are validated by file path, mtime and size first; when the
+  stat information changed, the content hash decides whether the entry is
+  still valid (e.g. after a fresh git checkout).
+- Source files are always parsed by rdflib on a cache miss, so the cached
+  triples are exactly what the uncached loader would have produced.
+- Cache hits are parsed with Oxigraph's native N-Triples parser when the
+  target graph uses the Oxigraph store; this is where the speedup comes from.
+  Default-store graphs keep rdflib's N-Triples parser so that plain literals
+  are not turned into explicit xsd:string literals.
+- Prefix bindings declared by a source file are stored in its metadata and
+  re-bound on cache hits; report output relies on them for compact names.
+- Set ONTOLOGY_GRAPH_CACHE=0 to disable the cache (e.g. for debugging).
+- Writes are atomic (temp file + rename), so concurrent processes are safe.
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from rdflib import Graph
+
+from src.tools.core.constants import env_disabled
+from src.tools.core.file_utils import atomic_write, file_sha256, file_stamp
+from src.tools.core.logging import get_logger
+
+# Try to import the Oxigraph store for native payload parsing
+try:
+    from oxrdflib.store import OxigraphStore
+except ImportError:
+    OxigraphStore = None
+
+# Module logger
+logger = get_logger(__name__)
+
+# Default cache directory (relative to repository root)
+GRAPH_CACHE_DIRNAME = ".graph_cache"
+
+# Environment variable to disable the cache ("0", "false", "no", "off")
+GRAPH_CACHE_ENV = "ONTOLOGY_GRAPH_CACHE"
+
+# Bump when the payload layout or serialization changes
+CACHE_FORMAT_VERSION = 3
+
+
+def _is_oxigraph(graph: Graph) -> bool:
+    """Check whether a graph is backed by the Oxigraph store."""
+    return OxigraphStore is not None and isinstance(graph.store, OxigraphStore)
+
+
+def _payload_format(graph: Graph) -> str:
+    """Return the N-Triples parser/serializer plugin matching a graph's store."""
+    return "ox-nt" if _is_oxigraph(graph) else "nt"
+
+
+def _declared_namespaces(graph: Graph) -> List[List[str]]:
+    """Return the prefix bindings a parser added on top of the store defaults."""
+    fresh = Graph(store="oxigraph") if _is_oxigraph(graph) else Graph()
+    defaults = {(prefix, str(ns)) for prefix, ns in fresh.namespaces()}
+    return [
+        [prefix, str(ns)]
+        for prefix, ns in graph.namespaces()
+        if (prefix, str(ns)) not in defaults
+    ]
+
+
+class GraphCache:
+    """
+    Persistent cache of parsed RDF files stored as N-Triples.
+
+    Each source file gets a small metadata record (keyed by its absolute
+    path) that points to a payload file named after the source and its
+    content hash.
+
+    Usage:
+        cache = GraphCache(root_dir / ".graph_cache")
+        cache.parse_into(graph, Path("artifacts/gx/gx.shacl.ttl"))
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the graph cache.
+
+        Args:
+            cache_dir: Directory holding cache metadata and payloads
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def _source_key(self, source: Path) -> str:
+        return hashlib.sha256(str(source).encode("utf-8")).hexdigest()[:32]
+
+    def _meta_path(self, source: Path) -> Path:
+        return self.cache_dir / f"{self._source_key(source)}.json"
+
+    def _payload_path(self, source: Path, content_hash: str) -> Path:
+        # Per source, so that dropping a stale payload never affects another
+        # source that happens to have the same content
+        return self.cache_dir / f"{self._source_key(source)}-{content_hash}.nt"
+
+    def _read_meta(self, source: Path) -> Optional[Dict]:
+        meta_path = self._meta_path(source)
+        if not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        return meta
+
+    def _write_meta(self, source: Path, meta: Dict) -> None:
+        atomic_write(
+            self._meta_path(source),
+            lambda p: p.write_text(json.dumps(meta, indent=2), encoding="utf-8"),
+        )
+
+    def _valid_meta(self, source: Path) -> Optional[Dict]:
+        """Return the metadata of a source file if its cache entry is valid."""
+        meta = self._read_meta(source)
+        if meta is None:
+            return None
+
+        if not self._payload_path(source, meta.get("sha256", "")).exists():
+            return None
+
+        mtime_ns, size = file_stamp(source)
+        if (mtime_ns, size) == (meta.get("mtime_ns"), meta.get("size")):
+            return meta
+
+        # Stat changed (touch, checkout): fall back to the content hash
+        if file_sha256(source) != meta.get("sha256"):
+            return None
+
+        meta["mtime_ns"] = mtime_ns
+        meta["size"] = size
+        try:
+            self._write_meta(source, meta)
+        except OSError as e:
+            logger.debug("Could not refresh cache metadata for %s: %s", source, e)
+        return meta
+
+    def lookup(self, source: Path) -> Optional[Path]:
+        """
+        Return the cached payload for a source file if it is still valid.
+
+        Args:
+            source: Path to the RDF source file
+
+        Returns:
+            Path to the cached N-Triples payload, or None on a cache miss
+        """
+        source = Path(source).resolve()
+        meta = self._valid_meta(source)
+        if meta is None:
+            return None
+        return self._payload_path(source, meta["sha256"])
+
+    def store(self, source: Path, graph: Graph) -> Path:
+        """
+        Serialize a parsed graph for a source file into the cache.
+
+        Prefix bindings declared by the source file are kept in the metadata,
+        since N-Triples payloads cannot carry them.
+
+        Args:
+            source: Path to the RDF source file the graph was parsed from
+            graph: Graph containing exactly the triples of the source file
+
+        Returns:
+            Path to the written N-Triples payload
+        """
+        source = Path(source).resolve()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        mtime_ns, size = file_stamp(source)
+        content_hash = file_sha256(source)
+        if content_hash is None:
+            raise OSError(f"Cannot read {source}")
+        payload = self._payload_path(source, content_hash)
+
+        if not payload.exists():
+            atomic_write(
+                payload,
+                lambda p: graph.serialize(
+                    destination=str(p),
+                    format=_payload_format(graph),
+                    encoding="utf-8",
+                ),
+            )
+
+        old_meta = self._read_meta(source)
+        self._write_meta(
+            source,
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "source": source.as_posix(),
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "sha256": content_hash,
+                "triples": len(graph),
+                "namespaces": _declared_namespaces(graph),
+            },
+        )
+
+        # Drop the payload of the previous content revision
+        if old_meta and old_meta.get("sha256") not in (None, content_hash):
+            stale = self._payload_path(source, old_meta["sha256"])
+            if stale.exists():
+                stale.unlink()
+
+        return payload
+
+    def parse_into(self, graph: Graph, source: Path, format: str = "turtle") -> None:
+        """
+        Parse a source file into a graph, using the cache when possible.
+
+        On a miss, the file is parsed with rdflib (same semantics as an
+        uncached load), written to the cache and then loaded from there.
+
+        Args:
+            graph: Target graph to add the triples to
+            source: Path to the RDF source file
+            format: rdflib format name of the source file
+
+        Raises:
+            Exception: Any parser error raised by rdflib for the source file
+        """
+        source = Path(source).resolve()
+
+        meta = self._valid_meta(source)
+        if meta is not None:
+            self.hits += 1
+            payload = self._payload_path(source, meta["sha256"])
+            graph.parse(str(payload), format=_payload_format(graph))
+            namespaces = meta.get("namespaces", [])
+        else:
+            self.misses += 1
+            parsed = Graph(store="oxigraph") if _is_oxigraph(graph) else Graph()
+            parsed.parse(str(source), format=format)
+            namespaces = _declared_namespaces(parsed)
+
+            try:
+                payload = self.store(source, parsed)
+                graph.parse(str(payload), format=_payload_format(graph))
+            except OSError as e:
+                logger.debug("Could not write graph cache for %s: %s", source, e)
+                graph += parsed
+
+        # Restore the prefixes the source file declared (as rdflib's parser does)
+        for prefix, namespace in namespaces:
+            graph.bind(prefix, namespace)
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+
+def get_graph_cache(root_dir: Path) -> Optional[GraphCache]:
+    """
+    Return the graph cache for a repository root.
+
+    Args:
+        root_dir: Repository root directory
+
+    Returns:
+        GraphCache below root_dir, or None if disabled via ONTOLOGY_GRAPH_CACHE
+    """
+    if env_disabled(GRAPH_CACHE_ENV):
+        return None
+    return GraphCache(Path(root_dir) / GRAPH_CACHE_DIRNAME)
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    print("Running graph_cache self-tests...")
+    all_passed = True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        ttl_file = tmppath / "test.ttl"
+        ttl_file.write_text(
+            """@prefix ex: <http://example.org/> .
+ex:subject a ex:Thing ;
+    ex:label "Subject" .
+"""
+        )
+        cache = GraphCache(tmppath / "cache")
+
+        # Test 1: Cold load parses source and fills the cache
+        graph = Graph()
+        cache.parse_into(graph, ttl_file)
+        if len(graph) != 2 or cache.misses != 1:
+            print(f"FAIL: Cold load - {len(graph)} triples, {cache.misses} misses")
+            all_passed = False
+        else:
+            print("PASS: Cold load populates cache")
+
+        # Test 2: Warm load is served from the cache
+        graph = Graph()
+        cache.parse_into(graph, ttl_file)
+        if len(graph) != 2 or cache.hits != 1:
+            print(f"FAIL: Warm load - {len(graph)} triples, {cache.hits} hits")
+            all_passed = False
+        else:
+            print("PASS: Warm load uses cache")
+
+        # Test 3: Content change invalidates the entry
+        ttl_file.write_text(
+            """@prefix ex: <http://example.org/> .
+ex:subject a ex:Thing .
+"""
+        )
+        if cache.lookup(ttl_file) is not None:
+            print("FAIL: Changed file should invalidate cache entry")
+            all_passed = False
+        else:
+            print("PASS: Content change invalidates cache")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point for graph_cache."""
+    parser = argparse.ArgumentParser(description="Manage the parsed-graph cache")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    parser.add_argument("--clear", action="store_true", help="Remove all entries")
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=Path.cwd(),
+        help="Repository root directory (default: current directory)",
+    )
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    cache = GraphCache(args.root / GRAPH_CACHE_DIRNAME)
+
+    if args.clear:
+        cache.clear()
+        print(f"Cleared graph cache: {GRAPH_CACHE_DIRNAME}")
+        return
+
+    entries = list(cache.cache_dir.glob("*.json")) if cache.cache_dir.exists() else []
+    print(f"Graph cache: {GRAPH_CACHE_DIRNAME} ({len(entries)} entries)")
+
+
+if __name__ == "__main__":
+    main()
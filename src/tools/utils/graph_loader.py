@@ -6,11 +6,12 @@ FEATURE SET:
 ============
 1. load_graph - Load single file into graph with auto-format detection
 2. load_graphs - Load multiple files into combined graph
-3. load_jsonld_files - Load JSON-LD files with prefix extraction
+3. load_jsonld_files - Load JSON-LD files with prefix extraction (single read)
 4. load_turtle_files - Load Turtle files into graph
 5. load_jsonld_with_context - Load JSON-LD with prefix extraction
 6. load_fixtures_for_iris - Resolve and load fixture files for external IRIs
 7. extract_external_iris - Find did:web: style references in graph
+8. Transparent parsed-graph cache for Turtle artifacts (see graph_cache)
 
 USAGE:
 ======
@@ -42,6 +43,9 @@ NOTES:
 ======
 - FAST_STORE is imported from core.constants
 - This module consolidates all graph loading logic
+- load_turtle_files serves unchanged artifacts from the on-disk graph cache
+- JSON-LD files are read once; prefixes come from the same parsed document
+  and large top-level @graph arrays are converted to RDF in slices
 - All other modules should delegate graph loading here
 """
 
@@ -49,14 +53,16 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
 import rdflib
-from rdflib import Graph
+from rdflib import ConjunctiveGraph, Graph
+from rdflib.plugins.parsers.jsonld import to_rdf
 
 from src.tools.core.constants import FAST_STORE
 from src.tools.core.iri_utils import is_did_web
 from src.tools.core.logging import get_logger
+from src.tools.utils.graph_cache import get_graph_cache
 from src.tools.utils.print_formatter import normalize_path_for_display
 
 # Module logger
@@ -74,6 +80,9 @@ __all__ = [
     "extract_external_iris",
 ]
 
+# Top-level @graph arrays are converted to RDF in slices of this many nodes
+JSONLD_GRAPH_CHUNK_SIZE = 1000
+
 
 def load_graph(
     file_path: Path,
@@ -171,16 +180,9 @@ def load_jsonld_files(
     for json_file in files:
         rel_path = normalize_path_for_display(json_file, root_dir)
 
-        # Extract prefixes from @context
+        # Parse into graph; prefixes come from the same parsed document
         try:
-            file_prefixes = _extract_prefixes_from_jsonld(json_file)
-            prefixes.update(file_prefixes)
-        except Exception as e:
-            logger.debug("Could not extract prefixes from %s: %s", rel_path, e)
-
-        # Parse into graph
-        try:
-            graph.parse(str(json_file), format="json-ld")
+            prefixes.update(_parse_jsonld_file(graph, Path(json_file)))
         except Exception as e:
             logger.error("Failed to load %s: %s", rel_path, e)
             raise
@@ -192,14 +194,19 @@ def load_turtle_files(
     files: List[Path],
     root_dir: Path,
     store: str = None,
+    use_cache: bool = True,
 ) -> Graph:
     """
     Load Turtle files into a graph.
 
+    Unchanged files are served from the parsed-graph cache below root_dir
+    (see graph_cache), which avoids re-parsing large artifacts such as gx.
+
     Args:
         files: List of Turtle file paths to load
         root_dir: Repository root directory for path normalization
         store: RDF store to use (default: auto-detect oxigraph)
+        use_cache: Whether to use the on-disk parsed-graph cache
 
     Returns:
         Graph containing all loaded triples
@@ -208,12 +215,16 @@ def load_turtle_files(
         store = FAST_STORE
 
     graph = Graph(store=store)
+    cache = get_graph_cache(root_dir) if use_cache else None
 
     for ttl_file in files:
         rel_path = normalize_path_for_display(ttl_file, root_dir)
 
         try:
-            graph.parse(str(ttl_file), format="turtle")
+            if cache is not None:
+                cache.parse_into(graph, Path(ttl_file), format="turtle")
+            else:
+                graph.parse(str(ttl_file), format="turtle")
         except Exception as e:
             logger.warning("Could not load %s: %s", rel_path, e)
 
@@ -231,9 +242,7 @@ def load_jsonld_with_context(file_path: Path) -> Tuple[Graph, Dict[str, str]]:
         Tuple of (graph, prefixes) where prefixes is dict of prefix->namespace
     """
     graph = Graph(store=FAST_STORE)
-    graph.parse(str(file_path), format="json-ld")
-
-    prefixes = _extract_prefixes_from_jsonld(file_path)
+    prefixes = _parse_jsonld_file(graph, Path(file_path))
 
     return graph, prefixes
 
@@ -277,7 +286,7 @@ def load_fixtures_for_iris(
             continue
 
         try:
-            graph.parse(str(abs_path), format="json-ld")
+            _parse_jsonld_file(graph, abs_path)
             rel_path = normalize_path_for_display(abs_path, root_dir)
             logger.debug("Loaded fixture: %s for %s", rel_path, iri)
             fixtures_loaded += 1
@@ -287,6 +296,61 @@ def load_fixtures_for_iris(
     return fixtures_loaded
 
 
+def _parse_jsonld_file(graph: Graph, file_path: Path) -> Dict[str, str]:
+    """
+    Read a JSON-LD file once, add its triples to graph and return its prefixes.
+
+    Equivalent to graph.parse(file_path, format="json-ld") followed by
+    _extract_prefixes_from_jsonld(), without reading the file twice.
+
+    Args:
+        graph: Graph receiving the triples
+        file_path: Path to JSON-LD file
+
+    Returns:
+        Dictionary of prefix -> namespace URI mappings
+    """
+    with file_path.open("r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # Same base IRI and sink setup as rdflib's JSON-LD parser plugin
+    base = file_path.absolute().as_uri()
+    sink = graph
+    if not graph.context_aware:
+        sink = ConjunctiveGraph(store=graph.store, identifier=graph.identifier)
+
+    for chunk in _iter_jsonld_chunks(data):
+        to_rdf(chunk, sink, base, None, 1.1)
+
+    context = data.get("@context", {}) if isinstance(data, dict) else {}
+    return _prefixes_from_context(context)
+
+
+def _iter_jsonld_chunks(data: Any) -> Iterator[Any]:
+    """
+    Split a JSON-LD document into independently convertible parts.
+
+    A document that only consists of @context and a large top-level @graph
+    array is yielded as several documents sharing the context, each holding
+    a slice of the array. This keeps rdflib's per-conversion state small.
+    Any other document is yielded unchanged.
+    """
+    nodes = data.get("@graph") if isinstance(data, dict) else None
+    if (
+        not isinstance(nodes, list)
+        or len(nodes) <= JSONLD_GRAPH_CHUNK_SIZE
+        or not set(data) <= {"@context", "@graph"}
+    ):
+        yield data
+        return
+
+    for start in range(0, len(nodes), JSONLD_GRAPH_CHUNK_SIZE):
+        chunk = {"@graph": nodes[start : start + JSONLD_GRAPH_CHUNK_SIZE]}
+        if "@context" in data:
+            chunk["@context"] = data["@context"]
+        yield chunk
+
+
 def _extract_prefixes_from_jsonld(file_path: Path) -> Dict[str, str]:
     """
     Extract prefix mappings from a JSON-LD @context.
@@ -300,7 +364,19 @@ def _extract_prefixes_from_jsonld(file_path: Path) -> Dict[str, str]:
     with file_path.open("r", encoding="utf-8") as f:
         data = json.load(f)
 
-    context = data.get("@context", {})
+    return _prefixes_from_context(data.get("@context", {}))
+
+
+def _prefixes_from_context(context: Any) -> Dict[str, str]:
+    """
+    Collect prefix mappings (terms mapped to IRIs ending in # or /).
+
+    Args:
+        context: Value of a JSON-LD @context (dict, list or IRI string)
+
+    Returns:
+        Dictionary of prefix -> namespace URI mappings
+    """
     prefixes = {}
 
     if isinstance(context, dict):
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Graph Store - Persistent Oxigraph Store of the Artifact Corpus
+
+Loads every ontology and SHACL file listed in the artifacts and imports
+catalogs into an on-disk pyoxigraph (RocksDB) store, one named graph per
+file. Tools open the store read-only and get a graph view per file instead
+of parsing the Turtle source again.
+
+FEATURE SET:
+============
+1. build_graph_store - (Re)build the store when catalog files changed
+2. GraphStore - Read-only access to the per-file named graphs
+3. read_graph - Graph of a file from the store, parsed as fallback
+4. get_graph_store - Shared read-only store of a repository root
+
+USAGE:
+======
+    from src.tools.utils.graph_store import build_graph_store, read_graph
+    from src.tools.utils.registry_resolver import RegistryResolver
+
+    # Build (done by registry_updater)
+    build_graph_store(RegistryResolver(root_dir))
+
+    # Read a file (store view if current, parsed otherwise)
+    graph = read_graph(Path("artifacts/gx/gx.owl.ttl"), root_dir)
+    classes = set(graph.subjects(RDF.type, OWL.Class))
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.utils.graph_store [--test] [--build] [--root DIR]
+
+DEPENDENCIES:
+=============
+- pyoxigraph (optional, installed with oxrdflib): On-disk RDF store
+- oxrdflib (optional): rdflib Store wrapper for the graph views
+- rdflib: Fallback parsing (into FAST_STORE graphs)
+
+NOTES:
+======
+- The store lives in .graph_store/ below the repository root; manifest.json
+  records path, mtime, size, SHA-256, triple count and prefixes per file.
+- A file is served from the store only while its mtime and size (or, after
+  a checkout, its content hash) match the manifest; otherwise read_graph
+  parses it, so a stale store never changes results.
+- Graph views are read-only (RocksDB is opened read-only). Callers that
+  modify the graph must copy it first: graph = Graph(); graph += view.
+- The store is built in a temporary directory and swapped in afterwards.
+  Readers that opened the previous store keep reading it until they exit.
+- As in every Oxigraph-backed graph, plain literals are returned with an
+  explicit xsd:string datatype; compare lexical values where this matters.
+- Files rejected by Oxigraph's (stricter) Turtle parser are left out of the
+  store and parsed by rdflib when read.
+- Set ONTOLOGY_GRAPH_STORE=0 to disable the store (e.g. for debugging).
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from rdflib import Graph, URIRef
+
+from src.tools.core.constants import FAST_STORE, env_disabled
+from src.tools.core.file_utils import file_sha256, file_stamp
+from src.tools.core.logging import get_logger
+
+# pyoxigraph and oxrdflib are optional (installed together with oxrdflib)
+try:
+    import pyoxigraph as ox
+    from oxrdflib.store import OxigraphStore
+except ImportError:
+    ox = None
+    OxigraphStore = None
+
+if TYPE_CHECKING:
+    from src.tools.utils.registry_resolver import RegistryResolver
+
+# Module logger
+logger = get_logger(__name__)
+
+# Navigate up from src/tools/utils to the repo root
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+# Store directory (relative to repository root)
+GRAPH_STORE_DIRNAME = ".graph_store"
+
+# Manifest file inside the store directory
+MANIFEST_FILENAME = "manifest.json"
+
+# Environment variable to disable the store ("0", "false", "no", "off")
+GRAPH_STORE_ENV = "ONTOLOGY_GRAPH_STORE"
+
+# Bump when the store layout changes
+GRAPH_STORE_VERSION = 1
+
+# Named graph IRI of a file: prefix + repository-relative POSIX path
+GRAPH_NAME_PREFIX = "urn:x-graph-store:"
+
+# Shared read-only stores per repository root
+_open_stores: Dict[Path, Optional["GraphStore"]] = {}
+
+
+def _is_disabled() -> bool:
+    """Check whether the store is disabled via ONTOLOGY_GRAPH_STORE."""
+    return env_disabled(GRAPH_STORE_ENV)
+
+
+def graph_name(rel_path: str) -> str:
+    """Return the named graph IRI of a repository-relative file path."""
+    return GRAPH_NAME_PREFIX + rel_path
+
+
+def _relative(path: Path, root_dir: Path) -> Optional[str]:
+    """Return the repository-relative POSIX path of a file (None if outside)."""
+    try:
+        return Path(os.path.abspath(path)).relative_to(root_dir).as_posix()
+    except ValueError:
+        return None
+
+
+def _read_manifest(store_dir: Path) -> Optional[Dict]:
+    """Read the manifest of a store directory (None if missing or outdated)."""
+    manifest_path = store_dir / MANIFEST_FILENAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != GRAPH_STORE_VERSION:
+        return None
+    return manifest
+
+
+def _entry_is_current(entry: Dict, path: Path) -> bool:
+    """Check whether a manifest entry still describes the file on disk."""
+    stamp = file_stamp(path)
+    if stamp == (-1, -1):
+        return False
+    if stamp == (entry.get("mtime_ns"), entry.get("size")):
+        return True
+    # Stat changed (touch, checkout): fall back to the content hash
+    return file_sha256(path) == entry.get("sha256")
+
+
+def corpus_files(resolver: "RegistryResolver") -> List[str]:
+    """
+    Return the catalog files that belong into the store.
+
+    Args:
+        resolver: RegistryResolver reflecting the current catalogs
+
+    Returns:
+        Sorted repository-relative paths of all ontology, SHACL and base
+        ontology files
+    """
+    paths = set(resolver.get_base_ontology_paths())
+    for domain in resolver.list_domains():
+        ontology_path = resolver.get_ontology_path(domain)
+        if ontology_path:
+            paths.add(ontology_path)
+        paths.update(resolver.get_shacl_paths(domain))
+    return sorted(paths)
+
+
+def _load_file(store, path: Path, rel_path: str) -> Dict:
+    """Load one Turtle file into its named graph and return its manifest entry."""
+    name = ox.NamedNode(graph_name(rel_path))
+    parser = ox.parse(path=str(path), format=ox.RdfFormat.TURTLE)
+    quads = [ox.Quad(q.subject, q.predicate, q.object, name) for q in parser]
+    store.bulk_extend(quads)
+
+    mtime_ns, size = file_stamp(path)
+    return {
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "sha256": file_sha256(path),
+        "triples": len(quads),
+        "namespaces": sorted(parser.prefixes.items()),
+    }
+
+
+def build_graph_store(
+    resolver: "RegistryResolver",
+    root_dir: Optional[Path] = None,
+    files: Optional[Iterable[str]] = None,
+    force: bool = False,
+) -> bool:
+    """
+    Build the graph store unless it already holds the current files.
+
+    Args:
+        resolver: RegistryResolver reflecting the current catalogs
+        root_dir: Repository root (default: resolver.root_dir)
+        files: Repository-relative files to store (default: corpus_files)
+        force: Rebuild even if the store is current
+
+    Returns:
+        True if the store was (re)built, False if it was already current
+        or pyoxigraph is not installed
+    """
+    if ox is None:
+        logger.warning("pyoxigraph is not installed; graph store not built")
+        return False
+
+    root_dir = Path(root_dir or resolver.root_dir).resolve()
+    store_dir = root_dir / GRAPH_STORE_DIRNAME
+    files = sorted(files) if files is not None else corpus_files(resolver)
+
+    manifest = _read_manifest(store_dir)
+    if not force and manifest is not None:
+        stored = manifest.get("files", {})
+        skipped = manifest.get("skipped", [])
+        if sorted([*stored, *skipped]) == files and all(
+            _entry_is_current(entry, root_dir / rel) for rel, entry in stored.items()
+        ):
+            return False
+
+    tmp_dir = Path(tempfile.mkdtemp(dir=root_dir, prefix=".graph_store-"))
+    try:
+        store = ox.Store(str(tmp_dir / "data"))
+        entries: Dict[str, Dict] = {}
+        skipped: List[str] = []
+        for rel_path in files:
+            path = root_dir / rel_path
+            try:
+                entries[rel_path] = _load_file(store, path, rel_path)
+            except (OSError, SyntaxError) as e:
+                logger.warning("Graph store: skipping %s: %s", rel_path, e)
+                skipped.append(rel_path)
+        store.optimize()
+        store.flush()
+        del store
+
+        manifest = {
+            "version": GRAPH_STORE_VERSION,
+            "files": entries,
+            "skipped": skipped,
+        }
+        (tmp_dir / MANIFEST_FILENAME).write_text(
+            json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+        # Swap in the new store (readers of the old one keep their handles)
+        if store_dir.exists():
+            shutil.rmtree(store_dir)
+        os.replace(tmp_dir, store_dir)
+    finally:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+
+    _open_stores.pop(root_dir, None)
+    logger.info("Graph store: %d files in %s", len(entries), GRAPH_STORE_DIRNAME)
+    return True
+
+
+class GraphStore:
+    """
+    Read-only access to a graph store built by build_graph_store.
+
+    Usage:
+        store = GraphStore.open(root_dir)
+        view = store.graph(Path("artifacts/gx/gx.shacl.ttl")) if store else None
+    """
+
+    def __init__(self, root_dir: Path, store, manifest: Dict):
+        """
+        Wrap an opened store.
+
+        Args:
+            root_dir: Repository root the store was built for
+            store: pyoxigraph.Store opened read-only
+            manifest: Manifest of the store directory
+        """
+        self.root_dir = Path(root_dir).resolve()
+        self.store = store
+        self.files: Dict[str, Dict] = manifest.get("files", {})
+        self._current: Dict[str, bool] = {}
+
+    @classmethod
+    def open(cls, root_dir: Path) -> Optional["GraphStore"]:
+        """
+        Open the store of a repository root read-only.
+
+        Args:
+            root_dir: Repository root directory
+
+        Returns:
+            GraphStore, or None if there is no usable store
+        """
+        if ox is None or OxigraphStore is None:
+            return None
+        store_dir = Path(root_dir).resolve() / GRAPH_STORE_DIRNAME
+        manifest = _read_manifest(store_dir)
+        if manifest is None:
+            return None
+        try:
+            store = ox.Store.read_only(str(store_dir / "data"))
+        except OSError as e:
+            logger.warning("Could not open graph store: %s", e)
+            return None
+        return cls(root_dir, store, manifest)
+
+    def is_current(self, rel_path: str) -> bool:
+        """Check whether the stored graph of a file matches the file on disk."""
+        current = self._current.get(rel_path)
+        if current is None:
+            entry = self.files.get(rel_path)
+            current = entry is not None and _entry_is_current(
+                entry, self.root_dir / rel_path
+            )
+            self._current[rel_path] = current
+        return current
+
+    def graph(self, path: Path) -> Optional[Graph]:
+        """
+        Return a read-only graph view of a stored file.
+
+        Args:
+            path: File path (absolute or relative to the repository root)
+
+        Returns:
+            Graph backed by the file's named graph, or None if the file is
+            not in the store or changed since the store was built
+        """
+        path = Path(path)
+        rel_path = _relative(
+            path if path.is_absolute() else self.root_dir / path, self.root_dir
+        )
+        if rel_path is None or not self.is_current(rel_path):
+            return None
+
+        # One wrapper per view: prefix bindings are kept by the wrapper
+        view = Graph(
+            store=OxigraphStore(store=self.store),
+            identifier=URIRef(graph_name(rel_path)),
+        )
+        for prefix, namespace in self.files[rel_path].get("namespaces", []):
+            view.bind(prefix, namespace)
+        return view
+
+
+def get_graph_store(root_dir: Path = ROOT_DIR) -> Optional[GraphStore]:
+    """
+    Return the shared read-only graph store of a repository root.
+
+    Args:
+        root_dir: Repository root directory
+
+    Returns:
+        GraphStore, or None if disabled via ONTOLOGY_GRAPH_STORE or not built
+    """
+    if _is_disabled():
+        return None
+    root_dir = Path(root_dir).resolve()
+    if root_dir not in _open_stores:
+        _open_stores[root_dir] = GraphStore.open(root_dir)
+    return _open_stores[root_dir]
+
+
+def read_graph(path: Path, root_dir: Path = ROOT_DIR, format: str = "turtle") -> Graph:
+    """
+    Return the triples of an RDF file for read-only use.
+
+    Args:
+        path: File to read
+        root_dir: Repository root whose graph store is consulted
+        format: rdflib format name used when parsing
+
+    Returns:
+        Read-only store view if the file is current in the graph store,
+        otherwise a freshly parsed (modifiable) FAST_STORE graph
+    """
+    store = get_graph_store(root_dir)
+    if store is not None:
+        view = store.graph(path)
+        if view is not None:
+            return view
+
+    graph = Graph(store=FAST_STORE)
+    graph.parse(str(path), format=format)
+    return graph
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    from types import SimpleNamespace
+
+    from rdflib import RDF, Namespace
+
+    print("Running graph_store self-tests...")
+    all_passed = True
+
+    if ox is None:
+        print("SKIP: pyoxigraph is not installed")
+        return True
+
+    ex = Namespace("http://example.org/")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        ttl_file = root / "a.ttl"
+        ttl_file.write_text(
+            "@prefix ex: <http://example.org/> .\nex:s a ex:Thing .\n",
+            encoding="utf-8",
+        )
+        resolver = SimpleNamespace(root_dir=root)
+
+        # Test 1: Build, then skip when nothing changed
+        built = build_graph_store(resolver, files=["a.ttl"])
+        rebuilt = build_graph_store(resolver, files=["a.ttl"])
+        if not built or rebuilt:
+            print(f"FAIL: Build/skip - built={built} rebuilt={rebuilt}")
+            all_passed = False
+        else:
+            print("PASS: Build and skip when current")
+
+        # Test 2: Current files are served from the store
+        _open_stores.clear()
+        view = read_graph(ttl_file, root)
+        if (ex.s, RDF.type, ex.Thing) not in view or not isinstance(
+            view.store, OxigraphStore
+        ):
+            print("FAIL: Store view")
+            all_passed = False
+        else:
+            print("PASS: Store view")
+
+        # Test 3: Changed files are parsed again
+        ttl_file.write_text(
+            "@prefix ex: <http://example.org/> .\nex:s a ex:Other .\n",
+            encoding="utf-8",
+        )
+        _open_stores.clear()
+        graph = read_graph(ttl_file, root)
+        if (ex.s, RDF.type, ex.Other) not in graph:
+            print("FAIL: Stale file should be parsed")
+            all_passed = False
+        else:
+            print("PASS: Stale file is parsed")
+        _open_stores.clear()
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Build or show the graph store")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    parser.add_argument("--build", action="store_true", help="Build the store")
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even if the store is current"
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=ROOT_DIR,
+        help="Repository root (default: this repository)",
+    )
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    if args.build:
+        from src.tools.utils.registry_resolver import RegistryResolver
+
+        built = build_graph_store(RegistryResolver(args.root), force=args.force)
+        print("✅ Graph store built" if built else "✅ Graph store is up to date")
+        return
+
+    store = GraphStore.open(args.root)
+    if store is None:
+        print(f"❌ No graph store in {GRAPH_STORE_DIRNAME}")
+        sys.exit(1)
+
+    stale = [rel for rel in sorted(store.files) if not store.is_current(rel)]
+    total = sum(entry["triples"] for entry in store.files.values())
+    print(f"Graph store: {len(store.files)} files, {total} triples")
+    for rel in stale:
+        print(f"  stale: {rel}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,10 +15,15 @@ FEATURE SET:
 
 USAGE:
 ======
+    from src.tools.utils.docs_model import DocsModel
     from src.tools.utils.properties_updater import generate_all
 
     generate_all()
 
+    # Share parsed graphs with class_page_generator
+    model = DocsModel()
+    generate_all(model)
+
 STANDALONE TESTING:
 ==================
     python3 -m src.tools.utils.properties_updater [--verbose]
@@ -35,6 +40,8 @@ NOTES:
 - PROPERTIES.md files live with artifacts for each ontology domain.
 - Docs consume artifacts PROPERTIES via pymdownx.snippets.
 - Artifact links resolve to docs/artifacts/<domain>/<versionInfo>.
+- Graphs are read through a DocsModel (src.tools.utils.docs_model); pass
+  the model shared with class_page_generator to parse each file once.
 """
 
 from __future__ import annotations
@@ -49,6 +56,7 @@ import rdflib
 from rdflib import OWL, RDF, RDFS, URIRef
 
 from src.tools.core.logging import get_logger
+from src.tools.utils.docs_model import DocsModel
 
 logger = get_logger(__name__)
 
@@ -143,17 +151,23 @@ def _resolve_version_dir(version_entry: dict, fallback: Optional[str]) -> str:
     return _normalize_version_info(version_info or fallback or "unknown")
 
 
-def extract_class_definitions(owl_file: Path) -> Dict[str, ClassInfo]:
+def extract_class_definitions(
+    owl_file: Path, model: Optional[DocsModel] = None
+) -> Dict[str, ClassInfo]:
     """
     Extract class definitions from an OWL Turtle file.
 
     Args:
         owl_file: Path to OWL TTL file
+        model: Shared docs model to read the graph from (parsed if None)
 
     Returns:
         Mapping of class IRI to ClassInfo
     """
-    graph = parse_graph(owl_file, "turtle")
+    if model is not None:
+        graph = model.graph(owl_file)
+    else:
+        graph = parse_graph(owl_file, "turtle")
     class_iris = set(graph.subjects(RDF.type, OWL.Class))
     class_iris.update(graph.subjects(RDF.type, RDFS.Class))
 
@@ -543,13 +557,19 @@ def _find_first_file(domain_dir: Path, suffix: str) -> Optional[Path]:
     return matches[0] if matches else None
 
 
-def generate_properties_docs() -> None:
-    """Generate PROPERTIES.md files for all domains."""
+def generate_properties_docs(model: Optional[DocsModel] = None) -> None:
+    """
+    Generate PROPERTIES.md files for all domains.
+
+    Args:
+        model: Shared docs model (a new one is created if None)
+    """
     if not ARTIFACTS_DIR.exists():
         logger.error("Artifacts directory not found: %s", ARTIFACTS_DIR)
         return
 
-    for domain_dir in sorted([d for d in ARTIFACTS_DIR.iterdir() if d.is_dir()]):
+    model = model or DocsModel(ARTIFACTS_DIR)
+    for domain_dir in model.domain_dirs():
         domain = domain_dir.name
         shacl_files = sorted(domain_dir.glob("*.shacl.ttl"))
         if not shacl_files:
@@ -560,13 +580,13 @@ def generate_properties_docs() -> None:
             logger.warning("No OWL file found for %s", domain)
             classes: Dict[str, ClassInfo] = {}
         else:
-            classes = extract_class_definitions(owl_file)
+            classes = extract_class_definitions(owl_file, model)
 
         all_properties: List[ShaclProperty] = []
         all_prefixes: Dict[str, str] = {}
 
         for shacl_file in shacl_files:
-            graph = parse_graph(shacl_file, "turtle")
+            graph = model.graph(shacl_file)
             all_properties.extend(extract_shacl_properties(graph, shacl_file.name))
             all_prefixes.update(extract_prefixes(graph))
 
@@ -865,9 +885,14 @@ def load_registry() -> dict:
     return json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))
 
 
-def generate_all() -> None:
-    """Run all generation steps."""
-    generate_properties_docs()
+def generate_all(model: Optional[DocsModel] = None) -> None:
+    """
+    Run all generation steps.
+
+    Args:
+        model: Shared docs model (a new one is created if None)
+    """
+    generate_properties_docs(model)
     registry = load_registry()
     update_properties_pages(registry)
     update_properties_overview(registry)
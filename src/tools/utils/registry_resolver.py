@@ -7,6 +7,7 @@ The RegistryResolver loads XML catalogs to resolve:
 - SHACL shapes for a given domain (artifacts/catalog-v001.xml)
 - Base ontologies for inference (imports/catalog-v001.xml)
 - Test data and fixtures (tests/catalog-v001.xml)
+- Precomputed schema closures per domain (docs/schema-index.json)
 
 docs/registry.json is still loaded for metadata, but runtime path resolution
 is driven by the catalogs for consistency.
@@ -22,10 +23,14 @@ Usage:
     rdf_types = {"https://w3id.org/ascs-ev/envited-x/scenario/v5/Scenario"}
     ontology_paths, shacl_paths = resolver.discover_required_schemas(rdf_types)
 
+    # Shared read-only resolver (rebuilt when a catalog file changes)
+    resolver = get_registry_resolver(root_dir)
+
 See also:
     - artifacts/catalog-v001.xml
     - imports/catalog-v001.xml
     - tests/catalog-v001.xml
+    - docs/schema-index.json (generated by registry_updater, see schema_index)
     - src.tools.validators.shacl: Main consumer of this utility
 """
 
@@ -33,7 +38,72 @@ import json
 import warnings
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from src.tools.core.file_utils import FileStamp, file_stamp
+from src.tools.utils.schema_index import SCHEMA_INDEX_PATH, load_schema_index
+
+# Files parsed by RegistryResolver, relative to the repository root
+CATALOG_FILES = (
+    Path("docs") / "registry.json",
+    Path("tests") / "catalog-v001.xml",
+    Path("artifacts") / "catalog-v001.xml",
+    Path("imports") / "catalog-v001.xml",
+    SCHEMA_INDEX_PATH,
+)
+
+
+class IriPrefixTrie:
+    """
+    Character trie mapping IRI prefixes to values.
+
+    Lookups walk the IRI once, so matching an IRI against all registered
+    namespaces costs O(len(iri)) regardless of the number of namespaces.
+
+    Usage:
+        trie = IriPrefixTrie()
+        trie.add("http://example.org/ns#", "example")
+        trie.longest_match("http://example.org/ns#Thing")  # -> "example"
+    """
+
+    # Key under which a node stores its values ("" never occurs as a character)
+    _VALUES = ""
+
+    def __init__(self):
+        self._root: Dict[str, dict] = {}
+
+    def add(self, prefix: str, value: str) -> None:
+        """Register a value for a prefix (a prefix may carry several values)."""
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        values = node.setdefault(self._VALUES, [])
+        if value not in values:
+            values.append(value)
+
+    def _matching_nodes(self, iri: str) -> Iterator[dict]:
+        """Yield the trie nodes of all registered prefixes of iri, shortest first."""
+        node = self._root
+        if self._VALUES in node:
+            yield node
+        for char in iri:
+            node = node.get(char)
+            if node is None:
+                return
+            if self._VALUES in node:
+                yield node
+
+    def matches(self, iri: str) -> Iterator[str]:
+        """Yield the values of all registered prefixes of iri, shortest first."""
+        for node in self._matching_nodes(iri):
+            yield from node[self._VALUES]
+
+    def longest_match(self, iri: str) -> Optional[str]:
+        """Return the first value of the longest registered prefix of iri."""
+        node = None
+        for node in self._matching_nodes(iri):
+            pass
+        return node[self._VALUES][0] if node is not None else None
 
 
 class RegistryResolver:
@@ -61,7 +131,12 @@ class RegistryResolver:
         self._artifact_domains: Dict[str, Dict[str, object]] = {}
         self._domain_iris: Dict[str, str] = {}
         self._iri_to_domain: Dict[str, str] = {}
+        self._domain_prefixes = IriPrefixTrie()
         self._imports_catalog_entries: Optional[Dict[str, str]] = None
+        self._base_prefixes: Optional[IriPrefixTrie] = None
+        self._schema_index: Optional[Dict] = None
+        self._schema_index_loaded = False
+        self._class_to_domain: Dict[str, str] = {}
 
         self._load_registry()
         self._load_catalog()  # Replaces _load_fixtures_catalog
@@ -305,7 +380,7 @@ class RegistryResolver:
         return path.suffix.lower() in {".ttl", ".rdf", ".owl", ".xml", ".nt", ".n3"}
 
     def _build_iri_index(self) -> None:
-        """Build IRI -> domain mapping from artifacts catalog."""
+        """Build IRI -> domain mapping and namespace index from artifacts catalog."""
         self._iri_to_domain = {}
         for domain, iri in self._domain_iris.items():
             if iri:
@@ -314,6 +389,33 @@ class RegistryResolver:
                 if base_iri != iri:
                     self._iri_to_domain[base_iri] = domain
 
+        # Terms of a domain live below "<iri>/" or "<iri>#"
+        self._domain_prefixes = IriPrefixTrie()
+        for iri, domain in self._iri_to_domain.items():
+            self._domain_prefixes.add(iri.rstrip("/") + "/", domain)
+            self._domain_prefixes.add(iri.rstrip("#") + "#", domain)
+
+    def _build_base_prefix_index(self) -> IriPrefixTrie:
+        """
+        Build the namespace index of base ontologies from the imports catalog.
+
+        Each base IRI is registered with both http/https schemes, as is and
+        with a "/" or "#" separator after the IRI stripped of trailing ones.
+        """
+        trie = IriPrefixTrie()
+        for base_iri, path in self._imports_catalog_entries.items():
+            candidates = [base_iri]
+            if base_iri.startswith("http://"):
+                candidates.append("https://" + base_iri[len("http://") :])
+            elif base_iri.startswith("https://"):
+                candidates.append("http://" + base_iri[len("https://") :])
+
+            for candidate in candidates:
+                base = candidate.rstrip("#/")
+                for prefix in (candidate, base + "/", base + "#"):
+                    trie.add(prefix, path)
+        return trie
+
     # =========================================================================
     # Core Methods (return repo-relative paths as strings)
     # =========================================================================
@@ -414,30 +516,14 @@ class RegistryResolver:
             self._imports_catalog_entries = self._load_imports_catalog_entries()
         if not self._imports_catalog_entries:
             return []
+        if self._base_prefixes is None:
+            self._base_prefixes = self._build_base_prefix_index()
 
-        matches: List[str] = []
-        for base_iri, path in self._imports_catalog_entries.items():
-            if self._iri_matches_base(iris, base_iri):
-                matches.append(path)
-
-        return sorted(set(matches))
+        matches: Set[str] = set()
+        for iri in iris:
+            matches.update(self._base_prefixes.matches(iri))
 
-    @staticmethod
-    def _iri_matches_base(iris: Set[str], base_iri: str) -> bool:
-        candidates = {base_iri}
-        if base_iri.startswith("http://"):
-            candidates.add("https://" + base_iri[len("http://") :])
-        elif base_iri.startswith("https://"):
-            candidates.add("http://" + base_iri[len("https://") :])
-
-        for candidate in candidates:
-            base = candidate.rstrip("#/")
-            for iri in iris:
-                if iri == candidate or iri.startswith(candidate):
-                    return True
-                if iri.startswith(base + "/") or iri.startswith(base + "#"):
-                    return True
-        return False
+        return sorted(matches)
 
     # =========================================================================
     # Test Catalog Methods
@@ -618,14 +704,53 @@ class RegistryResolver:
         if rdf_type in self._iri_to_domain:
             return self._iri_to_domain[rdf_type]
 
-        # Check prefix match
-        for iri, domain in self._iri_to_domain.items():
-            if rdf_type.startswith(iri.rstrip("/") + "/"):
-                return domain
-            if rdf_type.startswith(iri.rstrip("#") + "#"):
-                return domain
+        # Most specific namespace containing the type
+        return self._domain_prefixes.longest_match(rdf_type)
+
+    def _get_schema_index(self) -> Optional[Dict]:
+        """Load docs/schema-index.json on first use (None if missing or stale)."""
+        if not self._schema_index_loaded:
+            self._schema_index_loaded = True
+            self._schema_index = load_schema_index(self.root_dir)
+            if self._schema_index:
+                for domain, entry in self._schema_index["domains"].items():
+                    for class_iri in entry.get("classes", []):
+                        self._class_to_domain.setdefault(class_iri, domain)
+        return self._schema_index
+
+    def get_class_domain(self, class_iri: str) -> Optional[str]:
+        """
+        Map a class IRI to the domain whose ontology declares it.
+
+        Uses the schema index, so it also finds classes that a domain
+        declares outside its own namespace.
+
+        Args:
+            class_iri: Class IRI
 
-        return None
+        Returns:
+            Domain name if declared by an indexed domain, None otherwise
+        """
+        self._get_schema_index()
+        return self._class_to_domain.get(class_iri)
+
+    def get_domain_closure(self, domain: str) -> Optional[Dict[str, List[str]]]:
+        """
+        Get the precomputed schema closure of a domain from the schema index.
+
+        Args:
+            domain: Domain name (e.g., "hdmap")
+
+        Returns:
+            Dict with "domains", "ontology", "shacl" and "base" lists of the
+            domain and everything it reaches via owl:imports and sh:class,
+            or None if the index is missing, out of date or lacks the domain
+        """
+        index = self._get_schema_index()
+        if index is None:
+            return None
+        entry = index["domains"].get(domain)
+        return entry["closure"] if entry else None
 
     def resolve_fixture_iri(self, iri: str) -> Optional[str]:
         """
@@ -680,6 +805,13 @@ class RegistryResolver:
         """
         Discover required ontology and SHACL files based on RDF types.
 
+        With an up-to-date schema index, each domain contributes the
+        ontologies of its precomputed closure (the domains it imports or
+        references via sh:class), so inference sees the complete class
+        hierarchy. Shapes stay limited to the domains of the data's types:
+        shapes of referenced domains would make validation stricter than
+        the domains define (e.g. envited-x shapes for tzip21 assets).
+
         Args:
             rdf_types: Set of rdf:type IRIs found in the data
 
@@ -691,13 +823,19 @@ class RegistryResolver:
         domains_found = set()
 
         for rdf_type in rdf_types:
-            domain = self.resolve_type_to_domain(rdf_type)
+            domain = self.resolve_type_to_domain(rdf_type) or self.get_class_domain(
+                rdf_type
+            )
             if domain and domain not in domains_found:
                 domains_found.add(domain)
 
-                ont_path = self.get_ontology_path(domain)
-                if ont_path:
-                    ontology_paths.append(ont_path)
+                closure = self.get_domain_closure(domain)
+                if closure is not None:
+                    ontology_paths.extend(closure["ontology"] + closure["base"])
+                else:
+                    ont_path = self.get_ontology_path(domain)
+                    if ont_path:
+                        ontology_paths.append(ont_path)
 
                 shacl_paths.extend(self.get_shacl_paths(domain))
 
@@ -724,6 +862,47 @@ class RegistryResolver:
         }
 
 
+# Shared resolvers per root directory: root -> (catalog stamps, resolver)
+_resolver_cache: Dict[Path, Tuple[Tuple[FileStamp, ...], RegistryResolver]] = {}
+
+
+def _catalog_stamps(root_dir: Path) -> Tuple[FileStamp, ...]:
+    """Return the (mtime_ns, size) of each catalog file, (-1, -1) if missing."""
+    return tuple(file_stamp(root_dir / rel_path) for rel_path in CATALOG_FILES)
+
+
+def get_registry_resolver(root_dir: Path = None) -> RegistryResolver:
+    """
+    Return the shared RegistryResolver for a repository root.
+
+    The resolver is built once per process and root directory and rebuilt
+    when any catalog file (see CATALOG_FILES) changes its mtime. Callers
+    must treat it as read-only; code adding temporary catalog entries
+    should construct its own RegistryResolver.
+
+    Args:
+        root_dir: Root directory of the repository. Defaults to current directory.
+
+    Returns:
+        Shared RegistryResolver instance
+    """
+    root = Path(root_dir or Path.cwd()).resolve()
+    stamps = _catalog_stamps(root)
+
+    cached = _resolver_cache.get(root)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+
+    resolver = RegistryResolver(root)
+    _resolver_cache[root] = (stamps, resolver)
+    return resolver
+
+
+def clear_registry_resolver_cache() -> None:
+    """Drop all shared resolvers held by this process."""
+    _resolver_cache.clear()
+
+
 def print_registry_info(resolver: RegistryResolver) -> None:
     """
     Print registry information to console.
@@ -8,6 +8,10 @@ This script generates/updates:
   3. imports/catalog-v001.xml - OASIS XML Catalog for base ontologies
   4. tests/catalog-v001.xml - Unified test catalog (test data + fixtures)
   5. config/ontoenv.toml - Ontology environment config (derived from catalogs)
+  6. docs/schema-index.json - Schema closure, namespaces, classes and
+     properties per domain (derived from catalogs, see schema_index)
+  7. .graph_store/ - Persistent Oxigraph store with one named graph per
+     catalog file (not committed, see graph_store)
 
 Usage:
     python -m src.tools.utils.registry_updater [--release-tag TAG] [--dry-run]
@@ -40,6 +44,13 @@ from src.tools.utils.file_collector import (
     collect_jsonld_files,
     collect_ontology_bundles,
 )
+from src.tools.utils.graph_store import build_graph_store
+from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.utils.schema_index import (
+    SCHEMA_INDEX_PATH,
+    build_schema_index,
+    render_schema_index,
+)
 
 logger = get_logger(__name__)
 
@@ -55,6 +66,7 @@ ARTIFACTS_CATALOG_PATH = ARTIFACTS_DIR / "catalog-v001.xml"
 IMPORTS_CATALOG_PATH = IMPORTS_DIR / "catalog-v001.xml"
 TEST_CATALOG_PATH = ROOT_DIR / "tests" / "catalog-v001.xml"
 ONTOENV_PATH = ROOT_DIR / "config" / "ontoenv.toml"
+SCHEMA_INDEX_FILE = ROOT_DIR / SCHEMA_INDEX_PATH
 
 REGISTRY_VERSION = "2.1.0"
 
@@ -756,6 +768,15 @@ def main():
         write_file(imports_xml, IMPORTS_CATALOG_PATH)
         write_file(ontoenv_toml, ONTOENV_PATH)
         write_file(test_catalog_xml, TEST_CATALOG_PATH)
+
+        # Derived from the catalogs written above
+        logger.info("Generating schema-index.json...")
+        resolver = RegistryResolver(ROOT_DIR)
+        schema_index = build_schema_index(resolver)
+        write_file(render_schema_index(schema_index), SCHEMA_INDEX_FILE)
+
+        logger.info("Updating graph store...")
+        build_graph_store(resolver)
         print("\n✅ Update complete!")
 
 
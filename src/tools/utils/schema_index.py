@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Schema Index - Precomputed Schema Closure per Ontology Domain
+
+Builds and loads docs/schema-index.json, which records for every domain of
+the artifacts catalog the files SHACL validation needs, so that schema
+discovery at validation time becomes a dictionary lookup.
+
+FEATURE SET:
+============
+1. build_schema_index - Compute the index from the catalogs and schema files
+2. load_schema_index - Load the index, ignoring it if its sources changed
+3. render_schema_index - Serialize the index deterministically
+
+USAGE:
+======
+    from src.tools.utils.registry_resolver import RegistryResolver
+    from src.tools.utils.schema_index import build_schema_index, load_schema_index
+
+    # Generate (done by registry_updater)
+    index = build_schema_index(RegistryResolver(root_dir))
+
+    # Load (done by RegistryResolver.get_domain_closure)
+    index = load_schema_index(root_dir)
+    closure = index["domains"]["manifest"]["closure"]
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.utils.schema_index [--test] [--check]
+
+DEPENDENCIES:
+=============
+- rdflib: Parsing ontology and SHACL files
+- src.tools.utils.graph_loader: Cached Turtle loading
+
+NOTES:
+======
+- Per domain the index holds:
+    * closure: the domains reachable via owl:imports and sh:class references
+      (transitively) and their ontology, SHACL and base ontology files
+    * namespaces: the namespaces of all IRIs used in its ontology and shapes
+    * classes / properties: the classes and properties declared in its
+      ontology (properties also include sh:path targets of its shapes)
+- Base ontologies (imports/) join the closure only when a domain
+  owl:imports them; the validator still adds the base ontologies of the
+  namespaces used by the data, which keeps large vocabularies such as
+  schema.org out of runs that do not need them.
+- sources maps every file the index was computed from to its SHA-256
+  (line endings normalized). load_schema_index returns None if any of them
+  changed, so a stale index is never used; registry_updater regenerates it.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import warnings
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from rdflib import OWL, RDF, RDFS, Graph, Namespace, URIRef
+
+from src.tools.core.iri_utils import get_namespace
+from src.tools.core.logging import get_logger
+from src.tools.utils.graph_loader import load_turtle_files
+
+if TYPE_CHECKING:
+    from src.tools.utils.registry_resolver import RegistryResolver
+
+# Module logger
+logger = get_logger(__name__)
+
+# Navigate up from src/tools/utils to the repo root
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+# Generated index file (relative to repository root)
+SCHEMA_INDEX_PATH = Path("docs") / "schema-index.json"
+
+# Bump when the index layout changes
+SCHEMA_INDEX_VERSION = "1.0.0"
+
+SH = Namespace("http://www.w3.org/ns/shacl#")
+
+CLASS_TYPES = (OWL.Class, RDFS.Class)
+PROPERTY_TYPES = (
+    RDF.Property,
+    OWL.ObjectProperty,
+    OWL.DatatypeProperty,
+    OWL.AnnotationProperty,
+)
+
+
+def _source_sha256(path: Path) -> Optional[str]:
+    """Return the SHA-256 of a text file with normalized line endings."""
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+    return hashlib.sha256(content.replace(b"\r\n", b"\n")).hexdigest()
+
+
+def _used_iris(graph: Graph) -> Set[str]:
+    """Return all IRIs used in a graph (any triple position)."""
+    iris: Set[str] = set()
+    for triple in graph:
+        iris.update(str(term) for term in triple if isinstance(term, URIRef))
+    return iris
+
+
+def _declared(graph: Graph, types: Iterable[URIRef]) -> Set[str]:
+    """Return the IRIs declared with one of the given rdf:types."""
+    return {
+        str(s)
+        for rdf_type in types
+        for s in graph.subjects(RDF.type, rdf_type)
+        if isinstance(s, URIRef)
+    }
+
+
+def _domain_entry(
+    domain: str, resolver: "RegistryResolver", root_dir: Path
+) -> Dict[str, object]:
+    """Compute the direct (non-transitive) index entry of one domain."""
+    ontology_path = resolver.get_ontology_path(domain)
+    shacl_paths = resolver.get_shacl_paths(domain)
+
+    ontology_graph = (
+        load_turtle_files([resolver.to_absolute(ontology_path)], root_dir)
+        if ontology_path
+        else Graph()
+    )
+    shacl_graph = load_turtle_files(
+        [resolver.to_absolute(p) for p in shacl_paths], root_dir
+    )
+
+    # Candidates for direct dependencies: owl:imports and sh:class targets
+    imported = {
+        str(o)
+        for g in (ontology_graph, shacl_graph)
+        for o in g.objects(None, OWL.imports)
+    }
+    referenced_classes = {str(o) for o in shacl_graph.objects(None, SH["class"])}
+
+    used_iris = _used_iris(ontology_graph) | _used_iris(shacl_graph)
+    base_paths = resolver.get_base_ontology_paths_for_iris(imported)
+
+    properties = _declared(ontology_graph, PROPERTY_TYPES)
+    properties.update(
+        str(o) for o in shacl_graph.objects(None, SH.path) if isinstance(o, URIRef)
+    )
+
+    return {
+        "ontology": ontology_path,
+        "shacl": sorted(shacl_paths),
+        "references": sorted(imported | referenced_classes),
+        "base": sorted(base_paths),
+        "namespaces": sorted({get_namespace(iri) for iri in used_iris}),
+        "classes": sorted(_declared(ontology_graph, CLASS_TYPES)),
+        "properties": sorted(properties),
+    }
+
+
+def _closure(domain: str, entries: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """Return the transitive schema closure of a domain."""
+    seen = {domain}
+    queue = deque([domain])
+    while queue:
+        for dep in entries[queue.popleft()]["depends_on"]:
+            if dep in entries and dep not in seen:
+                seen.add(dep)
+                queue.append(dep)
+
+    ontology = {entries[d]["ontology"] for d in seen if entries[d]["ontology"]}
+    return {
+        "domains": sorted(seen),
+        "ontology": sorted(ontology),
+        "shacl": sorted({p for d in seen for p in entries[d]["shacl"]}),
+        "base": sorted({p for d in seen for p in entries[d]["base"]}),
+    }
+
+
+def build_schema_index(
+    resolver: "RegistryResolver", root_dir: Optional[Path] = None
+) -> Dict:
+    """
+    Compute the schema index for all domains of the artifacts catalog.
+
+    Args:
+        resolver: RegistryResolver reflecting the current catalogs
+        root_dir: Repository root (default: resolver.root_dir)
+
+    Returns:
+        Index dict (see module NOTES)
+    """
+    root_dir = Path(root_dir or resolver.root_dir)
+    entries = {
+        domain: _domain_entry(domain, resolver, root_dir)
+        for domain in resolver.list_domains()
+    }
+
+    # Resolve references by namespace, then by declaring ontology
+    class_owner: Dict[str, str] = {}
+    for domain, entry in entries.items():
+        for class_iri in entry["classes"]:
+            class_owner.setdefault(class_iri, domain)
+    for domain, entry in entries.items():
+        targets = (
+            resolver.resolve_type_to_domain(iri) or class_owner.get(iri)
+            for iri in entry["references"]
+        )
+        entry["depends_on"] = sorted({t for t in targets if t and t != domain})
+
+    domains = {}
+    sources: Set[str] = set()
+    for domain, entry in entries.items():
+        closure = _closure(domain, entries)
+        domains[domain] = {
+            "closure": closure,
+            "namespaces": entry["namespaces"],
+            "classes": entry["classes"],
+            "properties": entry["properties"],
+        }
+        sources.update(closure["ontology"], closure["shacl"], closure["base"])
+
+    return {
+        "version": SCHEMA_INDEX_VERSION,
+        "sources": {
+            path: _source_sha256(resolver.to_absolute(path)) for path in sorted(sources)
+        },
+        "domains": domains,
+    }
+
+
+def render_schema_index(index: Dict) -> str:
+    """Serialize the index deterministically (stable diffs on regeneration)."""
+    return json.dumps(index, indent=2, sort_keys=True) + "\n"
+
+
+def load_schema_index(root_dir: Path = ROOT_DIR) -> Optional[Dict]:
+    """
+    Load docs/schema-index.json if it matches the current schema files.
+
+    Args:
+        root_dir: Repository root directory
+
+    Returns:
+        Index dict, or None if it is missing, unreadable or out of date
+    """
+    index_path = Path(root_dir) / SCHEMA_INDEX_PATH
+    if not index_path.exists():
+        return None
+
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        warnings.warn(f"Could not read schema index: {e}")
+        return None
+
+    if index.get("version") != SCHEMA_INDEX_VERSION:
+        return None
+
+    stale = [
+        path
+        for path, content_hash in index.get("sources", {}).items()
+        if _source_sha256(Path(root_dir) / path) != content_hash
+    ]
+    if stale:
+        warnings.warn(
+            f"Schema index is out of date ({stale[0]} changed); "
+            "run 'python -m src.tools.utils.registry_updater'"
+        )
+        return None
+
+    return index
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    import tempfile
+
+    print("Running schema_index self-tests...")
+    all_passed = True
+
+    # Test 1: Closure follows dependencies transitively
+    entries = {
+        "a": {"ontology": "a.owl.ttl", "shacl": ["a.shacl.ttl"], "depends_on": ["b"]},
+        "b": {"ontology": "b.owl.ttl", "shacl": [], "depends_on": ["c"]},
+        "c": {"ontology": None, "shacl": ["c.shacl.ttl"], "depends_on": ["a"]},
+    }
+    for entry in entries.values():
+        entry["base"] = []
+    closure = _closure("a", entries)
+    if closure["domains"] != ["a", "b", "c"] or closure["shacl"] != [
+        "a.shacl.ttl",
+        "c.shacl.ttl",
+    ]:
+        print(f"FAIL: Transitive closure - {closure}")
+        all_passed = False
+    else:
+        print("PASS: Transitive closure")
+
+    # Test 2: Changed source invalidates the index
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / "a.owl.ttl").write_text("# ontology\n")
+        index = {
+            "version": SCHEMA_INDEX_VERSION,
+            "sources": {"a.owl.ttl": _source_sha256(root / "a.owl.ttl")},
+            "domains": {},
+        }
+        (root / SCHEMA_INDEX_PATH).parent.mkdir(parents=True)
+        (root / SCHEMA_INDEX_PATH).write_text(render_schema_index(index))
+        loaded = load_schema_index(root)
+        (root / "a.owl.ttl").write_text("# changed\n")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            stale = load_schema_index(root)
+        if loaded != index or stale is not None:
+            print("FAIL: Stale index detection")
+            all_passed = False
+        else:
+            print("PASS: Stale index detection")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Show or check the schema index")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with 1 if the index is missing or out of date",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=ROOT_DIR,
+        help="Repository root (default: this repository)",
+    )
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    index = load_schema_index(args.root)
+    if index is None:
+        print(f"❌ {SCHEMA_INDEX_PATH.as_posix()} is missing or out of date")
+        sys.exit(1)
+
+    if args.check:
+        print(f"✅ {SCHEMA_INDEX_PATH.as_posix()} is up to date")
+        return
+
+    for domain, entry in sorted(index["domains"].items()):
+        closure = entry["closure"]
+        print(
+            f"{domain}: {len(closure['domains'])} domains, "
+            f"{len(closure['ontology'])} ontology, {len(closure['shacl'])} SHACL, "
+            f"{len(closure['base'])} base files"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,12 +15,14 @@ This package provides validators for:
 3. Validation Suite (validation_suite.py):
    - Aggregates all validators (syntax + coherence + conformance)
    - Command-line entry point for running all checks
+   - change_impact.py maps changed files to affected domains (--changed-since)
 
 Organization:
     validators/
     ├── coherence_validator.py          (standalone validator)
     ├── conformance_validator.py        (entry point to shacl/)
     ├── validation_suite.py              (aggregator)
+    ├── change_impact.py                 (changed files -> affected domains)
     └── shacl/                           (modular SHACL subsystem)
         ├── validator.py
         ├── schema_discovery.py
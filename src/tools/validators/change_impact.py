@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Change Impact - Map Changed Files to Affected Test Domains
+
+Determines which catalog test domains have to be validated again after a
+set of files changed, so that the validation suite can skip untouched
+domains (see ``validation_suite --changed-since``).
+
+FEATURE SET:
+============
+1. get_changed_files - Files changed since a git ref (incl. untracked files)
+2. get_import_dependents - Reverse owl:imports graph between artifact domains
+3. get_affected_domains - Map changed files to affected test domains
+
+USAGE:
+======
+    from src.tools.validators.change_impact import (
+        get_affected_domains,
+        get_changed_files,
+    )
+
+    changed = get_changed_files(root_dir, "origin/main")
+    domains = get_affected_domains(changed, resolver)
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.validators.change_impact [--test] [--since REF]
+
+DEPENDENCIES:
+=============
+- git: For change detection
+- RegistryResolver: Catalog-based mapping of files, IRIs and domains
+
+NOTES:
+======
+- A domain is affected when any of these holds:
+    * its artifacts or test data changed
+    * it imports (owl:imports, transitively) an affected artifact domain
+    * its test data references the namespace of an affected artifact domain
+    * its test data references a changed fixture
+- Changes to catalogs, imports/ (base ontologies) or the tooling itself
+  (src/) affect every domain.
+- owl:imports are read with a text scan of the Turtle files instead of a
+  full RDF parse, which keeps the check fast.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Set
+
+from src.tools.core.logging import get_logger
+from src.tools.utils.registry_resolver import (
+    CATALOG_FILES,
+    RegistryResolver,
+    get_registry_resolver,
+)
+from src.tools.utils.schema_index import SCHEMA_INDEX_PATH
+
+# Module logger
+logger = get_logger(__name__)
+
+# Navigate up from src/tools/validators to the repo root
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+# Changes below these directories may affect any domain
+GLOBAL_PREFIXES = ("imports/", "src/")
+
+# owl:imports objects written as IRIs (one or a comma-separated list)
+_OWL_IMPORTS_PATTERN = re.compile(
+    r"(?:owl:imports|<http://www\.w3\.org/2002/07/owl#imports>)"
+    r"\s+((?:<[^>\s]+>\s*,\s*)*<[^>\s]+>)"
+)
+_IRI_PATTERN = re.compile(r"<([^>\s]+)>")
+
+
+def get_changed_files(root_dir: Path, ref: str) -> List[str]:
+    """
+    List files changed since a git ref.
+
+    Includes committed, staged and unstaged changes relative to ref as well
+    as untracked files. Renames are reported as deletion plus addition so
+    that both the old and the new location are considered.
+
+    Args:
+        root_dir: Repository root directory
+        ref: Git ref to compare against (branch, tag or commit)
+
+    Returns:
+        Sorted repository-relative POSIX paths
+
+    Raises:
+        ValueError: If git fails (e.g. unknown ref or not a git repository)
+    """
+    commands = [
+        ["git", "diff", "--name-only", "--no-renames", ref, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed: Set[str] = set()
+    for command in commands:
+        try:
+            proc = subprocess.run(
+                command,
+                cwd=root_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            detail = getattr(e, "stderr", "") or str(e)
+            raise ValueError(f"git {command[1]} failed: {detail.strip()}") from e
+        changed.update(line.strip() for line in proc.stdout.splitlines())
+    changed.discard("")
+    return sorted(changed)
+
+
+def _read_text(path: Path) -> str:
+    """Read a file as text, returning an empty string if it is unreadable."""
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+def _domain_files(resolver: RegistryResolver, domain: str) -> List[str]:
+    """Return the ontology and SHACL paths of an artifact domain."""
+    paths = list(resolver.get_shacl_paths(domain))
+    ontology = resolver.get_ontology_path(domain)
+    if ontology:
+        paths.append(ontology)
+    return paths
+
+
+def get_import_dependents(resolver: RegistryResolver) -> Dict[str, Set[str]]:
+    """
+    Build the reverse owl:imports graph between artifact domains.
+
+    Args:
+        resolver: RegistryResolver instance
+
+    Returns:
+        Mapping of artifact domain -> domains that import it directly
+    """
+    dependents: Dict[str, Set[str]] = defaultdict(set)
+    for domain in resolver.list_domains():
+        for rel_path in _domain_files(resolver, domain):
+            text = _read_text(resolver.to_absolute(rel_path))
+            for match in _OWL_IMPORTS_PATTERN.finditer(text):
+                for iri in _IRI_PATTERN.findall(match.group(1)):
+                    imported = resolver.resolve_type_to_domain(iri)
+                    if imported and imported != domain:
+                        dependents[imported].add(domain)
+    return dependents
+
+
+def _with_dependents(domains: Set[str], dependents: Dict[str, Set[str]]) -> Set[str]:
+    """Close a set of artifact domains over the reverse import graph."""
+    result = set(domains)
+    pending = list(domains)
+    while pending:
+        for dependent in dependents.get(pending.pop(), ()):
+            if dependent not in result:
+                result.add(dependent)
+                pending.append(dependent)
+    return result
+
+
+def _namespace_markers(resolver: RegistryResolver, domains: Iterable[str]) -> Set[str]:
+    """Return the namespace IRIs (without trailing separators) of domains."""
+    markers = set()
+    for domain in domains:
+        iri = resolver.get_iri(domain)
+        if iri:
+            markers.add(iri.rstrip("/#"))
+    return markers
+
+
+def get_affected_domains(
+    changed_files: Iterable[str], resolver: RegistryResolver
+) -> List[str]:
+    """
+    Map changed files to the catalog test domains that must be re-validated.
+
+    Args:
+        changed_files: Repository-relative paths of changed files
+        resolver: RegistryResolver instance
+
+    Returns:
+        Sorted list of affected test domains
+    """
+    test_domains = resolver.get_test_domains()
+    changed = {PurePosixPath(p).as_posix() for p in changed_files}
+    if not changed:
+        return []
+
+    # Catalogs, base ontologies and tooling affect everything. The schema
+    # index is derived from the artifacts, whose changes are mapped below.
+    catalog_paths = {p.as_posix() for p in CATALOG_FILES if p != SCHEMA_INDEX_PATH}
+    if changed & catalog_paths or any(p.startswith(GLOBAL_PREFIXES) for p in changed):
+        return test_domains
+
+    artifact_domains = set(resolver.list_domains())
+    changed_artifacts: Set[str] = set()
+    affected: Set[str] = set()
+
+    for path in changed:
+        parts = PurePosixPath(path).parts
+        if len(parts) > 1 and parts[0] == "artifacts" and parts[1] in artifact_domains:
+            changed_artifacts.add(parts[1])
+        elif len(parts) > 2 and parts[:2] == ("tests", "data"):
+            affected.add(parts[2])
+
+    # Catalog entries pointing at changed files (test data and fixtures)
+    changed_fixture_iris = set()
+    for iri, metadata in resolver._catalog.items():
+        if metadata.get("path") in changed:
+            if metadata.get("category") == "fixture":
+                changed_fixture_iris.add(iri)
+            elif metadata.get("domain"):
+                affected.add(metadata["domain"])
+
+    changed_artifacts = _with_dependents(
+        changed_artifacts, get_import_dependents(resolver)
+    )
+    affected |= changed_artifacts
+
+    # Fixtures using affected namespaces count as changed as well
+    markers = _namespace_markers(resolver, changed_artifacts)
+    if markers:
+        for iri, rel_path in resolver._fixtures_catalog.items():
+            text = _read_text(resolver.to_absolute(rel_path))
+            if any(marker in text for marker in markers):
+                changed_fixture_iris.add(iri)
+
+    # Test data referencing affected namespaces or changed fixtures
+    references = markers | changed_fixture_iris
+    if references:
+        for domain in test_domains:
+            if domain in affected:
+                continue
+            for test_file in resolver.get_test_files(domain):
+                text = _read_text(test_file)
+                if any(reference in text for reference in references):
+                    affected.add(domain)
+                    break
+
+    return sorted(affected & set(test_domains))
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    print("Running change_impact self-tests...")
+    all_passed = True
+
+    resolver = get_registry_resolver(ROOT_DIR)
+    test_domains = resolver.get_test_domains()
+
+    # Test 1: No changes affect no domain
+    result = get_affected_domains([], resolver)
+    if result:
+        print(f"FAIL: no changes - got {result}")
+        all_passed = False
+    else:
+        print("PASS: no changes")
+
+    # Test 2: Catalog changes affect every domain
+    result = get_affected_domains(["tests/catalog-v001.xml"], resolver)
+    if result != test_domains:
+        print(f"FAIL: catalog change - got {result}")
+        all_passed = False
+    else:
+        print("PASS: catalog change affects all domains")
+
+    # Test 3: A changed artifact affects its own test domain
+    if test_domains:
+        domain = test_domains[0]
+        files = _domain_files(resolver, domain)
+        result = get_affected_domains(files[:1], resolver) if files else [domain]
+        if domain not in result:
+            print(f"FAIL: artifact change - {domain} not in {result}")
+            all_passed = False
+        else:
+            print("PASS: artifact change affects its domain")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point for change_impact."""
+    parser = argparse.ArgumentParser(
+        description="List catalog test domains affected by changes since a git ref."
+    )
+    parser.add_argument(
+        "--since", default="HEAD", metavar="REF", help="Git ref (default: HEAD)"
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="Changed files to map instead of asking git",
+    )
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    try:
+        changed = args.files or get_changed_files(ROOT_DIR, args.since)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for domain in get_affected_domains(changed, get_registry_resolver(ROOT_DIR)):
+        print(domain)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ FEATURE SET:
 2. extract_ontology_classes - Extract class definitions from OWL files
 3. extract_shacl_classes - Extract target classes from SHACL files
 4. get_base_ontology_classes - Load classes from base/imported ontologies
+   (computed once per run and persisted keyed by the imports catalog hash)
 
 USAGE:
 ======
@@ -32,31 +33,44 @@ STANDALONE TESTING:
 DEPENDENCIES:
 =============
 - rdflib: For RDF graph handling
+- hashlib, json (stdlib): Catalog hash and persisted base classes
 
 NOTES:
 ======
 - Case-insensitive class matching (local names converted to lowercase)
 - Missing classes can be recovered via rdfs:label matching
 - Base ontologies from imports/ are included in valid class set
+- Files are read through the graph store (src.tools.utils.graph_store) and
+  parsed into FAST_STORE graphs when they are not current in it
+- The base class set is keyed by a SHA-256 over imports/catalog-v001.xml and
+  the base ontology files. It is kept in memory for the rest of the process
+  and in .coherence_cache/base_classes.json across runs; set
+  ONTOLOGY_COHERENCE_CACHE=0 to disable the file. The hash itself is only
+  recomputed when a file's mtime or size changes.
 """
 
 import argparse
+import hashlib
 import io
+import json
 import sys
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Dict, FrozenSet, Optional, Set, Tuple
 
 from rdflib import OWL, RDF, RDFS, Graph, Namespace
 
+from src.tools.core.constants import env_disabled
+from src.tools.core.file_utils import atomic_write, file_stamp
 from src.tools.core.iri_utils import get_local_name
 from src.tools.core.logging import get_logger
 from src.tools.core.result import ReturnCodes
 from src.tools.utils.file_collector import collect_files_by_pattern
+from src.tools.utils.graph_store import read_graph
 from src.tools.utils.print_formatter import (
     format_artifact_coherence_result,
     normalize_path_for_display,
 )
-from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.utils.registry_resolver import RegistryResolver, get_registry_resolver
 
 # Module logger
 logger = get_logger(__name__)
@@ -67,6 +81,21 @@ SH = Namespace("http://www.w3.org/ns/shacl#")
 # List of folder names allowed to fail validation (configurable)
 EXPECTED_TARGETCLASS_FAILURES: Set[str] = set()
 
+# Persisted base-ontology class set (relative to repository root)
+BASE_CLASSES_CACHE_PATH = Path(".coherence_cache") / "base_classes.json"
+
+# Environment variable to disable the persisted set ("0", "false", "no", "off")
+BASE_CLASSES_CACHE_ENV = "ONTOLOGY_COHERENCE_CACHE"
+
+# Bump when the class extraction or the file layout changes
+BASE_CLASSES_CACHE_VERSION = 1
+
+# Base class sets computed in this process, keyed by catalog hash
+_base_classes: Dict[str, FrozenSet[str]] = {}
+
+# Catalog hashes computed in this process, keyed by the files' stamps
+_catalog_hashes: Dict[Tuple[Tuple[str, int, int], ...], str] = {}
+
 
 def extract_classes_from_graph(graph: Graph) -> Set[str]:
     """
@@ -102,8 +131,7 @@ def extract_shacl_classes_from_file(shacl_file: str) -> Set[str]:
         Set of lowercase target class local names
     """
     shacl_classes = set()
-    shacl_graph = Graph()
-    shacl_graph.parse(shacl_file, format="turtle")
+    shacl_graph = read_graph(Path(shacl_file))
 
     for cls in shacl_graph.objects(None, SH.targetClass):
         local_name = get_local_name(str(cls), lowercase=True)
@@ -143,8 +171,7 @@ def extract_ontology_classes(ontology_file: str) -> Tuple[Set[str], Dict[str, st
         - classes: Set of lowercase class local names
         - label_to_class: Dict mapping lowercase rdfs:label to class name
     """
-    ontology_graph = Graph()
-    ontology_graph.parse(ontology_file, format="turtle")
+    ontology_graph = read_graph(Path(ontology_file))
 
     ontology_classes = extract_classes_from_graph(ontology_graph)
 
@@ -158,10 +185,76 @@ def extract_ontology_classes(ontology_file: str) -> Tuple[Set[str], Dict[str, st
     return ontology_classes, label_to_class
 
 
+def _base_catalog_hash(resolver: RegistryResolver) -> str:
+    """
+    Return a SHA-256 over the imports catalog and the base ontology files.
+
+    The hash is computed once per process and set of file stamps (mtime,
+    size); later calls only stat the files.
+    """
+    rel_paths = [Path("imports") / "catalog-v001.xml"]
+    rel_paths.extend(Path(p) for p in resolver.get_base_ontology_paths())
+    abs_paths = [resolver.to_absolute(rel_path) for rel_path in rel_paths]
+
+    stamps_key = tuple((str(p), *file_stamp(p)) for p in abs_paths)
+    catalog_hash = _catalog_hashes.get(stamps_key)
+    if catalog_hash is not None:
+        return catalog_hash
+
+    digest = hashlib.sha256(f"{BASE_CLASSES_CACHE_VERSION}\n".encode("utf-8"))
+    for rel_path, abs_path in zip(rel_paths, abs_paths):
+        digest.update(f"{rel_path.as_posix()}\n".encode("utf-8"))
+        try:
+            digest.update(abs_path.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+        digest.update(b"\n")
+    catalog_hash = digest.hexdigest()
+    _catalog_hashes[stamps_key] = catalog_hash
+    return catalog_hash
+
+
+def _read_base_classes(cache_file: Path, catalog_hash: str) -> Optional[Set[str]]:
+    """Return the persisted base class set if it matches the catalog hash."""
+    try:
+        record = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(record, dict)
+        or record.get("version") != BASE_CLASSES_CACHE_VERSION
+        or record.get("catalog_hash") != catalog_hash
+    ):
+        return None
+    return set(record.get("classes", []))
+
+
+def _write_base_classes(
+    cache_file: Path, catalog_hash: str, base_classes: Set[str]
+) -> None:
+    """Persist the base class set atomically (temp file + rename)."""
+    record = {
+        "version": BASE_CLASSES_CACHE_VERSION,
+        "catalog_hash": catalog_hash,
+        "classes": sorted(base_classes),
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(
+            cache_file,
+            lambda p: p.write_text(json.dumps(record, indent=2), encoding="utf-8"),
+        )
+    except OSError as e:
+        logger.debug("Could not write %s: %s", cache_file, e)
+
+
 def get_base_ontology_classes(resolver: RegistryResolver, root_dir: Path) -> Set[str]:
     """
     Load classes from base ontologies listed in imports/catalog-v001.xml.
 
+    The set is computed once per catalog hash: later calls in the same
+    process (one per domain) and later runs reuse it.
+
     Args:
         resolver: RegistryResolver instance
         root_dir: Repository root directory
@@ -169,18 +262,30 @@ def get_base_ontology_classes(resolver: RegistryResolver, root_dir: Path) -> Set
     Returns:
         Set of lowercase class local names from base ontologies
     """
-    base_classes = set()
-    for rel_path in resolver.get_base_ontology_paths():
-        abs_path = resolver.to_absolute(rel_path)
-        if not abs_path.exists():
-            continue
-        try:
-            g = Graph()
-            g.parse(str(abs_path), format="turtle")
-            base_classes.update(extract_classes_from_graph(g))
-        except Exception:
-            # Silently ignore parsing errors in base ontologies
-            pass
+    catalog_hash = _base_catalog_hash(resolver)
+    if catalog_hash in _base_classes:
+        return set(_base_classes[catalog_hash])
+
+    cache_file = Path(root_dir) / BASE_CLASSES_CACHE_PATH
+    use_cache = not env_disabled(BASE_CLASSES_CACHE_ENV)
+    base_classes = _read_base_classes(cache_file, catalog_hash) if use_cache else None
+
+    if base_classes is None:
+        base_classes = set()
+        for rel_path in resolver.get_base_ontology_paths():
+            abs_path = resolver.to_absolute(rel_path)
+            if not abs_path.exists():
+                continue
+            try:
+                g = read_graph(abs_path, root_dir)
+                base_classes.update(extract_classes_from_graph(g))
+            except Exception:
+                # Silently ignore parsing errors in base ontologies
+                pass
+        if use_cache:
+            _write_base_classes(cache_file, catalog_hash, base_classes)
+
+    _base_classes[catalog_hash] = frozenset(base_classes)
     return base_classes
 
 
@@ -205,7 +310,7 @@ def validate_artifact_coherence(
         Tuple of (return_code, message) where return_code is 0 for success
     """
     root_dir = root_dir or Path.cwd()
-    resolver = RegistryResolver(root_dir)
+    resolver = get_registry_resolver(root_dir)
 
     ontology_rel = resolver.get_ontology_path(domain)
     shacl_rels = resolver.get_shacl_paths(domain)
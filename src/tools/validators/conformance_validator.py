@@ -5,6 +5,7 @@ Conformance Validator - SHACL-based Data Conformance Validation
 FEATURE SET:
 ============
 1. validate_data_conformance - Main validation entry point
+   (run_data_conformance returns the full ValidationResult instead)
 2. collect_jsonld_files - Collect JSON-LD files for validation
 3. ShaclValidator integration - Uses modular SHACL validation pipeline
 
@@ -34,6 +35,9 @@ NOTES:
 - Uses registry-based discovery for ontologies and SHACL shapes
 - Supports RDFS inference before validation
 - Oxigraph optimization when available
+- --metrics-out FILE appends wall/CPU time and memory per stage (load_data,
+  schema_discovery, inference, validation, formatting), triples per graph
+  and files parsed as one JSON line per run
 """
 
 import argparse
@@ -51,6 +55,9 @@ from src.tools.validators.shacl.validator import (
 from src.tools.validators.shacl.validator import (  # noqa: F401
     ValidationResult as ShaclValidationResult,
 )
+from src.tools.validators.shacl.validator import (
+    run_data_conformance as _run_data_conformance,
+)
 from src.tools.validators.shacl.validator import (
     validate_data_conformance as _validate_data_conformance,
 )
@@ -79,6 +86,7 @@ def validate_data_conformance(
     inference_mode: str = "rdfs",
     debug: bool = False,
     logfile: Optional[Path] = None,
+    metrics_out: Optional[Path] = None,
 ) -> Tuple[int, str]:
     """
     Validate JSON-LD files against SHACL shapes.
@@ -92,12 +100,41 @@ def validate_data_conformance(
         inference_mode: Inference mode (rdfs|owlrl|none|both)
         debug: Enable debug logging
         logfile: Optional log file path
+        metrics_out: Optional JSON Lines file receiving per-stage metrics
 
     Returns:
         Tuple of (return_code, output_message)
     """
     return _validate_data_conformance(
-        jsonld_files, root_dir, inference_mode, debug, logfile
+        jsonld_files, root_dir, inference_mode, debug, logfile, metrics_out
+    )
+
+
+def run_data_conformance(
+    jsonld_files: List[Path],
+    root_dir: Path,
+    inference_mode: str = "rdfs",
+    debug: bool = False,
+    logfile: Optional[Path] = None,
+    metrics_out: Optional[Path] = None,
+) -> Tuple[ShaclValidationResult, str]:
+    """
+    Validate JSON-LD files like validate_data_conformance().
+
+    Args:
+        jsonld_files: List of JSON-LD files to validate
+        root_dir: Repository root directory
+        inference_mode: Inference mode (rdfs|owlrl|none|both)
+        debug: Enable debug logging
+        logfile: Optional log file path
+        metrics_out: Optional JSON Lines file receiving per-stage metrics
+
+    Returns:
+        Tuple of (SHACL ValidationResult, output_message); the result also
+        lists the schema files the data was validated against
+    """
+    return _run_data_conformance(
+        jsonld_files, root_dir, inference_mode, debug, logfile, metrics_out
     )
 
 
@@ -146,6 +183,7 @@ def validate_files(
         triples_count=result.triples_count,
         inferred_count=result.inferred_count,
         duration_seconds=result.duration_seconds,
+        metrics=result.metrics,
     )
 
 
@@ -215,6 +253,11 @@ def main():
     )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--logfile", type=Path, help="Write detailed logs to file")
+    parser.add_argument(
+        "--metrics-out",
+        type=Path,
+        help="Append per-stage timing and memory metrics (JSON Lines) to file",
+    )
     parser.add_argument("--test", action="store_true", help="Run self-tests")
 
     args = parser.parse_args()
@@ -236,7 +279,12 @@ def main():
 
     # Run validation
     return_code, _ = validate_data_conformance(
-        jsonld_files, args.root.resolve(), args.inference, args.debug, args.logfile
+        jsonld_files,
+        args.root.resolve(),
+        args.inference,
+        args.debug,
+        args.logfile,
+        args.metrics_out,
     )
 
     sys.exit(return_code)
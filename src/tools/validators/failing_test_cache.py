@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Failing Test Cache - Skip Unchanged Negative Tests
+
+Remembers which failing tests (tests/data/<domain>/invalid/) produced their
+.expected output, together with content hashes of everything the outcome
+depends on. check-failing-tests skips a test when none of these inputs
+changed since it last passed.
+
+FEATURE SET:
+============
+1. FailingTestCache - On-disk record of passed failing tests and their inputs
+2. get_failing_test_cache - Return the cache for a repository root (or None)
+3. get_tool_version - Fingerprint of the validation tooling and its libraries
+
+USAGE:
+======
+    from src.tools.validators.failing_test_cache import get_failing_test_cache
+
+    cache = get_failing_test_cache(root_dir)
+    if cache and cache.lookup(test_file, expected_file):
+        ...  # passed before with identical inputs
+    else:
+        ...  # validate and compare with the .expected output
+        cache.store(test_file, expected_file, dependencies)
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.validators.failing_test_cache [--test] [--clear]
+
+DEPENDENCIES:
+=============
+- hashlib, json (stdlib): Content hashes and cache records
+- src.tools.core.file_utils: Memoized file hashes and atomic writes
+
+NOTES:
+======
+- A cache entry is only valid if the SHA-256 hashes of all of these are
+  unchanged:
+    * the test file and its .expected file
+    * the ontology and SHACL files resolved for the test
+    * the catalogs and fixture files
+    * the tool version (src/tools sources, project, rdflib and pyshacl versions)
+- File hashes are memoized per (mtime, size) for the whole process, and the
+  tool version is computed once per process and repository root, so
+  repeated lookups only stat the inputs of unchanged tests.
+- Only passing results are stored; a test that fails is always re-run.
+- Set ONTOLOGY_TEST_CACHE=0 to disable the cache (e.g. for debugging).
+- Writes are atomic (temp file + rename), so parallel workers are safe.
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+import tempfile
+import tomllib
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from src.tools.core.constants import env_disabled
+from src.tools.core.file_utils import atomic_write, file_sha256
+from src.tools.core.logging import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+# Navigate up from src/tools/validators to the repo root
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+# Default cache directory (relative to repository root)
+FAILING_TEST_CACHE_DIRNAME = ".failing_test_cache"
+
+# Environment variable to disable the cache ("0", "false", "no", "off")
+FAILING_TEST_CACHE_ENV = "ONTOLOGY_TEST_CACHE"
+
+# Bump when the record layout changes
+CACHE_FORMAT_VERSION = 1
+
+_tool_versions: Dict[Path, str] = {}
+
+
+def get_tool_version(root_dir: Path = ROOT_DIR) -> str:
+    """
+    Return a fingerprint of the validation tooling (computed once per process).
+
+    Combines the project version, the rdflib and pyshacl versions and a hash
+    of all Python sources below src/tools, so that any change to the tools
+    invalidates cached results.
+
+    Args:
+        root_dir: Repository root directory
+
+    Returns:
+        SHA-256 hex digest identifying the tool version
+    """
+    root_dir = Path(root_dir).resolve()
+    if root_dir in _tool_versions:
+        return _tool_versions[root_dir]
+
+    import pyshacl
+    import rdflib
+
+    digest = hashlib.sha256()
+    try:
+        with (root_dir / "pyproject.toml").open("rb") as f:
+            project_version = tomllib.load(f).get("project", {}).get("version", "")
+    except (OSError, tomllib.TOMLDecodeError):
+        project_version = ""
+    for part in (project_version, rdflib.__version__, pyshacl.__version__):
+        digest.update(f"{part}\n".encode("utf-8"))
+
+    tools_dir = root_dir / "src" / "tools"
+    for source in sorted(tools_dir.rglob("*.py")):
+        digest.update(source.relative_to(root_dir).as_posix().encode("utf-8"))
+        digest.update((file_sha256(source) or "").encode("utf-8"))
+
+    _tool_versions[root_dir] = digest.hexdigest()
+    return _tool_versions[root_dir]
+
+
+class FailingTestCache:
+    """
+    Persistent record of failing tests that produced their expected output.
+
+    Each test gets one JSON record (keyed by its absolute path) holding the
+    tool version and the content hashes of all its inputs.
+
+    Usage:
+        cache = FailingTestCache(root_dir / ".failing_test_cache", root_dir)
+        if not cache.lookup(test_file, expected_file):
+            ...
+    """
+
+    def __init__(self, cache_dir: Path, root_dir: Path = ROOT_DIR):
+        """
+        Initialize the failing test cache.
+
+        Args:
+            cache_dir: Directory holding the cache records
+            root_dir: Repository root (for the tool version and relative paths)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.root_dir = Path(root_dir).resolve()
+        self.hits = 0
+        self.misses = 0
+
+    def _record_path(self, test_file: Path) -> Path:
+        key = hashlib.sha256(str(test_file).encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json"
+
+    def _key(self, path: Path) -> str:
+        """Return the repository-relative POSIX path used in records."""
+        try:
+            return path.relative_to(self.root_dir).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def lookup(self, test_file: Path, expected_file: Path) -> bool:
+        """
+        Check whether a failing test passed before with identical inputs.
+
+        Args:
+            test_file: Failing test JSON-LD file
+            expected_file: Its .expected output file
+
+        Returns:
+            True if the test can be skipped
+        """
+        test_file = Path(test_file).resolve()
+        record_path = self._record_path(test_file)
+        try:
+            record = json.loads(record_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            record = None
+
+        if (
+            record is None
+            or record.get("version") != CACHE_FORMAT_VERSION
+            or record.get("tool_version") != get_tool_version(self.root_dir)
+            or record.get("test") != file_sha256(test_file)
+            or record.get("expected") != file_sha256(Path(expected_file))
+            or any(
+                file_sha256(self.root_dir / rel_path) != content_hash
+                for rel_path, content_hash in record.get("dependencies", {}).items()
+            )
+        ):
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        return True
+
+    def store(
+        self, test_file: Path, expected_file: Path, dependencies: Iterable[Path]
+    ) -> None:
+        """
+        Record that a failing test produced its expected output.
+
+        Args:
+            test_file: Failing test JSON-LD file
+            expected_file: Its .expected output file
+            dependencies: Other files the outcome depends on (schemas,
+                catalogs, fixtures)
+        """
+        test_file = Path(test_file).resolve()
+        record = {
+            "version": CACHE_FORMAT_VERSION,
+            "source": test_file.as_posix(),
+            "tool_version": get_tool_version(self.root_dir),
+            "test": file_sha256(test_file),
+            "expected": file_sha256(Path(expected_file)),
+            "dependencies": {
+                self._key(Path(dep).absolute()): file_sha256(Path(dep))
+                for dep in sorted({str(d) for d in dependencies})
+            },
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write(
+            self._record_path(test_file),
+            lambda p: p.write_text(json.dumps(record, indent=2), encoding="utf-8"),
+        )
+
+    def clear(self) -> None:
+        """Remove all cache records."""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+
+def get_failing_test_cache(root_dir: Path) -> Optional[FailingTestCache]:
+    """
+    Return the failing test cache for a repository root.
+
+    Args:
+        root_dir: Repository root directory
+
+    Returns:
+        FailingTestCache below root_dir, or None if disabled via ONTOLOGY_TEST_CACHE
+    """
+    if env_disabled(FAILING_TEST_CACHE_ENV):
+        return None
+    return FailingTestCache(Path(root_dir) / FAILING_TEST_CACHE_DIRNAME, root_dir)
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    print("Running failing_test_cache self-tests...")
+    all_passed = True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        test_file = tmppath / "fail01.json"
+        expected_file = tmppath / "fail01.expected"
+        schema_file = tmppath / "domain.shacl.ttl"
+        test_file.write_text('{"@id": "urn:test"}')
+        expected_file.write_text("Validation FAILED")
+        schema_file.write_text("# shapes\n")
+        cache = FailingTestCache(tmppath / "cache", tmppath)
+
+        # Test 1: Unknown test is a miss
+        if cache.lookup(test_file, expected_file):
+            print("FAIL: Empty cache should miss")
+            all_passed = False
+        else:
+            print("PASS: Empty cache misses")
+
+        # Test 2: Stored test is a hit
+        cache.store(test_file, expected_file, [schema_file])
+        if not cache.lookup(test_file, expected_file):
+            print("FAIL: Stored test should hit")
+            all_passed = False
+        else:
+            print("PASS: Stored test hits")
+
+        # Test 3: Changed dependency invalidates the entry
+        schema_file.write_text("# changed shapes\n")
+        if cache.lookup(test_file, expected_file):
+            print("FAIL: Changed dependency should invalidate entry")
+            all_passed = False
+        else:
+            print("PASS: Changed dependency invalidates entry")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main():
+    """CLI entry point for failing_test_cache."""
+    parser = argparse.ArgumentParser(description="Manage the failing test cache")
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+    parser.add_argument("--clear", action="store_true", help="Remove all entries")
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=ROOT_DIR,
+        help="Repository root (default: this repository)",
+    )
+
+    args = parser.parse_args()
+
+    if args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    cache = FailingTestCache(args.root / FAILING_TEST_CACHE_DIRNAME, args.root)
+    if args.clear:
+        cache.clear()
+        print(f"Cleared {cache.cache_dir}")
+        return
+
+    records = list(cache.cache_dir.glob("*.json")) if cache.cache_dir.exists() else []
+    print(f"{cache.cache_dir}: {len(records)} cached failing tests")
+
+
+if __name__ == "__main__":
+    main()
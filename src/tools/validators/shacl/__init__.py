@@ -17,6 +17,8 @@ shapes are needed based on the types present in the instance data.
 Components:
     - utils.graph_loader: JSON-LD and Turtle graph loading
     - inference: RDFS inference engine
+    - compiled_shapes: Per-process cache of compiled pyshacl shapes graphs
+    - shape_pruning: Selection of the shapes whose targets occur in the data
     - schema_discovery: Type-to-schema mapping using RegistryResolver
     - validator: Main validation orchestrator
 
@@ -29,6 +31,10 @@ Entry point:
     if not result.conforms:
         print(result.report_text)
 
+    # Per-file results with one schema load for all files
+    for result in validator.validate_many(files):
+        print(result.files_validated, result.conforms)
+
 See also:
     - src.tools.utils.registry_resolver: Catalog-based path resolution
     - artifacts/catalog-v001.xml
@@ -42,7 +48,8 @@ from src.tools.utils.graph_loader import (
     load_turtle_files,
 )
 
-from .inference import apply_rdfs_inference
+from .compiled_shapes import CompiledShapes, get_compiled_shapes
+from .inference import apply_rdfs_inference, rdfs_inference_overlay
 from .schema_discovery import discover_required_schemas, get_base_ontology_paths
 from .validator import ShaclValidator, ValidationResult
 
@@ -51,6 +58,9 @@ __all__ = [
     "load_turtle_files",
     "load_fixtures_for_iris",
     "apply_rdfs_inference",
+    "rdfs_inference_overlay",
+    "CompiledShapes",
+    "get_compiled_shapes",
     "discover_required_schemas",
     "get_base_ontology_paths",
     "ShaclValidator",
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Precompiled SHACL shapes reused across pyshacl validation runs.
+
+pyshacl.validate() wraps the raw SHACL graph in a new ShapesGraph on every
+call and harvests all shape objects again. This module keeps one compiled
+ShapesGraph per set of SHACL files for the lifetime of the process, so that
+validating many instance files of the same domain (or domains sharing the
+same shapes) compiles the shapes only once.
+
+Key points:
+  - Cache key is the sorted tuple of SHACL file paths
+  - Entries are invalidated when any SHACL file's mtime or size changes
+  - Validation mirrors pyshacl.validate() for in-memory rdflib graphs
+  - for_data() returns the shapes pruned to those relevant for a data graph
+    (see shape_pruning), compiled once per set of relevant shapes
+  - Shapes are harvested lazily, so a shape set that is only used pruned
+    is never harvested in full
+  - Relies on pyshacl internals (pyshacl >= 0.40); when they cannot be
+    imported, validate() falls back to plain pyshacl.validate()
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, FrozenSet, List, Optional, Tuple
+
+from rdflib import Graph
+from rdflib.namespace import SH
+from rdflib.term import Node
+
+from src.tools.core.file_utils import file_stamps
+from src.tools.core.logging import get_logger
+
+from .shape_pruning import ShapeIndex
+
+# Module logger
+logger = get_logger(__name__)
+
+# Try to import pyshacl (plain validate() is the fallback for the internals)
+try:
+    from pyshacl import validate as pyshacl_validate
+except ImportError:
+    pyshacl_validate = None
+
+# Try to import pyshacl internals
+try:
+    from pyshacl.errors import ValidationFailure
+    from pyshacl.graph_abstraction import DataGraph
+    from pyshacl.monkey import apply_patches
+    from pyshacl.shapes_graph import ShapesGraph
+    from pyshacl.validator import Validator, assign_baked_in
+
+    PYSHACL_AVAILABLE = True
+except ImportError:
+    PYSHACL_AVAILABLE = False
+
+# Maximum number of compiled shape sets kept per process
+COMPILED_SHAPES_CACHE_SIZE = 16
+
+# Maximum number of pruned shape sets kept per compiled shape set
+PRUNED_SHAPES_CACHE_SIZE = 32
+
+ShapesKey = Tuple[str, ...]
+
+_compiled_shapes_cache: "OrderedDict[ShapesKey, CompiledShapes]" = OrderedDict()
+_pyshacl_prepared = False
+
+
+def _prepare_pyshacl() -> None:
+    """Apply pyshacl's rdflib patches and baked-in graphs (once per process)."""
+    global _pyshacl_prepared
+    if PYSHACL_AVAILABLE and not _pyshacl_prepared:
+        apply_patches()
+        assign_baked_in()
+        _pyshacl_prepared = True
+
+
+def shapes_have_rules(shacl_graph: Graph) -> bool:
+    """Check whether a shapes graph uses SHACL rules (which modify the data)."""
+    return (None, SH.rule, None) in shacl_graph
+
+
+class CompiledShapes:
+    """
+    SHACL shapes graph with pre-harvested pyshacl shape objects.
+
+    Usage:
+        compiled = CompiledShapes(shacl_graph, shacl_files)
+        conforms, report_graph, report_text = compiled.validate(data_graph)
+
+        # Only the shapes whose targets occur in the (inferred) data
+        compiled.for_data(data_graph).validate(data_graph)
+    """
+
+    def __init__(self, shacl_graph: Graph, sources: Optional[List[Path]] = None):
+        """
+        Compile a SHACL graph.
+
+        Args:
+            shacl_graph: Graph with the SHACL shapes
+            sources: SHACL files the graph was loaded from (for staleness checks)
+        """
+        _prepare_pyshacl()
+        self.graph = shacl_graph
+        self.sources = [Path(s) for s in (sources or [])]
+        self._stamps = file_stamps(self.sources)
+        self.has_rules = shapes_have_rules(shacl_graph)
+        self._shapes_graph: Optional["ShapesGraph"] = None
+        self._shape_index: Optional[ShapeIndex] = None
+        self._pruned: "OrderedDict[FrozenSet[Node], CompiledShapes]" = OrderedDict()
+
+    @property
+    def shapes_graph(self) -> "ShapesGraph":
+        """pyshacl ShapesGraph with all shapes harvested (built on first use)."""
+        if self._shapes_graph is None:
+            self._shapes_graph = ShapesGraph(self.graph)
+            # Accessing .shapes triggers the (expensive) shape harvest
+            logger.debug("Compiled %d SHACL shapes", len(self._shapes_graph.shapes))
+        return self._shapes_graph
+
+    @property
+    def shape_index(self) -> ShapeIndex:
+        """Targets of all shapes, for pruning (built on first use)."""
+        if self._shape_index is None:
+            self._shape_index = ShapeIndex(self.graph)
+        return self._shape_index
+
+    def for_data(self, data_graph: Graph) -> "CompiledShapes":
+        """
+        Return the shapes that can produce results for a data graph.
+
+        The data graph must already contain its inferred types, so the
+        result must not be used with pyshacl inference. Shape sets with
+        SHACL rules are never pruned, as rules may add new targets.
+
+        Args:
+            data_graph: Graph that is going to be validated
+
+        Returns:
+            CompiledShapes of the relevant shapes (self if nothing is pruned)
+        """
+        if self.has_rules:
+            return self
+
+        index = self.shape_index
+        roots = index.relevant_shapes(data_graph)
+        if len(roots) >= len(index.targeted):
+            return self
+
+        pruned = self._pruned.get(roots)
+        if pruned is None:
+            pruned = CompiledShapes(index.extract(roots))
+            logger.debug(
+                "Pruned SHACL shapes to %d of %d targeted shapes (%d triples)",
+                len(roots),
+                len(index.targeted),
+                len(pruned.graph),
+            )
+            self._pruned[roots] = pruned
+            while len(self._pruned) > PRUNED_SHAPES_CACHE_SIZE:
+                self._pruned.popitem(last=False)
+        else:
+            self._pruned.move_to_end(roots)
+        return pruned
+
+    def is_current(self) -> bool:
+        """Check whether the source files are unchanged since compilation."""
+        return file_stamps(self.sources) == self._stamps
+
+    def validate(
+        self,
+        data_graph: Graph,
+        ont_graph: Optional[Graph] = None,
+        inference: Optional[str] = None,
+        advanced: bool = True,
+        abort_on_first: bool = False,
+        inplace: bool = False,
+    ) -> Tuple[bool, Graph, str]:
+        """
+        Validate a data graph against the compiled shapes.
+
+        Args:
+            data_graph: Graph to validate
+            ont_graph: Optional ontology graph mixed in by pyshacl
+            inference: pyshacl inference option (rdfs|owlrl|both|None)
+            advanced: Enable SHACL advanced features
+            abort_on_first: Stop at the first failing shape
+            inplace: Validate the data graph directly instead of a clone;
+                only safe for caller-owned graphs, as pyshacl may add triples
+
+        Returns:
+            Tuple of (conforms, report_graph, report_text), as pyshacl.validate()
+        """
+        if not PYSHACL_AVAILABLE:
+            # pyshacl internals changed: compile the shapes on every call
+            return pyshacl_validate(
+                data_graph,
+                shacl_graph=self.graph,
+                ont_graph=ont_graph,
+                inference=inference,
+                abort_on_first=abort_on_first,
+                advanced=advanced,
+                js=False,
+                meta_shacl=False,
+                inplace=inplace,
+            )
+
+        options = {
+            "debug": False,
+            "inference": inference,
+            "inplace": inplace,
+            "abort_on_first": abort_on_first,
+            "allow_infos": False,
+            "allow_warnings": False,
+            "advanced": advanced,
+            "iterate_rules": False,
+            "use_js": False,
+            "sparql_mode": False,
+            "logger": logger,
+            "focus_nodes": None,
+            "use_shapes": None,
+        }
+        try:
+            validator = Validator(
+                DataGraph.from_rdflib(data_graph),
+                shacl_graph=self.graph,
+                ont_graph=ont_graph,
+                options=options,
+            )
+            # Swap in the precompiled shapes instead of the fresh ShapesGraph
+            validator.shacl_graph = self.shapes_graph
+            return validator.run()
+        except ValidationFailure as e:
+            return False, e, f"Validation Failure - {e.message}"
+
+
+def get_compiled_shapes(
+    shacl_files: List[Path], loader: Callable[[List[Path]], Graph]
+) -> CompiledShapes:
+    """
+    Return the compiled shapes for a set of SHACL files.
+
+    Args:
+        shacl_files: Absolute paths of the SHACL files
+        loader: Function loading the files into a graph on a cache miss
+
+    Returns:
+        CompiledShapes shared by all callers using the same SHACL files
+    """
+    key: ShapesKey = tuple(sorted(str(f) for f in shacl_files))
+
+    compiled = _compiled_shapes_cache.get(key)
+    if compiled is not None and compiled.is_current():
+        _compiled_shapes_cache.move_to_end(key)
+        return compiled
+
+    compiled = CompiledShapes(loader(list(shacl_files)), shacl_files)
+    logger.debug("Loaded SHACL shapes from %d files", len(key))
+
+    _compiled_shapes_cache[key] = compiled
+    _compiled_shapes_cache.move_to_end(key)
+    while len(_compiled_shapes_cache) > COMPILED_SHAPES_CACHE_SIZE:
+        _compiled_shapes_cache.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_shapes() -> None:
+    """Drop all compiled shapes held by this process."""
+    _compiled_shapes_cache.clear()
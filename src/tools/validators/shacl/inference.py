@@ -1,19 +1,32 @@
 #!/usr/bin/env python3
 """
-RDFS inference engine with optimized SPARQL.
+RDFS inference engine based on precomputed schema closures.
 
-This module provides RDFS inference using iterative SPARQL updates,
-which is faster than the owlrl library for typical ontology sizes.
+This module provides RDFS inference (subClassOf, subPropertyOf, domain and
+range entailment) without evaluating SPARQL updates over the merged graph.
 
 Key optimizations:
-  - Uses iterative approach instead of transitive closure operators
-  - Avoids O(N³) worst case for deep hierarchies
-  - Stops early when no new triples are inferred
+  - subClassOf/subPropertyOf closures are computed once from the schema
+    triples and kept as Python dicts (RdfsClosure)
+  - Data triples are entailed in a single pass, linear in the data size
+  - Entailments of the ontology's own triples only depend on the ontology
+    and are cached per ontology graph
+  - rdfs_inference_overlay() validates against a cached default-store copy
+    of the entailed ontology instead of copying it into every data graph
+  - get_ontology_module() reduces the ontology to the axioms reachable from
+    the terms of the data (cached per signature), so the closures and the
+    entailed copy only cover what the data can use
+  - The SPARQL-based engines remain available for comparison
 """
 
-from typing import Tuple
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, Iterator, Set, Tuple
 
-from rdflib import Graph
+from rdflib import RDF, RDFS, BNode, Graph, URIRef
+from rdflib.term import Node
 
 from src.tools.core.constants import FAST_STORE
 from src.tools.core.logging import get_logger
@@ -86,6 +99,389 @@ RDFS_RULES_SINGLE_PASS = [
 ]
 
 
+Triple = Tuple[Node, Node, Node]
+
+# Schema predicates that feed the closures
+SCHEMA_PREDICATES = (
+    RDFS.subClassOf,
+    RDFS.subPropertyOf,
+    RDFS.domain,
+    RDFS.range,
+)
+
+# Predicates followed from a term to the axioms its entailments depend on
+MODULE_PREDICATES = frozenset({RDF.type, *SCHEMA_PREDICATES})
+
+# Maximum number of ontology modules kept per ontology graph
+ONTOLOGY_MODULE_CACHE_SIZE = 32
+
+# Ontology modules per ontology graph (dropped with the graph)
+# Values: [graph size, OrderedDict of signature -> module graph]
+_ontology_modules: "weakref.WeakKeyDictionary[Graph, list]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Closure and ontology entailments per ontology graph (dropped with the graph)
+# Values: [max_depth, graph size, closure, entailed triples, entailed graph]
+_ontology_index: "weakref.WeakKeyDictionary[Graph, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _bounded_closure(
+    direct: Dict[Node, Set[Node]], max_depth: int
+) -> Dict[Node, Set[Node]]:
+    """
+    Compute all ancestors reachable within max_depth steps.
+
+    Args:
+        direct: Mapping of node -> direct parents
+        max_depth: Maximum number of hops (mirrors the SPARQL iteration limit)
+
+    Returns:
+        Mapping of node -> ancestors (excluding the node itself)
+    """
+    closure = {}
+    for node in direct:
+        seen: Set[Node] = set()
+        frontier = {node}
+        for _ in range(max_depth):
+            frontier = {
+                parent
+                for child in frontier
+                for parent in direct.get(child, ())
+                if parent not in seen
+            }
+            if not frontier:
+                break
+            seen |= frontier
+        seen.discard(node)
+        if seen:
+            closure[node] = seen
+    return closure
+
+
+class RdfsClosure:
+    """
+    Precomputed RDFS schema closures used for single-pass entailment.
+
+    Usage:
+        closure = RdfsClosure.from_graphs(ontology_graph)
+        inferred = closure.entail(data_graph)
+    """
+
+    def __init__(
+        self,
+        schema_triples: Iterable[Triple],
+        max_depth: int = MAX_ITERATIONS,
+    ):
+        """
+        Build the closures from schema triples.
+
+        Args:
+            schema_triples: rdfs:subClassOf/subPropertyOf/domain/range triples
+            max_depth: Maximum hierarchy depth followed by the closures
+        """
+        sub_class: Dict[Node, Set[Node]] = {}
+        sub_property: Dict[Node, Set[Node]] = {}
+        self.domains: Dict[Node, Set[Node]] = {}
+        self.ranges: Dict[Node, Set[Node]] = {}
+
+        targets = {
+            RDFS.subClassOf: sub_class,
+            RDFS.subPropertyOf: sub_property,
+            RDFS.domain: self.domains,
+            RDFS.range: self.ranges,
+        }
+        for s, p, o in schema_triples:
+            target = targets.get(p)
+            if target is not None:
+                target.setdefault(s, set()).add(o)
+
+        self.superclasses = _bounded_closure(sub_class, max_depth)
+        self.superproperties = _bounded_closure(sub_property, max_depth)
+
+    @classmethod
+    def from_graphs(cls, *graphs: Graph, max_depth: int = MAX_ITERATIONS):
+        """Build the closures from the schema triples of one or more graphs."""
+        return cls(
+            (
+                triple
+                for graph in graphs
+                for predicate in SCHEMA_PREDICATES
+                for triple in graph.triples((None, predicate, None))
+            ),
+            max_depth=max_depth,
+        )
+
+    def entail(self, triples: Iterable[Triple]) -> Set[Triple]:
+        """
+        Entail RDFS consequences of a set of triples in a single pass.
+
+        The rule order of the SPARQL engine is preserved: subPropertyOf and
+        subClassOf are closed first, then rdfs:domain and rdfs:range are
+        applied once to the closed triples (domain before range).
+
+        Args:
+            triples: Triples to entail (typically the data graph)
+
+        Returns:
+            Set of entailed triples (may include already asserted ones)
+        """
+        superproperties = self.superproperties
+        superclasses = self.superclasses
+        domains = self.domains
+        ranges = self.ranges
+        type_ranges = ranges.get(RDF.type, ())
+
+        triples = list(triples)
+        closed: Set[Triple] = set()
+        typed = []
+
+        # subPropertyOf closure, remembering rdf:type assertions
+        for s, p, o in triples:
+            for q in (p, *superproperties.get(p, ())):
+                if q is not p:
+                    closed.add((s, q, o))
+                if q == RDF.type:
+                    typed.append((s, o))
+
+        # subClassOf closure (derived types also get rdf:type superproperties)
+        type_closure = (RDF.type, *superproperties.get(RDF.type, ()))
+        for s, cls in typed:
+            for parent in superclasses.get(cls, ()):
+                for q in type_closure:
+                    closed.add((s, q, parent))
+
+        # domain and range over asserted + closed triples (single pass)
+        inferred = set(closed)
+        domain_types = []
+        for s, p, o in chain(triples, closed):
+            for cls in domains.get(p, ()):
+                inferred.add((s, RDF.type, cls))
+                domain_types.append(cls)
+            if isinstance(o, URIRef):
+                for cls in ranges.get(p, ()):
+                    inferred.add((o, RDF.type, cls))
+
+        # The range rule also sees the types added by the domain rule
+        if type_ranges:
+            for cls in domain_types:
+                if isinstance(cls, URIRef):
+                    for range_cls in type_ranges:
+                        inferred.add((cls, RDF.type, range_cls))
+
+        return inferred
+
+
+def _has_schema_triples(graph: Graph) -> bool:
+    """Check whether a graph contains any RDFS schema triples."""
+    return any(
+        True
+        for predicate in SCHEMA_PREDICATES
+        for _ in graph.triples((None, predicate, None))
+    )
+
+
+def _index_ontology(
+    ontology_graph: Graph, max_depth: int
+) -> Tuple[RdfsClosure, Set[Triple]]:
+    """
+    Return the closure of an ontology and the entailments of its own triples.
+
+    Both only depend on the ontology, so they are cached per graph object
+    (invalidated when the graph size changes).
+    """
+    entry = _ontology_entry(ontology_graph, max_depth)
+    return entry[2], entry[3]
+
+
+def _ontology_entry(ontology_graph: Graph, max_depth: int) -> list:
+    """Return the (possibly cached) index entry of an ontology graph."""
+    size = len(ontology_graph)
+    cached = _ontology_index.get(ontology_graph)
+    if cached is not None and cached[:2] == [max_depth, size]:
+        return cached
+
+    closure = RdfsClosure.from_graphs(ontology_graph, max_depth=max_depth)
+    inferred = closure.entail(ontology_graph)
+    entry = [max_depth, size, closure, inferred, None]
+    _ontology_index[ontology_graph] = entry
+    return entry
+
+
+def get_entailed_ontology(
+    ontology_graph: Graph, max_iterations: int = MAX_ITERATIONS
+) -> Graph:
+    """
+    Return a default-store graph with the ontology and its own entailments.
+
+    The graph is built once per ontology graph and cached with it. Callers
+    must not modify it permanently (see rdfs_inference_overlay).
+
+    Args:
+        ontology_graph: Ontology graph with class/property definitions
+        max_iterations: Maximum hierarchy depth followed by the closures
+
+    Returns:
+        Cached graph (default rdflib store) usable directly by pyshacl
+    """
+    entry = _ontology_entry(ontology_graph, max_iterations)
+    if entry[4] is None:
+        entailed = Graph()
+        entailed += ontology_graph
+        entailed.addN((s, p, o, entailed) for s, p, o in entry[3])
+        entry[4] = entailed
+    return entry[4]
+
+
+def module_signature(ontology_graph: Graph, data_graph: Graph) -> FrozenSet[URIRef]:
+    """
+    Return the IRIs of a data graph that are described by the ontology.
+
+    Args:
+        ontology_graph: Ontology graph with class/property definitions
+        data_graph: Data graph whose terms are looked up
+
+    Returns:
+        IRIs used in the data (any position) that are subjects in the ontology
+    """
+    iris = {
+        term for triple in data_graph for term in triple if isinstance(term, URIRef)
+    }
+    return frozenset(iri for iri in iris if (iri, None, None) in ontology_graph)
+
+
+def extract_ontology_module(
+    ontology_graph: Graph, signature: Iterable[URIRef]
+) -> Graph:
+    """
+    Extract the part of an ontology that RDFS inference over a signature uses.
+
+    Starting from the signature, all triples describing a term are kept and
+    the walk continues to the terms they reach via rdf:type, subClassOf,
+    subPropertyOf, domain and range, and into blank nodes (lists,
+    restrictions). The result holds every class/property hierarchy,
+    domain and range axiom the entailments of the data depend on.
+
+    Args:
+        ontology_graph: Ontology graph with class/property definitions
+        signature: Terms used by the data
+
+    Returns:
+        Module graph (default rdflib store)
+    """
+    module = Graph()
+    for prefix, namespace in ontology_graph.namespaces():
+        module.bind(prefix, namespace, override=True, replace=True)
+
+    seen: Set[Node] = set()
+    stack = list(signature)
+    while stack:
+        term = stack.pop()
+        if term in seen:
+            continue
+        seen.add(term)
+        for triple in ontology_graph.triples((term, None, None)):
+            module.add(triple)
+            _, predicate, obj = triple
+            if isinstance(obj, BNode) or (
+                predicate in MODULE_PREDICATES and isinstance(obj, URIRef)
+            ):
+                stack.append(obj)
+    return module
+
+
+def get_ontology_module(ontology_graph: Graph, data_graph: Graph) -> Graph:
+    """
+    Return the (cached) ontology module for the terms of a data graph.
+
+    Modules are cached per ontology graph object and signature, so data
+    files using the same terms share one module, and with it the closures
+    and entailed copy cached by rdfs_inference_overlay.
+
+    Args:
+        ontology_graph: Ontology graph with class/property definitions
+        data_graph: Data graph to infer on
+
+    Returns:
+        Module graph (see extract_ontology_module)
+    """
+    size = len(ontology_graph)
+    entry = _ontology_modules.get(ontology_graph)
+    if entry is None or entry[0] != size:
+        entry = [size, OrderedDict()]
+        _ontology_modules[ontology_graph] = entry
+    modules = entry[1]
+
+    signature = module_signature(ontology_graph, data_graph)
+    module = modules.get(signature)
+    if module is None:
+        module = extract_ontology_module(ontology_graph, signature)
+        logger.debug(
+            "Ontology module: %d terms -> %d of %d triples",
+            len(signature),
+            len(module),
+            size,
+        )
+        modules[signature] = module
+        while len(modules) > ONTOLOGY_MODULE_CACHE_SIZE:
+            modules.popitem(last=False)
+    else:
+        modules.move_to_end(signature)
+    return module
+
+
+@contextmanager
+def rdfs_inference_overlay(
+    data_graph: Graph,
+    ontology_graph: Graph,
+    max_iterations: int = MAX_ITERATIONS,
+) -> Iterator[Tuple[Graph, int]]:
+    """
+    Provide data + ontology + RDFS entailments without copying the ontology.
+
+    The data triples and their entailments are added on top of the cached
+    entailed ontology (get_entailed_ontology) for the duration of the
+    context and removed again afterwards. The yielded graph has exactly the
+    triples of apply_rdfs_inference()'s combined graph, but only the data
+    side is materialized per call.
+
+    Not thread-safe: the overlay temporarily modifies the shared graph.
+
+    Args:
+        data_graph: Data graph to infer on
+        ontology_graph: Ontology graph with class/property definitions
+        max_iterations: Maximum hierarchy depth followed by the closures
+
+    Yields:
+        Tuple of (combined_graph, inferred_count)
+    """
+    if _has_schema_triples(data_graph):
+        # Schema triples in the data change the ontology entailments too
+        yield apply_rdfs_inference(
+            data_graph, ontology_graph, max_iterations=max_iterations
+        )
+        return
+
+    closure, _ = _index_ontology(ontology_graph, max_iterations)
+    entailed = get_entailed_ontology(ontology_graph, max_iterations)
+
+    added = {
+        triple
+        for triple in chain(data_graph, closure.entail(data_graph))
+        if triple not in entailed
+    }
+    new_data = sum(1 for triple in data_graph if triple not in ontology_graph)
+
+    entailed.addN((s, p, o, entailed) for s, p, o in added)
+    try:
+        inferred_count = len(entailed) - len(ontology_graph) - new_data
+        logger.debug("RDFS overlay inference: +%d triples", inferred_count)
+        yield entailed, inferred_count
+    finally:
+        for triple in added:
+            entailed.remove(triple)
+
+
 def apply_rdfs_inference(
     data_graph: Graph,
     ontology_graph: Graph,
@@ -93,7 +489,61 @@ def apply_rdfs_inference(
     max_iterations: int = MAX_ITERATIONS,
 ) -> Tuple[Graph, int]:
     """
-    Apply RDFS inference rules to data combined with ontology.
+    Apply RDFS inference to data combined with ontology.
+
+    Schema closures are computed once from the ontology and applied to the
+    data triples in a single pass instead of running SPARQL updates over
+    the merged graph.
+
+    Args:
+        data_graph: Data graph to infer on
+        ontology_graph: Ontology graph with class/property definitions
+        iterate_to_fixpoint: If False, fall back to a single round of the
+            SPARQL rules (faster but incomplete for deep hierarchies)
+        max_iterations: Maximum hierarchy depth followed by the closures
+
+    Returns:
+        Tuple of (combined_graph, inferred_count)
+    """
+    if not iterate_to_fixpoint:
+        return apply_rdfs_inference_sparql(
+            data_graph, ontology_graph, iterate_to_fixpoint=False
+        )
+
+    combined = Graph(store=FAST_STORE)
+    combined += data_graph
+    combined += ontology_graph
+    initial_count = len(combined)
+
+    if _has_schema_triples(data_graph):
+        # Schema triples in the data change the closure for everything
+        closure = RdfsClosure.from_graphs(
+            ontology_graph, data_graph, max_depth=max_iterations
+        )
+        ontology_inferred = closure.entail(ontology_graph)
+    else:
+        closure, ontology_inferred = _index_ontology(ontology_graph, max_iterations)
+
+    data_inferred = closure.entail(data_graph)
+
+    combined.addN(
+        (s, p, o, combined) for s, p, o in chain(ontology_inferred, data_inferred)
+    )
+
+    total_inferred = len(combined) - initial_count
+    logger.debug("RDFS closure inference: +%d triples", total_inferred)
+
+    return combined, total_inferred
+
+
+def apply_rdfs_inference_sparql(
+    data_graph: Graph,
+    ontology_graph: Graph,
+    iterate_to_fixpoint: bool = True,
+    max_iterations: int = MAX_ITERATIONS,
+) -> Tuple[Graph, int]:
+    """
+    Apply RDFS inference rules to data combined with ontology using SPARQL.
 
     This uses iterative SPARQL updates instead of transitive closure
     operators (rdfs:subClassOf+) which can be slow for deep hierarchies.
@@ -165,8 +615,7 @@ def apply_rdfs_inference_transitive(
     This is the original approach using rdfs:subClassOf+ which may be
     slower for deep hierarchies but is simpler to understand.
 
-    Use apply_rdfs_inference() with iterate_to_fixpoint=True for better
-    performance on larger ontologies.
+    Use apply_rdfs_inference() for better performance on larger ontologies.
 
     Args:
         data_graph: Data graph to infer on
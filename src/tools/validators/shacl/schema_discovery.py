@@ -11,7 +11,7 @@ from typing import List, Optional, Set, Tuple
 
 from rdflib import RDF, Graph, Literal
 
-from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.utils.registry_resolver import RegistryResolver, get_registry_resolver
 
 
 def extract_rdf_types(graph: Graph) -> Set[str]:
@@ -69,6 +69,8 @@ def discover_required_schemas(
 
     Uses the registry resolver to find the ontology domains that define
     the given RDF types, then returns paths to their ontology and SHACL files.
+    With an up-to-date docs/schema-index.json this is a lookup of the
+    precomputed per-domain closures (see RegistryResolver.get_domain_closure).
 
     Args:
         rdf_types: Set of rdf:type IRIs found in the data
@@ -77,22 +79,7 @@ def discover_required_schemas(
     Returns:
         Tuple of (ontology_paths, shacl_paths) as repository-relative strings
     """
-    ontology_paths = []
-    shacl_paths = []
-    domains_found = set()
-
-    for rdf_type in rdf_types:
-        domain = resolver.resolve_type_to_domain(rdf_type)
-        if domain and domain not in domains_found:
-            domains_found.add(domain)
-
-            ont_path = resolver.get_ontology_path(domain)
-            if ont_path:
-                ontology_paths.append(ont_path)
-
-            shacl_paths.extend(resolver.get_shacl_paths(domain))
-
-    return sorted(set(ontology_paths)), sorted(set(shacl_paths))
+    return resolver.discover_required_schemas(rdf_types)
 
 
 def get_base_ontology_paths(
@@ -117,7 +104,7 @@ def get_base_ontology_paths(
         List of repository-relative paths to base ontology files
     """
     # Use RegistryResolver to get base ontologies from catalog
-    resolver = RegistryResolver(root_dir)
+    resolver = get_registry_resolver(root_dir)
     if used_iris is None:
         return resolver.get_base_ontology_paths()
     return resolver.get_base_ontology_paths_for_iris(used_iris)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Shape-relevance pruning of SHACL shapes graphs.
+
+pyshacl evaluates every shape of the shapes graph, even when none of its
+targets occur in the data. Large shape sets such as gx.shacl.ttl define
+hundreds of shapes of which a typical instance uses a handful. This module
+selects the shapes that can produce a result for a data graph and extracts
+the subgraph that defines them.
+
+Key points:
+  - Root shapes are those whose targets can match the data graph:
+    sh:targetClass (and implicit class targets) against the rdf:types present
+    including their rdfs:subClassOf superclasses, sh:targetSubjectsOf and
+    sh:targetObjectsOf against the predicates present. Shapes with
+    sh:targetNode or SPARQL-based targets (sh:target) are always kept.
+  - The subgraph holds all triples of the root shapes and everything they
+    reach through blank nodes, sh:node, sh:property, sh:qualifiedValueShape,
+    sh:not and the members of sh:and/sh:or/sh:xone lists
+  - Constraint components, SHACL functions and target types are always
+    kept, since they apply through parameters rather than references
+  - Only valid when the data graph already holds its inferred types; the
+    caller must not prune when pyshacl itself runs inference or SHACL rules
+"""
+
+from typing import FrozenSet, Iterable, Set
+
+from rdflib import OWL, RDF, RDFS, BNode, Graph, URIRef
+from rdflib.namespace import SH
+from rdflib.term import Node
+
+# Predicates through which a shape references other shapes (or their parts)
+SHAPE_REFERENCES = frozenset(
+    {
+        SH.node,
+        SH.property,
+        SH.qualifiedValueShape,
+        SH["not"],
+        SH["and"],
+        SH["or"],
+        SH.xone,
+        SH.prefixes,
+        RDF.first,
+        RDF.rest,
+    }
+)
+
+# Definitions that apply to shapes without being referenced by them
+GLOBAL_DEFINITION_TYPES = (
+    SH.ConstraintComponent,
+    SH.Function,
+    SH.SPARQLFunction,
+    SH.TargetType,
+    SH.SPARQLTargetType,
+)
+
+# Shape types that make an rdfs:Class an implicit class target
+SHAPE_TYPES = (SH.NodeShape, SH.PropertyShape)
+
+
+def _superclass_closure(graph: Graph, classes: Iterable[Node]) -> Set[Node]:
+    """Return the classes and all their rdfs:subClassOf superclasses in graph."""
+    closure: Set[Node] = set()
+    stack = list(classes)
+    while stack:
+        cls = stack.pop()
+        if cls not in closure:
+            closure.add(cls)
+            stack.extend(graph.objects(cls, RDFS.subClassOf))
+    return closure
+
+
+class ShapeIndex:
+    """
+    Index of the targets of all shapes in a SHACL graph.
+
+    Usage:
+        index = ShapeIndex(shacl_graph)
+        roots = index.relevant_shapes(data_graph)
+        pruned = index.extract(roots)
+    """
+
+    def __init__(self, shacl_graph: Graph):
+        """
+        Index the targets of a SHACL graph.
+
+        Args:
+            shacl_graph: Graph with the SHACL shapes
+        """
+        self.graph = shacl_graph
+        self.by_class = self._index(SH.targetClass)
+        self.by_subjects_of = self._index(SH.targetSubjectsOf)
+        self.by_objects_of = self._index(SH.targetObjectsOf)
+
+        shape_nodes = {
+            s for t in SHAPE_TYPES for s in shacl_graph.subjects(RDF.type, t)
+        }
+        for class_type in (RDFS.Class, OWL.Class):
+            for shape in shacl_graph.subjects(RDF.type, class_type):
+                if shape in shape_nodes:
+                    self.by_class.setdefault(shape, set()).add(shape)
+
+        self.always: Set[Node] = set(shacl_graph.subjects(SH.targetNode, None))
+        self.always.update(shacl_graph.subjects(SH.target, None))
+        for definition_type in GLOBAL_DEFINITION_TYPES:
+            self.always.update(shacl_graph.subjects(RDF.type, definition_type))
+
+        self.targeted: Set[Node] = set(self.always)
+        for index in (self.by_class, self.by_subjects_of, self.by_objects_of):
+            for shapes in index.values():
+                self.targeted.update(shapes)
+
+    def _index(self, target_predicate: URIRef) -> dict:
+        """Map each target value of a target predicate to its shapes."""
+        index: dict = {}
+        for shape, value in self.graph.subject_objects(target_predicate):
+            index.setdefault(value, set()).add(shape)
+        return index
+
+    def relevant_shapes(self, data_graph: Graph) -> FrozenSet[Node]:
+        """
+        Return the shapes whose targets can match the data graph.
+
+        Args:
+            data_graph: Data graph including its inferred types
+
+        Returns:
+            Root shapes (plus global definitions) to validate with
+        """
+        roots = set(self.always)
+
+        types = _superclass_closure(data_graph, set(data_graph.objects(None, RDF.type)))
+        for cls in types & self.by_class.keys():
+            roots.update(self.by_class[cls])
+
+        for index in (self.by_subjects_of, self.by_objects_of):
+            for predicate, shapes in index.items():
+                if (None, predicate, None) in data_graph:
+                    roots.update(shapes)
+
+        return frozenset(roots)
+
+    def extract(self, roots: Iterable[Node]) -> Graph:
+        """
+        Extract the subgraph defining the given shapes.
+
+        Args:
+            roots: Shapes to keep
+
+        Returns:
+            Graph with the triples of the shapes and the shapes they reference
+        """
+        pruned = Graph()
+        for prefix, namespace in self.graph.namespaces():
+            pruned.bind(prefix, namespace, override=True, replace=True)
+
+        seen: Set[Node] = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            for triple in self.graph.triples((node, None, None)):
+                pruned.add(triple)
+                _, predicate, obj = triple
+                if isinstance(obj, BNode) or (
+                    predicate in SHAPE_REFERENCES and isinstance(obj, URIRef)
+                ):
+                    stack.append(obj)
+        return pruned
@@ -6,16 +6,21 @@ This module provides the ShaclValidator class which orchestrates the complete
 SHACL validation pipeline using the modular components.
 """
 
+import contextlib
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from io import StringIO
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import ContextManager, Dict, List, Optional, Set, Tuple
 
 from rdflib import Graph
+from rdflib.plugins.stores.memory import Memory
 
+from src.tools.core.file_utils import file_stamps
 from src.tools.core.logging import get_logger
+from src.tools.core.metrics import ValidationMetrics, append_metrics, get_metrics_out
 from src.tools.utils.graph_loader import (
     FAST_STORE,
     extract_external_iris,
@@ -27,9 +32,14 @@ from src.tools.utils.print_formatter import (
     format_shacl_validation_result,
     normalize_path_for_display,
 )
-from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.utils.registry_resolver import get_registry_resolver
 
-from .inference import apply_rdfs_inference
+from .compiled_shapes import CompiledShapes, get_compiled_shapes, shapes_have_rules
+from .inference import (
+    apply_rdfs_inference,
+    get_ontology_module,
+    rdfs_inference_overlay,
+)
 from .schema_discovery import (
     discover_required_schemas,
     extract_datatype_iris,
@@ -62,6 +72,8 @@ class ValidationResult:
     triples_count: int = 0
     inferred_count: int = 0
     duration_seconds: float = 0.0
+    metrics: ValidationMetrics = field(default_factory=ValidationMetrics)
+    schema_files: List[Path] = field(default_factory=list)
 
 
 class ShaclValidator:
@@ -76,6 +88,12 @@ class ShaclValidator:
         result = validator.validate(jsonld_files)
         if not result.conforms:
             print(result.report_text)
+
+        # Long-lived validator that keeps parsed schemas in memory
+        validator = ShaclValidator(root_dir, schema_cache_size=8)
+
+        # One result per file, schemas loaded once for all files
+        results = validator.validate_many(jsonld_files)
     """
 
     def __init__(
@@ -83,6 +101,9 @@ class ShaclValidator:
         root_dir: Path,
         inference_mode: str = "rdfs",
         verbose: bool = True,
+        schema_cache_size: int = 0,
+        prune_shapes: bool = True,
+        ontology_modules: bool = True,
     ):
         """
         Initialize the SHACL validator.
@@ -91,11 +112,33 @@ class ShaclValidator:
             root_dir: Repository root directory
             inference_mode: Inference mode (rdfs|owlrl|none|both)
             verbose: Whether to print progress messages
+            schema_cache_size: Number of parsed (ontology, SHACL) schema sets
+                kept in memory across validate() calls (0 disables caching);
+                entries are reloaded when a schema file changes on disk
+            prune_shapes: Validate only the shapes whose targets occur in the
+                inferred data (ignored for owlrl/both inference)
+            ontology_modules: Infer with the ontology module reachable from
+                the data's terms instead of the whole ontology (ignored for
+                owlrl/both inference, which need all OWL axioms)
         """
         self.root_dir = Path(root_dir).resolve()
-        self.resolver = RegistryResolver(root_dir)
+        self.resolver = get_registry_resolver(root_dir)
         self.inference_mode = inference_mode
         self.verbose = verbose
+        self.schema_cache_size = schema_cache_size
+        self.prune_shapes = prune_shapes
+        self.ontology_modules = ontology_modules
+        self._schema_cache: OrderedDict[
+            Tuple[Tuple[str, ...], Tuple[str, ...]],
+            Tuple[Graph, CompiledShapes, Dict[str, Tuple[int, int]]],
+        ] = OrderedDict()
+        self._compiled_shapes: Optional[CompiledShapes] = None
+        self._schema_files: List[Path] = []
+
+    @property
+    def cached_schema_sets(self) -> int:
+        """Number of (ontology, SHACL) schema sets held in the schema cache."""
+        return len(self._schema_cache)
 
     def _log(self, message: str) -> None:
         """Print verbose progress if enabled (user-facing output)."""
@@ -126,32 +169,131 @@ class ShaclValidator:
                 files_validated=[self._rel_path(f) for f in jsonld_files],
             )
 
+        metrics = ValidationMetrics()
+
         # Step 1: Load data
         self._log("Step 1: Loading JSON-LD Data Files...")
-        data_graph, prefixes = self._load_data(jsonld_files)
+        with metrics.stage("load_data"):
+            data_graph, prefixes = self._load_data(jsonld_files, metrics)
 
         # Step 2: Extract types and discover schemas
         self._log("Step 2: Discovering Required Schemas...")
-        rdf_types = extract_rdf_types(data_graph)
-        predicates = extract_predicates(data_graph)
-        datatypes = extract_datatype_iris(data_graph)
-        ontology_graph, shacl_graph = self._load_schemas(
-            rdf_types, predicates, datatypes
+        with metrics.stage("schema_discovery"):
+            rdf_types = extract_rdf_types(data_graph)
+            predicates = extract_predicates(data_graph)
+            datatypes = extract_datatype_iris(data_graph)
+            ontology_graph, shacl_graph = self._load_schemas(
+                rdf_types, predicates, datatypes, metrics
+            )
+
+        # Steps 3 and 4: Apply inference and run SHACL validation
+        return self._validate_graph(
+            jsonld_files, data_graph, ontology_graph, shacl_graph, start_time, metrics
         )
 
+    def validate_many(self, jsonld_files: List[Path]) -> List[ValidationResult]:
+        """
+        Validate each file in isolation against one shared schema load.
+
+        The schemas required by all files together are loaded (and compiled)
+        once; every file is then validated on its own data graph, so that
+        violations can be attributed to the file that caused them.
+
+        Args:
+            jsonld_files: List of JSON-LD files to validate
+
+        Returns:
+            One ValidationResult per file, in input order. duration_seconds
+            covers loading and validating that file, not the shared schemas;
+            the metrics of every file include the shared schema_discovery stage.
+        """
+        if not PYSHACL_AVAILABLE:
+            return [
+                ValidationResult(
+                    conforms=False,
+                    return_code=99,
+                    report_text="Error: pyshacl is not installed",
+                    files_validated=[self._rel_path(f)],
+                )
+                for f in jsonld_files
+            ]
+
+        # Step 1: Load every file into its own data graph
+        self._log("Step 1: Loading JSON-LD Data Files...")
+        loaded: List[Tuple[Path, Graph, float, ValidationMetrics]] = []
+        for f in jsonld_files:
+            start_time = time.perf_counter()
+            metrics = ValidationMetrics()
+            with metrics.stage("load_data"):
+                data_graph, _ = self._load_data([f], metrics)
+            loaded.append((f, data_graph, time.perf_counter() - start_time, metrics))
+
+        # Step 2: Discover and load the schemas of all files at once
+        self._log("Step 2: Discovering Required Schemas...")
+        shared = ValidationMetrics()
+        with shared.stage("schema_discovery"):
+            rdf_types: Set[str] = set()
+            predicates: Set[str] = set()
+            datatypes: Set[str] = set()
+            for _, data_graph, _, _ in loaded:
+                rdf_types |= extract_rdf_types(data_graph)
+                predicates |= extract_predicates(data_graph)
+                datatypes |= extract_datatype_iris(data_graph)
+            ontology_graph, shacl_graph = self._load_schemas(
+                rdf_types, predicates, datatypes, shared
+            )
+
+        # Steps 3 and 4 per file
+        results = []
+        for i, (f, data_graph, load_seconds, metrics) in enumerate(loaded, 1):
+            self._log(f"\n[{i}/{len(loaded)}] Validating {self._rel_path(f)}")
+            metrics.stages.update(shared.stages)
+            metrics.triples.update(shared.triples)
+            metrics.files_parsed.update(shared.files_parsed)
+            start_time = time.perf_counter() - load_seconds
+            results.append(
+                self._validate_graph(
+                    [f], data_graph, ontology_graph, shacl_graph, start_time, metrics
+                )
+            )
+        return results
+
+    def _validate_graph(
+        self,
+        jsonld_files: List[Path],
+        data_graph: Graph,
+        ontology_graph: Graph,
+        shacl_graph: Graph,
+        start_time: float,
+        metrics: ValidationMetrics,
+    ) -> ValidationResult:
+        """Apply inference to a loaded data graph and validate it (steps 3-4)."""
         # Step 3: Apply inference if requested
         self._log(f"Step 3: Applying Inference ({self.inference_mode})...")
-        combined_graph, inferred_count = self._apply_inference(
-            data_graph, ontology_graph
-        )
-
-        # Step 4: Run SHACL validation
-        self._log("Step 4: Running SHACL Validation...")
-        conforms, report_text, report_graph = self._run_validation(
-            combined_graph, ontology_graph, shacl_graph
-        )
+        with contextlib.ExitStack() as stack:
+            with metrics.stage("inference"):
+                ontology_graph = self._ontology_module(
+                    data_graph, ontology_graph, metrics
+                )
+                combined_graph, inferred_count = stack.enter_context(
+                    self._inference_context(data_graph, ontology_graph)
+                )
+
+            # Step 4: Run SHACL validation
+            self._log("Step 4: Running SHACL Validation...")
+            with metrics.stage("validation"):
+                conforms, report_text, report_graph = self._run_validation(
+                    combined_graph, ontology_graph, shacl_graph, inplace=True
+                )
+            triples_count = len(combined_graph)
+
+            # Leaving the context removes overlay triples (part of inference)
+            with metrics.stage("inference"):
+                stack.close()
 
         duration = time.perf_counter() - start_time
+        metrics.triples["validated"] = triples_count
+        metrics.triples["inferred"] = inferred_count
 
         return ValidationResult(
             conforms=conforms,
@@ -159,14 +301,19 @@ class ShaclValidator:
             report_text=report_text,
             report_graph=report_graph,
             files_validated=[self._rel_path(f) for f in jsonld_files],
-            triples_count=len(combined_graph),
+            triples_count=triples_count,
             inferred_count=inferred_count,
             duration_seconds=duration,
+            metrics=metrics,
+            schema_files=list(self._schema_files),
         )
 
-    def _load_data(self, jsonld_files: List[Path]) -> Tuple[Graph, Dict[str, str]]:
+    def _load_data(
+        self, jsonld_files: List[Path], metrics: Optional[ValidationMetrics] = None
+    ) -> Tuple[Graph, Dict[str, str]]:
         """Load JSON-LD files and resolve fixture references."""
         data_graph, prefixes = load_jsonld_files(jsonld_files, self.root_dir)
+        fixtures_loaded = 0
 
         for i, f in enumerate(jsonld_files, 1):
             self._log(f"  [{i}/{len(jsonld_files)}] Loaded: {self._rel_path(f)}")
@@ -185,6 +332,11 @@ class ShaclValidator:
                 self._log(f"  Fixtures loaded: {fixtures_loaded}")
                 self._log(f"  Updated triples: {len(data_graph)}")
 
+        if metrics is not None:
+            metrics.files_parsed["data"] = len(jsonld_files)
+            metrics.files_parsed["fixtures"] = fixtures_loaded
+            metrics.triples["data"] = len(data_graph)
+
         return data_graph, prefixes
 
     def _load_schemas(
@@ -192,43 +344,135 @@ class ShaclValidator:
         rdf_types: Set[str],
         predicates: Set[str],
         datatypes: Set[str],
+        metrics: Optional[ValidationMetrics] = None,
     ) -> Tuple[Graph, Graph]:
         """Load ontology and SHACL schemas based on discovered IRIs."""
+        metrics = metrics if metrics is not None else ValidationMetrics()
         self._log(f"  Types found: {len(rdf_types)}")
         for rdf_type in sorted(rdf_types):
             self._log(f"    {rdf_type}")
 
-        # Discover required schemas
-        ontology_paths, shacl_paths = discover_required_schemas(
-            rdf_types, self.resolver
+        all_ontology_paths, shacl_paths = self._discover_schema_paths(
+            rdf_types, predicates, datatypes
         )
 
-        # Add base ontologies filtered by actual usage
-        used_iris = set(rdf_types) | set(predicates) | set(datatypes)
-        base_paths = get_base_ontology_paths(self.root_dir, used_iris=used_iris)
-        all_ontology_paths = sorted(set(ontology_paths + base_paths))
+        ontology_files = [self.resolver.to_absolute(p) for p in all_ontology_paths]
+        shacl_files = [self.resolver.to_absolute(p) for p in shacl_paths]
+        self._schema_files = ontology_files + shacl_files
+
+        # Reuse schemas parsed by an earlier validate() call
+        cache_key = (tuple(all_ontology_paths), tuple(shacl_paths))
+        cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            ontology_graph, compiled, ontology_stamps = cached
+            if file_stamps(ontology_files) == ontology_stamps and compiled.is_current():
+                self._schema_cache.move_to_end(cache_key)
+                self._log(
+                    f"\n  Reusing cached schemas ({len(all_ontology_paths)} "
+                    f"ontology, {len(shacl_paths)} SHACL files)"
+                )
+                self._compiled_shapes = compiled
+                metrics.files_parsed.update(ontology=0, shacl=0)
+                metrics.triples.update(
+                    ontology=len(ontology_graph), shacl=len(compiled.graph)
+                )
+                return ontology_graph, compiled.graph
+            # A schema file changed on disk since it was cached
+            del self._schema_cache[cache_key]
+            self._log("\n  Cached schemas are outdated, reloading")
 
         # Load ontologies
         self._log(f"\n  Loading {len(all_ontology_paths)} ontology files:")
-        ontology_files = [self.resolver.to_absolute(p) for p in all_ontology_paths]
+        ontology_stamps = file_stamps(ontology_files)
         ontology_graph = load_turtle_files(ontology_files, self.root_dir)
 
         for path in all_ontology_paths:
             self._log(f"    {path}")
 
-        # Load SHACL shapes
+        # Load SHACL shapes (compiled once per shape set and process)
         self._log(f"\n  Loading {len(shacl_paths)} SHACL files:")
-        shacl_files = [self.resolver.to_absolute(p) for p in shacl_paths]
-        shacl_graph = load_turtle_files(shacl_files, self.root_dir)
+        parsed_shacl_files: List[Path] = []
+
+        def _load_shacl(files: List[Path]) -> Graph:
+            parsed_shacl_files.extend(files)
+            return load_turtle_files(files, self.root_dir)
+
+        self._compiled_shapes = get_compiled_shapes(shacl_files, _load_shacl)
+        shacl_graph = self._compiled_shapes.graph
 
         for path in shacl_paths:
             self._log(f"    {path}")
 
         self._log(f"\n  Ontology triples: {len(ontology_graph)}")
         self._log(f"  SHACL triples: {len(shacl_graph)}")
+        metrics.files_parsed.update(
+            ontology=len(ontology_files), shacl=len(parsed_shacl_files)
+        )
+        metrics.triples.update(ontology=len(ontology_graph), shacl=len(shacl_graph))
+
+        if self.schema_cache_size > 0:
+            self._schema_cache[cache_key] = (
+                ontology_graph,
+                self._compiled_shapes,
+                ontology_stamps,
+            )
+            while len(self._schema_cache) > self.schema_cache_size:
+                self._schema_cache.popitem(last=False)
 
         return ontology_graph, shacl_graph
 
+    def _discover_schema_paths(
+        self,
+        rdf_types: Set[str],
+        predicates: Set[str],
+        datatypes: Set[str],
+    ) -> Tuple[List[str], List[str]]:
+        """Return the (ontology, SHACL) paths required by the discovered IRIs."""
+        # Discover required schemas
+        ontology_paths, shacl_paths = discover_required_schemas(
+            rdf_types, self.resolver
+        )
+
+        # Add base ontologies filtered by actual usage
+        used_iris = set(rdf_types) | set(predicates) | set(datatypes)
+        base_paths = get_base_ontology_paths(self.root_dir, used_iris=used_iris)
+        return sorted(set(ontology_paths + base_paths)), shacl_paths
+
+    def _ontology_module(
+        self, data_graph: Graph, ontology_graph: Graph, metrics: ValidationMetrics
+    ) -> Graph:
+        """Reduce the ontology to the axioms the data's terms reach (rdfs/none)."""
+        if not self.ontology_modules or self.inference_mode not in ("rdfs", "none"):
+            return ontology_graph
+        module = get_ontology_module(ontology_graph, data_graph)
+        metrics.triples["ontology_module"] = len(module)
+        self._log(f"  Ontology module: {len(module)} triples")
+        return module
+
+    def _inference_context(
+        self, data_graph: Graph, ontology_graph: Graph
+    ) -> ContextManager[Tuple[Graph, int]]:
+        """
+        Provide the graph to validate for the configured inference mode.
+
+        In rdfs mode the data is overlaid on a cached, already entailed copy
+        of the ontology, so the ontology is not copied on every run.
+        """
+        if self.inference_mode == "rdfs":
+            return self._rdfs_overlay(data_graph, ontology_graph)
+        return contextlib.nullcontext(self._apply_inference(data_graph, ontology_graph))
+
+    @contextlib.contextmanager
+    def _rdfs_overlay(self, data_graph: Graph, ontology_graph: Graph):
+        """Yield the RDFS overlay graph, logging like _apply_inference."""
+        with rdfs_inference_overlay(data_graph, ontology_graph) as (
+            combined,
+            inferred,
+        ):
+            self._log(f"  Inferred {inferred} new triples")
+            self._log(f"  Total triples: {len(combined)}")
+            yield combined, inferred
+
     def _apply_inference(
         self, data_graph: Graph, ontology_graph: Graph
     ) -> Tuple[Graph, int]:
@@ -255,31 +499,54 @@ class ShaclValidator:
         data_graph: Graph,
         ontology_graph: Graph,
         shacl_graph: Graph,
+        inplace: bool = False,
     ) -> Tuple[bool, str, Optional[Graph]]:
-        """Run SHACL validation using pyshacl."""
+        """
+        Run SHACL validation using pyshacl.
+
+        With inplace=True the caller hands over a graph built for this run,
+        so pyshacl may validate it without cloning it first (unless the
+        shapes contain SHACL rules, which would modify the data).
+        """
         # Convert to default store if using oxigraph (pyshacl compatibility)
-        if FAST_STORE == "oxigraph":
+        if FAST_STORE == "oxigraph" and not isinstance(data_graph.store, Memory):
             self._log("  Converting to default store for validation...")
             validation_graph = Graph()
             validation_graph += data_graph
+            inplace = True
         else:
             validation_graph = data_graph
 
+        ont_graph = ontology_graph if self.inference_mode in ("owlrl", "both") else None
+        inference = self.inference_mode if self.inference_mode != "rdfs" else None
+
         try:
-            conforms, results_graph, results_text = validate(
-                validation_graph,
-                shacl_graph=shacl_graph,
-                ont_graph=(
-                    ontology_graph if self.inference_mode in ("owlrl", "both") else None
-                ),
-                inference=(
-                    self.inference_mode if self.inference_mode != "rdfs" else None
-                ),
-                abort_on_first=False,
-                advanced=True,
-                js=False,
-                meta_shacl=False,
-            )
+            compiled = self._compiled_shapes
+            if compiled is not None and compiled.graph is shacl_graph:
+                if self.prune_shapes and inference in (None, "none"):
+                    # pyshacl adds no types: skip shapes that cannot match
+                    compiled = compiled.for_data(validation_graph)
+                # Reuse the shape objects compiled for this shape set
+                conforms, results_graph, results_text = compiled.validate(
+                    validation_graph,
+                    ont_graph=ont_graph,
+                    inference=inference,
+                    advanced=True,
+                    abort_on_first=False,
+                    inplace=inplace and not compiled.has_rules,
+                )
+            else:
+                conforms, results_graph, results_text = validate(
+                    validation_graph,
+                    shacl_graph=shacl_graph,
+                    ont_graph=ont_graph,
+                    inference=inference,
+                    abort_on_first=False,
+                    advanced=True,
+                    js=False,
+                    meta_shacl=False,
+                    inplace=inplace and not shapes_have_rules(shacl_graph),
+                )
 
             if conforms:
                 self._log("  Validation PASSED")
@@ -304,14 +571,15 @@ class ShaclValidator:
             Formatted string output
         """
         output_buffer = StringIO()
-        format_shacl_validation_result(
-            result.conforms,
-            result.files_validated,
-            "" if not result.conforms else result.report_text,
-            result.report_graph,
-            exit_code=None,
-            file=output_buffer,
-        )
+        with result.metrics.stage("formatting"):
+            format_shacl_validation_result(
+                result.conforms,
+                result.files_validated,
+                "" if not result.conforms else result.report_text,
+                result.report_graph,
+                exit_code=None,
+                file=output_buffer,
+            )
         return output_buffer.getvalue()
 
 
@@ -321,6 +589,7 @@ def validate_data_conformance(
     inference_mode: str = "rdfs",
     debug: bool = False,
     logfile: Optional[Path] = None,
+    metrics_out: Optional[Path] = None,
 ) -> Tuple[int, str]:
     """
     Main validation entry point (backwards compatible).
@@ -334,10 +603,42 @@ def validate_data_conformance(
         inference_mode: Inference mode for validation
         debug: Enable debug logging
         logfile: Optional log file path
+        metrics_out: Optional JSON Lines file receiving the per-stage metrics
+            (default: ONTOLOGY_METRICS_OUT environment variable)
 
     Returns:
         Tuple of (return_code, output_message)
     """
+    result, output = run_data_conformance(
+        jsonld_files, root_dir, inference_mode, debug, logfile, metrics_out
+    )
+    return result.return_code, output
+
+
+def run_data_conformance(
+    jsonld_files: List[Path],
+    root_dir: Path,
+    inference_mode: str = "rdfs",
+    debug: bool = False,
+    logfile: Optional[Path] = None,
+    metrics_out: Optional[Path] = None,
+) -> Tuple[ValidationResult, str]:
+    """
+    Run validate_data_conformance(), returning the full ValidationResult.
+
+    Args:
+        jsonld_files: List of JSON-LD files to validate
+        root_dir: Repository root directory
+        inference_mode: Inference mode for validation
+        debug: Enable debug logging
+        logfile: Optional log file path
+        metrics_out: Optional JSON Lines file receiving the per-stage metrics
+            (default: ONTOLOGY_METRICS_OUT environment variable)
+
+    Returns:
+        Tuple of (result, output_message); result.schema_files lists the
+        ontology and SHACL files the data was validated against
+    """
     # Set up logging level if debug requested
     if debug:
         import logging
@@ -357,7 +658,15 @@ def validate_data_conformance(
     if not PYSHACL_AVAILABLE:
         error_msg = "Error: pyshacl is not installed"
         print(error_msg, file=sys.stderr)
-        return 99, error_msg
+        result = ValidationResult(
+            conforms=False,
+            return_code=99,
+            report_text=error_msg,
+            files_validated=[
+                normalize_path_for_display(f, root_dir) for f in jsonld_files
+            ],
+        )
+        return result, error_msg
 
     # Initialize validator
     print(f"\nRepository Root: {root_dir.as_posix()}")
@@ -380,4 +689,19 @@ def validate_data_conformance(
     formatted_output = validator.format_result(result)
     print(formatted_output)
 
-    return result.return_code, formatted_output
+    metrics_out = metrics_out or get_metrics_out()
+    if metrics_out:
+        append_metrics(
+            metrics_out,
+            {
+                "files": [
+                    normalize_path_for_display(f, root_dir) for f in jsonld_files
+                ],
+                "return_code": result.return_code,
+                "conforms": result.conforms,
+                "duration_seconds": result.duration_seconds,
+                **result.metrics.to_dict(),
+            },
+        )
+
+    return result, formatted_output
@@ -6,9 +6,11 @@ FEATURE SET:
 ============
 1. check_json_syntax - Validate JSON/JSON-LD syntax for single file
 2. check_turtle_syntax - Validate Turtle syntax for single file
-3. verify_json_syntax - Batch JSON-LD validation for multiple paths
-4. verify_turtle_syntax - Batch Turtle validation for multiple paths
-5. verify_all_syntax - Combined validation for both formats
+3. check_turtle_syntax_only - Grammar-only Turtle check (no graph is built)
+4. verify_json_syntax - Batch JSON-LD validation for multiple paths
+5. verify_turtle_syntax - Batch Turtle validation for multiple paths
+6. verify_all_syntax - Combined validation for both formats
+7. check_files - Run a single-file checker over many files (optionally pooled)
 
 USAGE:
 ======
@@ -27,13 +29,22 @@ USAGE:
     ret, results = verify_json_syntax(["data/", "examples/"])
     ret, results = verify_turtle_syntax(["artifacts/"])
 
+    # Check on 4 worker processes (results keep the input order)
+    ret, results = verify_turtle_syntax(["artifacts/"], jobs=4)
+
+    # Grammar-only Turtle check (e.g. for pre-commit hooks)
+    ret, results = verify_turtle_syntax(["artifacts/"], syntax_only=True)
+
 STANDALONE TESTING:
 ==================
-    python3 -m src.tools.validators.syntax_validator [--test] [--json] [--turtle] paths...
+    python3 -m src.tools.validators.syntax_validator [--test] [--json] [--turtle] [--jobs N] paths...
+    python3 -m src.tools.validators.syntax_validator --turtle --syntax-only paths...
 
 DEPENDENCIES:
 =============
 - rdflib: For Turtle parsing
+- pyoxigraph (optional, installed with oxrdflib): Streaming Turtle parser
+  for the --syntax-only mode
 - json: For JSON parsing (stdlib)
 
 NOTES:
@@ -41,22 +52,72 @@ NOTES:
 - This module does NOT validate logical structure or SHACL compliance
 - It only checks that files are syntactically well-formed
 - Return codes: 0 = OK, non-zero = error
+- --syntax-only streams the parsed triples into nothing instead of building
+  an rdflib graph; errors still report line and column. Oxigraph parses
+  leniently there, so a file passes --syntax-only exactly when it passes
+  the full check
+- With jobs > 1 files are checked in worker processes; results are always
+  reported in the order of the (sorted) input files
 """
 
 import argparse
 import io
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 from rdflib import Graph
 from rdflib.exceptions import ParserError
+from rdflib.store import Store
 
 from src.tools.core.result import ReturnCodes
 from src.tools.utils.file_collector import collect_jsonld_files, collect_turtle_files
 from src.tools.utils.print_formatter import normalize_path_for_display
 
+# Try to import the Oxigraph parser for grammar-only Turtle checks
+try:
+    from pyoxigraph import RdfFormat
+    from pyoxigraph import parse as oxigraph_parse
+
+    OXIGRAPH_PARSER_AVAILABLE = True
+except ImportError:
+    OXIGRAPH_PARSER_AVAILABLE = False
+
+# Single-file checkers: (filename, root_dir) -> (return_code, message)
+FileCheck = Callable[[Union[str, Path], Optional[Path]], Tuple[int, str]]
+
+
+def check_files(
+    files: List[Union[str, Path]],
+    check: FileCheck,
+    root_dir: Optional[Path] = None,
+    jobs: int = 1,
+) -> List[Tuple[int, str]]:
+    """
+    Run a single-file checker over many files.
+
+    Args:
+        files: Files to check
+        check: Module-level checker such as check_turtle_syntax
+        root_dir: Optional root directory for path normalization in output
+        jobs: Number of worker processes (1 checks in-process, 0 one per CPU)
+
+    Returns:
+        List of (code, message) tuples in the order of files
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or len(files) <= 1:
+        return [check(f, root_dir) for f in files]
+
+    workers = min(jobs, len(files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(check, files, [root_dir] * len(files)))
+
+
 # =============================================================================
 # JSON-LD Syntax Validation
 # =============================================================================
@@ -116,6 +177,7 @@ def gather_jsonld_files(paths: List[str]) -> List[str]:
 def verify_json_syntax(
     paths: List[str],
     root_dir: Optional[Path] = None,
+    jobs: int = 1,
 ) -> Tuple[int, List[Tuple[int, str]]]:
     """
     Verify syntax correctness for all JSON/JSON-LD files found in the given paths.
@@ -123,6 +185,7 @@ def verify_json_syntax(
     Args:
         paths: List of files or directories to check
         root_dir: Optional root directory for path normalization in output
+        jobs: Number of worker processes (see check_files)
 
     Returns:
         (return_code, results) tuple where:
@@ -137,11 +200,11 @@ def verify_json_syntax(
         results.append((ReturnCodes.GENERAL_ERROR, msg))
         return ReturnCodes.GENERAL_ERROR, results
 
+    files = sorted({str(Path(filename).resolve()) for filename in files})
+    results = check_files(files, check_json_syntax, root_dir, jobs)
+
     ret = 0
-    for filename in files:
-        filename = str(Path(filename).resolve())
-        code, msg = check_json_syntax(filename, root_dir)
-        results.append((code, msg))
+    for code, _ in results:
         ret |= code
 
     return ret, results
@@ -195,6 +258,104 @@ def check_turtle_syntax(
 check_turtle_wellformedness = check_turtle_syntax
 
 
+class _NullStore(Store):
+    """rdflib store discarding all triples (for grammar-only parsing)."""
+
+    def add(self, triple, context, quoted=False):
+        pass
+
+    def addN(self, quads):
+        pass
+
+
+def check_turtle_syntax_only(
+    filename: Union[str, Path],
+    root_dir: Optional[Path] = None,
+) -> Tuple[int, str]:
+    """
+    Check Turtle grammar of a single file without building an RDF graph.
+
+    Uses Oxigraph's streaming parser when available, otherwise rdflib's
+    Turtle parser writing into a store that discards all triples. Oxigraph
+    runs in lenient mode so that it accepts what rdflib accepts (e.g. IRIs
+    with spaces, long language tags) and gives the same verdict as
+    check_turtle_syntax.
+
+    Args:
+        filename: Path to the Turtle file to check
+        root_dir: Optional root directory for path normalization in output
+
+    Returns:
+        (return_code, message) tuple where return_code is 0 if OK, non-zero otherwise
+    """
+    # Normalize path for display
+    if root_dir:
+        display_path = normalize_path_for_display(filename, root_dir)
+    else:
+        display_path = str(filename)
+
+    path = Path(filename)
+    if not path.is_file():
+        return ReturnCodes.TURTLE_SYNTAX_ERROR, f"File not found: {display_path}"
+
+    base_iri = path.absolute().as_uri()
+    try:
+        if OXIGRAPH_PARSER_AVAILABLE:
+            for _ in oxigraph_parse(
+                path=str(path),
+                format=RdfFormat.TURTLE,
+                base_iri=base_iri,
+                lenient=True,
+            ):
+                pass
+        else:
+            Graph(store=_NullStore()).parse(
+                str(path), format="turtle", publicID=base_iri
+            )
+        return ReturnCodes.SUCCESS, f"Syntax OK: {display_path}"
+    except SyntaxError as e:
+        line, col, reason = _syntax_error_position(e)
+        msg = f"Syntax Error in {display_path}:\n   Line {line}, Col {col}: {reason}"
+        return ReturnCodes.TURTLE_SYNTAX_ERROR, msg
+    except Exception as e:
+        msg = f"Unexpected error parsing {display_path}:\n{e}"
+        return ReturnCodes.TURTLE_SYNTAX_ERROR, msg
+
+
+def _syntax_error_position(error: SyntaxError) -> Tuple[int, int, str]:
+    """
+    Extract (line, column, reason) from an Oxigraph or rdflib syntax error.
+
+    rdflib's BadSyntax only keeps its position in private attributes (_str,
+    _i, _why), so each is read defensively; unknown parts are reported as
+    line/column 0 and the exception text.
+    """
+    if getattr(error, "lineno", None) is not None:
+        # Oxigraph: "Parser error between line L column C and ...: reason"
+        return error.lineno, error.offset or 0, str(error.msg).split(": ", 1)[-1]
+
+    # rdflib BadSyntax: 0-based line count and offset into the parsed text
+    lines = getattr(error, "lines", None)
+    line = lines + 1 if isinstance(lines, int) else 0
+
+    text = getattr(error, "_str", None)
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    offset = getattr(error, "_i", None)
+    if isinstance(text, str) and isinstance(offset, int):
+        col = offset - text.rfind("\n", 0, offset)
+    else:
+        col = 0
+
+    reason = getattr(error, "_why", None)
+    if not reason:
+        try:
+            reason = str(error)
+        except Exception:
+            reason = type(error).__name__
+    return line, col, str(reason)
+
+
 def gather_turtle_files(paths: List[str]) -> List[str]:
     """
     Gather all .ttl files from the given paths.
@@ -207,6 +368,8 @@ def gather_turtle_files(paths: List[str]) -> List[str]:
 def verify_turtle_syntax(
     paths: List[str],
     root_dir: Optional[Path] = None,
+    jobs: int = 1,
+    syntax_only: bool = False,
 ) -> Tuple[int, List[Tuple[int, str]]]:
     """
     Verify syntax correctness for all Turtle files found in the given paths.
@@ -214,6 +377,9 @@ def verify_turtle_syntax(
     Args:
         paths: List of files or directories to check
         root_dir: Optional root directory for path normalization in output
+        jobs: Number of worker processes (see check_files)
+        syntax_only: Check grammar only, without building graphs
+            (see check_turtle_syntax_only)
 
     Returns:
         (return_code, results) tuple where:
@@ -228,11 +394,12 @@ def verify_turtle_syntax(
         results.append((ReturnCodes.GENERAL_ERROR, msg))
         return ReturnCodes.GENERAL_ERROR, results
 
+    files = sorted({str(Path(filename).resolve()) for filename in files})
+    check = check_turtle_syntax_only if syntax_only else check_turtle_syntax
+    results = check_files(files, check, root_dir, jobs)
+
     ret = 0
-    for filename in files:
-        filename = str(Path(filename).resolve())
-        code, msg = check_turtle_syntax(filename, root_dir)
-        results.append((code, msg))
+    for code, _ in results:
         ret |= code
 
     return ret, results
@@ -248,6 +415,8 @@ def verify_all_syntax(
     root_dir: Optional[Path] = None,
     check_json: bool = True,
     check_turtle: bool = True,
+    jobs: int = 1,
+    syntax_only: bool = False,
 ) -> Tuple[int, List[Tuple[int, str]]]:
     """
     Verify syntax for both JSON-LD and Turtle files.
@@ -257,6 +426,8 @@ def verify_all_syntax(
         root_dir: Optional root directory for path normalization
         check_json: Whether to check JSON-LD files
         check_turtle: Whether to check Turtle files
+        jobs: Number of worker processes (see check_files)
+        syntax_only: Check Turtle grammar only (see check_turtle_syntax_only)
 
     Returns:
         (return_code, results) tuple
@@ -265,12 +436,14 @@ def verify_all_syntax(
     ret = 0
 
     if check_json:
-        json_ret, json_results = verify_json_syntax(paths, root_dir)
+        json_ret, json_results = verify_json_syntax(paths, root_dir, jobs)
         ret |= json_ret
         all_results.extend(json_results)
 
     if check_turtle:
-        turtle_ret, turtle_results = verify_turtle_syntax(paths, root_dir)
+        turtle_ret, turtle_results = verify_turtle_syntax(
+            paths, root_dir, jobs, syntax_only
+        )
         ret |= turtle_ret
         all_results.extend(turtle_results)
 
@@ -383,6 +556,19 @@ def main(args=None):
     parser.add_argument("--json", action="store_true", help="Check JSON-LD files only")
     parser.add_argument("--turtle", action="store_true", help="Check Turtle files only")
     parser.add_argument("--quiet", "-q", action="store_true", help="Only show errors")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Check files in N worker processes (0: one per CPU)",
+    )
+    parser.add_argument(
+        "--syntax-only",
+        action="store_true",
+        help="Check Turtle grammar only, without building RDF graphs (faster)",
+    )
 
     parsed_args = parser.parse_args(args)
 
@@ -408,6 +594,8 @@ def main(args=None):
         root_dir=Path.cwd(),
         check_json=check_json,
         check_turtle=check_turtle,
+        jobs=parsed_args.jobs,
+        syntax_only=parsed_args.syntax_only,
     )
 
     # Print results
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Validation Server - Long-lived SHACL Validation Daemon
+
+Keeps a RegistryResolver and the parsed ontology/SHACL graphs in memory and
+validates JSON-LD documents posted over HTTP (TCP or Unix socket). This avoids
+paying interpreter startup, rdflib import and schema parsing on every request.
+
+FEATURE SET:
+============
+1. ValidationService - Warm ShaclValidator wrapper validating in-memory documents
+2. create_server - Build an HTTP server (TCP or Unix socket) for a service
+3. main - CLI entry point (also available as ``onto-validate serve``)
+
+USAGE:
+======
+    # Start the daemon
+    onto-validate serve --port 8765 --preload manifest hdmap
+    python3 -m src.tools.validators.validation_server --socket /tmp/onto.sock
+
+    # Validate a document
+    curl -s -X POST --data-binary @instance.json http://127.0.0.1:8765/validate
+
+    # Programmatic use
+    from src.tools.validators.validation_server import ValidationService
+
+    service = ValidationService(root_dir)
+    response = service.validate_document(document_bytes, "instance.json")
+
+ENDPOINTS:
+==========
+    GET  /health    - Service status and cache statistics
+    POST /validate  - Validate the JSON-LD request body; returns JSON with
+                      conforms, return_code, report_text and summary
+
+STANDALONE TESTING:
+==================
+    python3 -m src.tools.validators.validation_server [--test] [options]
+
+DEPENDENCIES:
+=============
+- rdflib: For RDF graph handling
+- pyshacl: For SHACL validation
+- http.server (stdlib): Request handling
+
+NOTES:
+======
+- Requests are processed one at a time; validation shares in-memory graphs
+  and is not thread-safe.
+- The server binds to 127.0.0.1 by default and has no authentication; do not
+  expose it on public interfaces.
+- Posted documents are written to a temporary file so that they go through
+  exactly the same loading path as the CLI validators.
+- Cached schemas are reloaded when an ontology or SHACL file changes on
+  disk (mtime or size), so the daemon can keep running while schemas are
+  edited.
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import tempfile
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.tools.core.logging import get_logger
+from src.tools.core.result import ReturnCodes
+from src.tools.validators.shacl.validator import ShaclValidator
+
+# Module logger
+logger = get_logger(__name__)
+
+# Navigate up from src/tools/validators to the repo root
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_SCHEMA_CACHE_SIZE = 16
+
+# Upper bound for accepted request bodies (bytes)
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+
+class ValidationService:
+    """
+    Warm validation service holding parsed schemas across requests.
+
+    Usage:
+        service = ValidationService(root_dir)
+        service.preload(["manifest"])
+        status, payload = service.validate_document(body, "instance.json")
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        inference_mode: str = "rdfs",
+        schema_cache_size: int = DEFAULT_SCHEMA_CACHE_SIZE,
+    ):
+        """
+        Initialize the validation service.
+
+        Args:
+            root_dir: Repository root directory
+            inference_mode: Inference mode (rdfs|owlrl|none|both)
+            schema_cache_size: Number of schema sets kept in memory
+        """
+        self.root_dir = Path(root_dir).resolve()
+        self.validator = ShaclValidator(
+            self.root_dir,
+            inference_mode=inference_mode,
+            verbose=False,
+            schema_cache_size=schema_cache_size,
+        )
+        self.requests_served = 0
+
+    def preload(self, domains: List[str]) -> int:
+        """
+        Warm the schema cache by validating each domain's valid test data.
+
+        Args:
+            domains: Domain names from the test catalog
+
+        Returns:
+            Number of domains that were warmed up
+        """
+        warmed = 0
+        for domain in domains:
+            files = self.validator.resolver.get_test_files(domain, test_type="valid")
+            if not files:
+                logger.warning("No valid test data to preload domain '%s'", domain)
+                continue
+            logger.info("Preloading schemas for domain '%s'", domain)
+            self.validator.validate(files)
+            warmed += 1
+        return warmed
+
+    def health(self) -> Dict:
+        """Return service status information."""
+        info = self.validator.resolver.get_registry_info()
+        return {
+            "status": "ok",
+            "domains_available": info["domains_available"],
+            "inference_mode": self.validator.inference_mode,
+            "cached_schema_sets": self.validator.cached_schema_sets,
+            "requests_served": self.requests_served,
+        }
+
+    def validate_document(
+        self, body: bytes, filename: str = "document.json"
+    ) -> Tuple[int, Dict]:
+        """
+        Validate a single JSON-LD document.
+
+        Args:
+            body: Raw JSON-LD document bytes
+            filename: Display name used for the temporary file
+
+        Returns:
+            Tuple of (http_status, response_payload)
+        """
+        try:
+            json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            return 400, {
+                "conforms": False,
+                "return_code": int(ReturnCodes.JSON_SYNTAX_ERROR),
+                "report_text": f"Invalid JSON: {e}",
+            }
+
+        safe_name = Path(filename).name or "document.json"
+        if Path(safe_name).suffix.lower() not in (".json", ".jsonld"):
+            safe_name += ".json"
+
+        with tempfile.TemporaryDirectory(prefix="onto-validate-") as tmpdir:
+            doc_path = Path(tmpdir) / safe_name
+            doc_path.write_bytes(body)
+            try:
+                result = self.validator.validate([doc_path])
+            except Exception as e:
+                logger.error("Validation of %s failed: %s", safe_name, e)
+                return 422, {
+                    "conforms": False,
+                    "return_code": int(ReturnCodes.GENERAL_ERROR),
+                    "report_text": f"Could not validate document: {e}",
+                }
+            summary = self.validator.format_result(result)
+
+        self.requests_served += 1
+        return 200, {
+            "conforms": result.conforms,
+            "return_code": result.return_code,
+            "report_text": result.report_text,
+            "summary": summary,
+            "triples_count": result.triples_count,
+            "inferred_count": result.inferred_count,
+            "duration_seconds": result.duration_seconds,
+        }
+
+
+class _ValidationRequestHandler(BaseHTTPRequestHandler):
+    """HTTP request handler delegating to the server's ValidationService."""
+
+    server_version = "OntoValidate/1.0"
+
+    def _send_json(self, status: int, payload: Dict) -> None:
+        data = json.dumps(payload, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/health":
+            self._send_json(200, self.server.service.health())
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        if self.path.split("?")[0].rstrip("/") != "/validate":
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            self._send_json(400, {"error": "Request body is empty"})
+            return
+        if length > MAX_REQUEST_BYTES:
+            self._send_json(413, {"error": "Request body too large"})
+            return
+
+        body = self.rfile.read(length)
+        filename = self.headers.get("X-Filename", "document.json")
+        status, payload = self.server.service.validate_document(body, filename)
+        self._send_json(status, payload)
+
+    def log_message(self, format, *args):
+        logger.info("%s %s", self.command, format % args)
+
+
+class _TcpValidationServer(HTTPServer):
+    """HTTP server over TCP carrying a ValidationService."""
+
+    def __init__(self, address, service: ValidationService):
+        super().__init__(address, _ValidationRequestHandler)
+        self.service = service
+
+
+class _UnixValidationServer(socketserver.UnixStreamServer):
+    """HTTP server over a Unix domain socket carrying a ValidationService."""
+
+    def __init__(self, socket_path: str, service: ValidationService):
+        super().__init__(socket_path, _ValidationRequestHandler)
+        self.service = service
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) style client address
+        return request, ("unix", 0)
+
+
+def create_server(
+    service: ValidationService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[Path] = None,
+) -> socketserver.BaseServer:
+    """
+    Create an HTTP server for a validation service.
+
+    Args:
+        service: Warm ValidationService handling the requests
+        host: Interface to bind for TCP mode
+        port: Port to bind for TCP mode (0 picks a free port)
+        socket_path: Unix socket path; when given, TCP options are ignored
+
+    Returns:
+        Server instance ready for serve_forever()
+    """
+    if socket_path is not None:
+        socket_path = Path(socket_path)
+        if socket_path.exists():
+            socket_path.unlink()
+        return _UnixValidationServer(str(socket_path), service)
+    return _TcpValidationServer((host, port), service)
+
+
+def _run_tests() -> bool:
+    """Run self-tests for the module."""
+    print("Running validation_server self-tests...")
+    all_passed = True
+
+    service = ValidationService(ROOT_DIR)
+
+    # Test 1: Health endpoint payload
+    health = service.health()
+    if health.get("status") != "ok":
+        print(f"FAIL: health - got {health}")
+        all_passed = False
+    else:
+        print("PASS: health")
+
+    # Test 2: Malformed JSON is rejected without validation
+    status, payload = service.validate_document(b"{not json", "broken.json")
+    if status != 400 or payload["conforms"]:
+        print(f"FAIL: malformed JSON - got {status} {payload}")
+        all_passed = False
+    else:
+        print("PASS: malformed JSON rejected")
+
+    if all_passed:
+        print("\nAll tests passed!")
+    else:
+        print("\nSome tests failed!")
+
+    return all_passed
+
+
+def main(args=None):
+    """CLI entry point for the validation server."""
+    parser = argparse.ArgumentParser(
+        prog="onto-validate serve",
+        description="Run a long-lived SHACL validation server with warm schemas.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="TCP port (default: 8765)"
+    )
+    parser.add_argument(
+        "--socket", type=Path, default=None, help="Serve on a Unix socket instead"
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=ROOT_DIR,
+        help="Repository root directory (default: this repository)",
+    )
+    parser.add_argument(
+        "--inference",
+        choices=["rdfs", "owlrl", "none", "both"],
+        default="rdfs",
+        help="Inference mode for validation (default: rdfs)",
+    )
+    parser.add_argument(
+        "--schema-cache-size",
+        type=int,
+        default=DEFAULT_SCHEMA_CACHE_SIZE,
+        help="Number of parsed schema sets kept in memory",
+    )
+    parser.add_argument(
+        "--preload",
+        nargs="*",
+        metavar="DOMAIN",
+        default=None,
+        help="Warm schemas for these domains at startup (no value: all domains)",
+    )
+    parser.add_argument("--test", action="store_true", help="Run self-tests")
+
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.test:
+        success = _run_tests()
+        sys.exit(0 if success else 1)
+
+    service = ValidationService(
+        parsed_args.root,
+        inference_mode=parsed_args.inference,
+        schema_cache_size=parsed_args.schema_cache_size,
+    )
+
+    if parsed_args.preload is not None:
+        domains = parsed_args.preload or service.validator.resolver.get_test_domains()
+        warmed = service.preload(domains)
+        print(f"Preloaded schemas for {warmed} domain(s)", flush=True)
+
+    server = create_server(
+        service, parsed_args.host, parsed_args.port, parsed_args.socket
+    )
+    if parsed_args.socket:
+        print(f"Serving validation on unix socket {parsed_args.socket}", flush=True)
+    else:
+        host, port = server.server_address[:2]
+        print(f"Serving validation on http://{host}:{port}", flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down validation server", flush=True)
+    finally:
+        server.server_close()
+        if parsed_args.socket and os.path.exists(parsed_args.socket):
+            os.unlink(parsed_args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,12 @@ OPERATION MODES:
      python3 -m src.tools.validators.validation_suite --domain manifest
      python3 -m src.tools.validators.validation_suite --domain manifest scenario
 
+   Both modes accept --changed-since <git-ref> to keep only the domains
+   affected by changes since that ref (changed artifacts and test data,
+   owl:imports dependents and fixture references; see change_impact.py).
+   Usage:
+     python3 -m src.tools.validators.validation_suite --changed-since origin/main
+
 3. PATH VALIDATION MODE
    Validates arbitrary files or directories by creating a temporary in-memory catalog.
    Useful for checking files before they are added to the official catalog.
@@ -32,6 +38,14 @@ OPERATION MODES:
      python3 -m src.tools.validators.validation_suite --path tests/data/manifest/valid/
      python3 -m src.tools.validators.validation_suite --path my_new_file.json
 
+4. SERVER MODE
+   Starts a long-lived validation daemon that keeps parsed ontologies and
+   SHACL shapes in memory and validates JSON-LD documents posted over HTTP.
+   See src/tools/validators/validation_server.py for endpoints and options.
+   Usage:
+     python3 -m src.tools.validators.validation_suite serve --port 8765
+     onto-validate serve --socket /tmp/onto-validate.sock --preload
+
 VALIDATION PHASES (--run):
 =========================
 
@@ -57,6 +71,9 @@ VALIDATION PHASES (--run):
     (Catalog/Domain Mode only)
     Executes "Negative Tests" - data files expected to fail validation.
     Verifies that they fail with the specific error code/message defined in .expected files.
+    Tests that passed before with identical inputs (test, .expected, schemas,
+    catalogs, fixtures and tool version) are skipped; see failing_test_cache.py.
+    Set ONTOLOGY_TEST_CACHE=0 to always re-run them.
 
 EXAMPLES:
 =========
@@ -68,26 +85,55 @@ python3 -m src.tools.validators.validation_suite --run check-syntax --domain man
 
 # Validate a specific file against rules
 python3 -m src.tools.validators.validation_suite --run check-data-conformance --path ./my_data.json
+
+# Validate all domains on 8 worker processes (output stays in domain order)
+python3 -m src.tools.validators.validation_suite --jobs 8
+
+# Only validate domains affected by changes on this branch
+python3 -m src.tools.validators.validation_suite --changed-since origin/main
+
+# Record per-stage timing and memory of every SHACL run (JSON Lines)
+python3 -m src.tools.validators.validation_suite --metrics-out metrics.jsonl
+
+# Profile each phase and domain (profiles/check-syntax.prof,
+# profiles/check-data-conformance.manifest.prof, ...) and inspect one
+python3 -m src.tools.validators.validation_suite --profile profiles
+python3 -m src.tools.core.profiling profiles/check-data-conformance.manifest.prof
 """
 
 import argparse
+import contextlib
 import difflib
 import io
 import os  # retained for os.environ usage
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional
 
-# Import from new module locations (with backward compatibility)
+from src.tools.core.metrics import METRICS_OUT_ENV
+from src.tools.core.profiling import PROFILE_DIR_ENV, profile_name, profile_section
 from src.tools.utils.print_formatter import normalize_path_for_display, normalize_text
-from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.utils.registry_resolver import (
+    CATALOG_FILES,
+    RegistryResolver,
+    get_registry_resolver,
+)
+
+# Import from new module locations (with backward compatibility)
+from src.tools.validators.change_impact import get_affected_domains, get_changed_files
 
 # New imports from refactored modules
 from src.tools.validators.coherence_validator import validate_artifact_coherence
 from src.tools.validators.conformance_validator import (
     collect_jsonld_files,
+    run_data_conformance,
     validate_data_conformance,
 )
+from src.tools.validators.failing_test_cache import get_failing_test_cache
+from src.tools.validators.syntax_validator import (
+    check_files,
+)
 from src.tools.validators.syntax_validator import (
     check_json_syntax as check_json_wellformedness,
 )
@@ -132,13 +178,19 @@ GITIGNORE_FOLDERS = parse_gitignore_patterns(ROOT_DIR)
 EXPECTED_TARGETCLASS_FAILURES = set()
 
 
-def check_syntax_all(ontology_domains: List[str]) -> int:
-    """Check the syntax of all Turtle (.ttl) and JSON-LD (.json) files."""
+def check_syntax_all(ontology_domains: List[str], jobs: int = 1) -> int:
+    """
+    Check the syntax of all Turtle (.ttl) and JSON-LD (.json) files.
+
+    Args:
+        ontology_domains: List of domain names to check
+        jobs: Number of worker processes checking files in parallel
+    """
     if not ontology_domains:
         return 0
 
     # Use catalog-based discovery for comprehensive JSON-LD file collection
-    catalog_resolver = RegistryResolver(ROOT_DIR)
+    catalog_resolver = get_registry_resolver(ROOT_DIR)
 
     print("\n=== Checking JSON-LD syntax ===", flush=True)
 
@@ -162,11 +214,11 @@ def check_syntax_all(ontology_domains: List[str]) -> int:
                         if file_str not in json_files_to_check:
                             json_files_to_check.append(file_str)
 
-        # Check each file individually
-        json_results = []
-        for json_file in sorted(json_files_to_check):
-            code, msg = check_json_wellformedness(json_file, ROOT_DIR)
-            json_results.append((code, msg))
+        # Check all files, then report in sorted order up to the first error
+        json_results = check_files(
+            sorted(json_files_to_check), check_json_wellformedness, ROOT_DIR, jobs
+        )
+        for code, msg in json_results:
             if code != 0:
                 print(msg, file=sys.stderr)
                 return code
@@ -190,7 +242,7 @@ def check_syntax_all(ontology_domains: List[str]) -> int:
         if fixtures_dir.is_dir():
             dirs_to_check.append(str(fixtures_dir))
 
-        json_ret, json_results = verify_json_syntax(dirs_to_check, ROOT_DIR)
+        json_ret, json_results = verify_json_syntax(dirs_to_check, ROOT_DIR, jobs)
         for code, msg in json_results:
             if code == 0:
                 print(msg)
@@ -205,7 +257,7 @@ def check_syntax_all(ontology_domains: List[str]) -> int:
         for domain in ontology_domains
         if (ARTIFACTS_DIR / domain).is_dir()
     ]
-    ttl_ret, ttl_results = verify_turtle_syntax(ttl_dirs, ROOT_DIR)
+    ttl_ret, ttl_results = verify_turtle_syntax(ttl_dirs, ROOT_DIR, jobs)
     for code, msg in ttl_results:
         if code == 0:
             print(msg)
@@ -217,18 +269,136 @@ def check_syntax_all(ontology_domains: List[str]) -> int:
     return 0
 
 
-def validate_data_conformance_all(ontology_domains: List[str]) -> int:
+def _run_domain_buffered(domain_check: Callable[..., int], domain: str, phase: str):
+    """
+    Run a per-domain check in a worker process with buffered output.
+
+    Args:
+        domain_check: Module-level per-domain check function
+        domain: Domain name passed to the check
+        phase: Phase name (names the profile of the domain)
+
+    Returns:
+        Tuple of (return_code, stdout_text, stderr_text)
+    """
+    out_buffer = io.StringIO()
+    err_buffer = io.StringIO()
+    with contextlib.redirect_stdout(out_buffer), contextlib.redirect_stderr(err_buffer):
+        try:
+            with profile_section(profile_name(phase, domain)):
+                returncode = domain_check(domain)
+        except Exception as e:
+            print(f"❌ Unexpected error for domain '{domain}': {e}", file=sys.stderr)
+            returncode = 1
+    return returncode, out_buffer.getvalue(), err_buffer.getvalue()
+
+
+def _run_domains(
+    domain_check: Callable[..., int],
+    ontology_domains: List[str],
+    jobs: int = 1,
+    phase: str = "",
+    **kwargs,
+) -> int:
+    """
+    Run a per-domain check for all domains, sequentially or in parallel.
+
+    With jobs > 1 the domains are fanned out to a process pool. Output of
+    each domain is buffered in the worker and printed in domain order, so
+    the log reads the same as a sequential run. The first failing domain
+    (in domain order) aborts the phase. With --profile every domain is
+    profiled into <phase>.<domain>.prof.
+
+    Args:
+        domain_check: Module-level function (domain, **kwargs) -> return code
+        ontology_domains: List of domain names to check
+        jobs: Number of worker processes (1 runs in-process)
+        phase: Phase name used for the domain profiles
+        **kwargs: Extra arguments for sequential runs (e.g. a shared resolver)
+
+    Returns:
+        0 if all domains passed, otherwise the first non-zero return code
+    """
+    if jobs <= 1 or len(ontology_domains) <= 1:
+        for domain in ontology_domains:
+            with profile_section(profile_name(phase, domain)):
+                returncode = domain_check(domain, **kwargs)
+            if returncode != 0:
+                return returncode
+        return 0
+
+    workers = min(jobs, len(ontology_domains))
+    print(
+        f"⚡ Running {len(ontology_domains)} domains on {workers} workers", flush=True
+    )
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_domain_buffered, domain_check, domain, phase)
+            for domain in ontology_domains
+        ]
+        for future in futures:
+            returncode, out_text, err_text = future.result()
+            sys.stdout.write(out_text)
+            sys.stdout.flush()
+            sys.stderr.write(err_text)
+            sys.stderr.flush()
+            if returncode != 0:
+                executor.shutdown(wait=True, cancel_futures=True)
+                return returncode
+    return 0
+
+
+def _validate_domain_conformance(
+    domain: str, catalog_resolver: Optional[RegistryResolver] = None
+) -> int:
+    """Validate the valid test data of one domain against its SHACL shapes."""
+    catalog_resolver = catalog_resolver or get_registry_resolver(ROOT_DIR)
+
+    print(f"\n🔍 Starting JSON-LD SHACL validation for domain: {domain}", flush=True)
+
+    jsonld_files = catalog_resolver.get_test_files(domain, test_type="valid")
+    if jsonld_files:
+        print(f"   Found {len(jsonld_files)} test files from catalog", flush=True)
+
+    if not jsonld_files:
+        print(f"⚠️ No JSON-LD files found in '{domain}'. Skipping.", flush=True)
+        return 0
+
+    # Use new catalog-based validator
+    returncode, output = validate_data_conformance(
+        jsonld_files,
+        ROOT_DIR,
+        inference_mode="rdfs",
+        debug=False,
+        logfile=None,
+    )
+
+    if returncode != 0:
+        print(
+            f"\n❌ Error during JSON-LD SHACL validation for domain '{domain}'. Aborting.",
+            file=sys.stderr,
+            flush=True,
+        )
+        return returncode
+
+    print(f"\n✅ {domain} conforms to SHACL constraints.", flush=True)
+    return 0
+
+
+def validate_data_conformance_all(ontology_domains: List[str], jobs: int = 1) -> int:
     """
     Validate JSON-LD files against SHACL schemas.
 
     Args:
         ontology_domains: List of domain names to test
+        jobs: Number of domains validated in parallel worker processes
     """
     if not ontology_domains:
         return 0
     print("\n=== Checking JSON-LD against SHACL ===", flush=True)
 
-    catalog_resolver = RegistryResolver(ROOT_DIR)
+    catalog_resolver = get_registry_resolver(ROOT_DIR)
     if not catalog_resolver.is_catalog_loaded():
         print(
             "❌ Error: tests/catalog-v001.xml is required for catalog-based discovery.",
@@ -238,53 +408,157 @@ def validate_data_conformance_all(ontology_domains: List[str]) -> int:
 
     print("📋 Using catalog-based test discovery\n", flush=True)
 
-    for domain in ontology_domains:
-        print(
-            f"\n🔍 Starting JSON-LD SHACL validation for domain: {domain}", flush=True
-        )
+    return _run_domains(
+        _validate_domain_conformance,
+        ontology_domains,
+        jobs,
+        phase="check-data-conformance",
+        catalog_resolver=catalog_resolver,
+    )
+
 
-        jsonld_files = catalog_resolver.get_test_files(domain, test_type="valid")
-        if jsonld_files:
-            print(f"   Found {len(jsonld_files)} test files from catalog", flush=True)
+def _failing_test_dependencies(
+    schema_files: List[Path], catalog_resolver: RegistryResolver
+) -> List[Path]:
+    """
+    Return the files (besides test and .expected) a failing test depends on.
 
-        if not jsonld_files:
-            print(f"⚠️ No JSON-LD files found in '{domain}'. Skipping.", flush=True)
+    Args:
+        schema_files: Ontology and SHACL files the test was validated against
+            (ValidationResult.schema_files of its run)
+        catalog_resolver: Resolver providing the fixture files
+    """
+    dependencies = list(schema_files)
+    dependencies += [ROOT_DIR / catalog for catalog in CATALOG_FILES]
+    dependencies += [
+        catalog_resolver.to_absolute(fixture)
+        for fixture in catalog_resolver._fixtures_catalog.values()
+    ]
+    return dependencies
+
+
+def _check_domain_failing_tests(
+    domain: str, catalog_resolver: Optional[RegistryResolver] = None
+) -> int:
+    """Run the failing test cases of one domain against their .expected output."""
+    catalog_resolver = catalog_resolver or get_registry_resolver(ROOT_DIR)
+
+    print(f"\n🔍 Running failing tests for domain: {domain}", flush=True)
+
+    invalid_test_files = catalog_resolver.get_test_files(domain, test_type="invalid")
+    if not invalid_test_files:
+        return 0
+
+    test_cache = get_failing_test_cache(ROOT_DIR)
+
+    for test_abs_path in invalid_test_files:
+        test_abs_path = Path(test_abs_path)
+        test_path = normalize_path_for_display(test_abs_path, ROOT_DIR)
+        expected_output_path = test_abs_path.with_suffix("").with_suffix(".expected")
+
+        if not expected_output_path.exists():
+            expected_path_display = normalize_path_for_display(
+                expected_output_path, ROOT_DIR
+            )
+            print(
+                f"⚠️ No expected output file found: {expected_path_display}",
+                file=sys.stderr,
+                flush=True,
+            )
+            return 1
+
+        if test_cache and test_cache.lookup(test_abs_path, expected_output_path):
+            print(
+                f"✅ Test {test_path} for domain {domain} failed as expected (cached).",
+                flush=True,
+            )
             continue
 
+        expected_output = expected_output_path.read_text(encoding="utf-8").strip()
+
+        print(f"🔍 Running failing test: {test_path}", flush=True)
+
+        # Collect failing test file
+        jsonld_files = collect_jsonld_files([str(test_abs_path)])
+
         # Use new catalog-based validator
-        returncode, output = validate_data_conformance(
+        result, output = run_data_conformance(
             jsonld_files,
             ROOT_DIR,
             inference_mode="rdfs",
             debug=False,
             logfile=None,
         )
+        returncode = result.return_code
+        print("\n", flush=True)
+
+        if returncode == 210:
+            output_norm = normalize_text(output)
+            expected_norm = normalize_text(expected_output)
 
-        if returncode != 0:
+            if output_norm == expected_norm:
+                print(
+                    f"✅ Test {test_path} for domain {domain} failed as expected.",
+                    flush=True,
+                )
+                if test_cache:
+                    test_cache.store(
+                        test_abs_path,
+                        expected_output_path,
+                        _failing_test_dependencies(
+                            result.schema_files, catalog_resolver
+                        ),
+                    )
+            else:
+                print(
+                    f"\n❌ Error: Output discrepancy for {test_path}. Aborting.",
+                    file=sys.stderr,
+                    flush=True,
+                )
+
+                # --- DEBUGGING BLOCK START ---
+                print("\n--- DIFF (Expected vs Actual) ---", file=sys.stderr)
+                diff = difflib.unified_diff(
+                    expected_norm.splitlines(),
+                    output_norm.splitlines(),
+                    fromfile="Expected",
+                    tofile="Actual",
+                    lineterm="",
+                )
+                for line in diff:
+                    print(line, file=sys.stderr)
+
+                print("\n--- RAW REPR CHECK ---", file=sys.stderr)
+                # This reveals hidden chars like \r or distinct unicode spaces
+                print(f"Expected len: {len(expected_norm)}", file=sys.stderr)
+                print(f"Actual len:   {len(output_norm)}", file=sys.stderr)
+                # --- DEBUGGING BLOCK END ---
+
+                return 1
+        else:
             print(
-                f"\n❌ Error during JSON-LD SHACL validation for domain '{domain}'. Aborting.",
+                f"\n❌ Test {test_path} did not return code 210 (got {returncode}). Aborting.",
                 file=sys.stderr,
                 flush=True,
             )
-            return returncode
-        else:
-            print(f"\n✅ {domain} conforms to SHACL constraints.", flush=True)
+            return returncode or 1
 
     return 0
 
 
-def check_failing_tests_all(ontology_domains: List[str]) -> int:
+def check_failing_tests_all(ontology_domains: List[str], jobs: int = 1) -> int:
     """
     Run failing test cases from tests/data/{domain}/invalid/ directories.
 
     Args:
         ontology_domains: List of domain names to test
+        jobs: Number of domains checked in parallel worker processes
     """
     if not ontology_domains:
         return 0
     print("\n=== Running failing tests ===", flush=True)
 
-    catalog_resolver = RegistryResolver(ROOT_DIR)
+    catalog_resolver = get_registry_resolver(ROOT_DIR)
     if not catalog_resolver.is_catalog_loaded():
         print(
             "❌ Error: tests/catalog-v001.xml is required for catalog-based discovery.",
@@ -294,129 +568,56 @@ def check_failing_tests_all(ontology_domains: List[str]) -> int:
 
     print("📋 Using catalog-based test discovery\n", flush=True)
 
-    for domain in ontology_domains:
-        print(f"\n🔍 Running failing tests for domain: {domain}", flush=True)
-
-        invalid_test_files = catalog_resolver.get_test_files(
-            domain, test_type="invalid"
-        )
-        if not invalid_test_files:
-            continue
+    return _run_domains(
+        _check_domain_failing_tests,
+        ontology_domains,
+        jobs,
+        phase="check-failing-tests",
+        catalog_resolver=catalog_resolver,
+    )
 
-        for test_abs_path in invalid_test_files:
-            test_abs_path = Path(test_abs_path)
-            test_path = normalize_path_for_display(test_abs_path, ROOT_DIR)
-            expected_output_path = test_abs_path.with_suffix("").with_suffix(
-                ".expected"
-            )
 
-            if not expected_output_path.exists():
-                expected_path_display = normalize_path_for_display(
-                    expected_output_path, ROOT_DIR
-                )
-                print(
-                    f"⚠️ No expected output file found: {expected_path_display}",
-                    file=sys.stderr,
-                    flush=True,
-                )
-                return 1
+def _check_domain_coherence(domain: str) -> int:
+    """Validate the SHACL target classes of one domain against its OWL classes."""
+    print(f"\n🔍 Checking target classes for domain: {domain}", flush=True)
 
-            expected_output = expected_output_path.read_text(encoding="utf-8").strip()
+    # Call the updated validator with the new structure
+    returncode, output = validate_artifact_coherence(domain, root_dir=ROOT_DIR)
 
-            print(f"🔍 Running failing test: {test_path}", flush=True)
+    if output:
+        target = sys.stdout if returncode == 0 else sys.stderr
+        print(output, file=target, flush=True)
 
-            # Collect failing test file
-            jsonld_files = collect_jsonld_files([str(test_abs_path)])
-
-            # Use new catalog-based validator
-            returncode, output = validate_data_conformance(
-                jsonld_files,
-                ROOT_DIR,
-                inference_mode="rdfs",
-                debug=False,
-                logfile=None,
+    if returncode != 0:
+        if domain in EXPECTED_TARGETCLASS_FAILURES:
+            print(
+                f"⚠️ Expected target class failure for '{domain}' (ignored).",
+                flush=True,
             )
-            print("\n", flush=True)
-
-            if returncode == 210:
-                output_norm = normalize_text(output)
-                expected_norm = normalize_text(expected_output)
-
-                if output_norm == expected_norm:
-                    print(
-                        f"✅ Test {test_path} for domain {domain} failed as expected.",
-                        flush=True,
-                    )
-                else:
-                    print(
-                        f"\n❌ Error: Output discrepancy for {test_path}. Aborting.",
-                        file=sys.stderr,
-                        flush=True,
-                    )
-
-                    # --- DEBUGGING BLOCK START ---
-                    print("\n--- DIFF (Expected vs Actual) ---", file=sys.stderr)
-                    diff = difflib.unified_diff(
-                        expected_norm.splitlines(),
-                        output_norm.splitlines(),
-                        fromfile="Expected",
-                        tofile="Actual",
-                        lineterm="",
-                    )
-                    for line in diff:
-                        print(line, file=sys.stderr)
-
-                    print("\n--- RAW REPR CHECK ---", file=sys.stderr)
-                    # This reveals hidden chars like \r or distinct unicode spaces
-                    print(f"Expected len: {len(expected_norm)}", file=sys.stderr)
-                    print(f"Actual len:   {len(output_norm)}", file=sys.stderr)
-                    # --- DEBUGGING BLOCK END ---
-
-                    return 1
-            else:
-                print(
-                    f"\n❌ Test {test_path} did not return code 210 (got {returncode}). Aborting.",
-                    file=sys.stderr,
-                    flush=True,
-                )
-                return returncode or 1
+            return 0
+        print(
+            f"\n❌ Error {returncode} during target class validation for {domain}. Aborting.",
+            file=sys.stderr,
+            flush=True,
+        )
+        return returncode
 
+    print(f"✅ Target classes are correctly defined for {domain}.", flush=True)
     return 0
 
 
-def validate_artifact_coherence_all(ontology_domains: List[str]) -> int:
+def validate_artifact_coherence_all(ontology_domains: List[str], jobs: int = 1) -> int:
     """Validate target classes against OWL for each domain."""
     if not ontology_domains:
         return 0
     print("\n=== Checking target classes against OWL classes ===", flush=True)
 
-    for domain in ontology_domains:
-        print(f"\n🔍 Checking target classes for domain: {domain}", flush=True)
-
-        # Call the updated validator with the new structure
-        returncode, output = validate_artifact_coherence(domain, root_dir=ROOT_DIR)
-
-        if output:
-            target = sys.stdout if returncode == 0 else sys.stderr
-            print(output, file=target, flush=True)
-
-        if returncode != 0:
-            if domain in EXPECTED_TARGETCLASS_FAILURES:
-                print(
-                    f"⚠️ Expected target class failure for '{domain}' (ignored).",
-                    flush=True,
-                )
-                continue
-            print(
-                f"\n❌ Error {returncode} during target class validation for {domain}. Aborting.",
-                file=sys.stderr,
-                flush=True,
-            )
-            return returncode
-        else:
-            print(f"✅ Target classes are correctly defined for {domain}.", flush=True)
-
-    return 0
+    return _run_domains(
+        _check_domain_coherence,
+        ontology_domains,
+        jobs,
+        phase="check-artifact-coherence",
+    )
 
 
 # --- CLI / Main Logic ---
@@ -445,7 +646,14 @@ def main():
         )
         sys.exit(1)
 
-    # 3. Argument Parsing
+    # 3. Server mode: hand over to the validation daemon
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from src.tools.validators.validation_server import main as serve_main
+
+        serve_main(sys.argv[2:])
+        return
+
+    # 4. Argument Parsing
     # Use the module docstring (__doc__) as the description
     parser = argparse.ArgumentParser(
         description=__doc__,  # <--- CHANGED: Uses the detailed docstring from the top of the file
@@ -489,6 +697,14 @@ def main():
         help="File or directory path(s) to validate.",
     )
 
+    target_group.add_argument(
+        "--changed-since",
+        type=str,
+        default=None,
+        metavar="REF",
+        help="Only validate domains affected by changes since this git ref.",
+    )
+
     # Move legacy/deprecated args to the general parser or suppress them clearly
     parser.add_argument(
         "--folder",
@@ -505,7 +721,53 @@ def main():
         help="Disable catalog-based discovery (use file system only)",
     )
 
+    options_group.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Validate N domains (or syntax-check N files) in parallel worker "
+            "processes (0: one per CPU)"
+        ),
+    )
+
+    options_group.add_argument(
+        "--profile",
+        type=Path,
+        metavar="DIR",
+        help=(
+            "Profile every phase and domain with cProfile and write "
+            "<phase>[.<domain>].prof files to DIR"
+        ),
+    )
+
+    options_group.add_argument(
+        "--metrics-out",
+        type=Path,
+        metavar="FILE",
+        help=(
+            "Write per-stage timing, memory, triple and file counts of every "
+            "SHACL validation run to FILE (JSON Lines)"
+        ),
+    )
+
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if args.metrics_out:
+        # Passed via the environment so that worker processes append as well
+        metrics_out = args.metrics_out.resolve()
+        metrics_out.parent.mkdir(parents=True, exist_ok=True)
+        metrics_out.write_text("", encoding="utf-8")
+        os.environ[METRICS_OUT_ENV] = str(metrics_out)
+
+    if args.profile:
+        # Passed via the environment so that worker processes profile as well
+        profile_dir = args.profile.resolve()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        os.environ[PROFILE_DIR_ENV] = str(profile_dir)
 
     # PATH MODE: User specified file/directory paths
     # Create temporary catalog domain for these paths
@@ -527,7 +789,8 @@ def main():
             print("❌ Error: No valid paths provided.", file=sys.stderr)
             sys.exit(1)
 
-        # Create catalog resolver and temporary domain
+        # Create a private catalog resolver (the shared one must not be
+        # modified) and register the temporary domain
         catalog_resolver = RegistryResolver(ROOT_DIR)
         temp_domain = catalog_resolver.create_temporary_domain(valid_paths)
 
@@ -544,7 +807,7 @@ def main():
     # DOMAIN MODE: User specified catalog domains
     elif args.domain is not None:
         print(f"🔍 Domain mode: Using catalog for domain(s): {args.domain}", flush=True)
-        catalog_resolver = RegistryResolver(ROOT_DIR)
+        catalog_resolver = get_registry_resolver(ROOT_DIR)
         available_domains = set(catalog_resolver.get_test_domains())
         ontology_domains = [d for d in args.domain if d in available_domains]
 
@@ -561,7 +824,7 @@ def main():
     # AUTO MODE: Discover all domains from catalog
     else:
         print("🔍 Auto mode: Discovering all domains from catalog", flush=True)
-        catalog_resolver = RegistryResolver(ROOT_DIR)
+        catalog_resolver = get_registry_resolver(ROOT_DIR)
         ontology_domains = catalog_resolver.get_test_domains()
         paths_to_check = None
 
@@ -571,6 +834,30 @@ def main():
 
         print(f"Detected ontology domains: {ontology_domains}", flush=True)
 
+    # INCREMENTAL: Restrict catalog domains to those affected by changes
+    if args.changed_since:
+        if args.path:
+            print(
+                "❌ Error: --changed-since cannot be used with --path.", file=sys.stderr
+            )
+            sys.exit(1)
+        try:
+            changed_files = get_changed_files(ROOT_DIR, args.changed_since)
+        except ValueError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        affected = set(get_affected_domains(changed_files, catalog_resolver))
+        ontology_domains = [d for d in ontology_domains if d in affected]
+        print(
+            f"🔍 {len(changed_files)} file(s) changed since {args.changed_since}; "
+            f"affected domains: {ontology_domains}",
+            flush=True,
+        )
+        if not ontology_domains:
+            print("No domains affected by the changes. Exiting.")
+            sys.exit(0)
+
     # 5. Define validation checks based on mode (PATH vs DOMAIN)
     if args.path:
         # PATH MODE: Use temporary catalog domain
@@ -612,7 +899,7 @@ def main():
 
             # Check TTL files directly
             print("\n=== Checking TTL syntax ===", flush=True)
-            ttl_ret, ttl_results = verify_turtle_syntax(paths_to_check, ROOT_DIR)
+            ttl_ret, ttl_results = verify_turtle_syntax(paths_to_check, ROOT_DIR, jobs)
             for code, msg in ttl_results:
                 if code == 0:
                     print(msg)
@@ -682,24 +969,26 @@ def main():
         # DOMAIN MODE: Validate using catalog structure
         check_map = {
             "check-syntax": [
-                ("Check Syntax", lambda: check_syntax_all(ontology_domains))
+                ("Check Syntax", lambda: check_syntax_all(ontology_domains, jobs=jobs))
             ],
             "check-artifact-coherence": [
                 (
                     "Check Artifact Coherence",
-                    lambda: validate_artifact_coherence_all(ontology_domains),
+                    lambda: validate_artifact_coherence_all(
+                        ontology_domains, jobs=jobs
+                    ),
                 )
             ],
             "check-data-conformance": [
                 (
                     "Check Data Conformance",
-                    lambda: validate_data_conformance_all(ontology_domains),
+                    lambda: validate_data_conformance_all(ontology_domains, jobs=jobs),
                 )
             ],
             "check-failing-tests": [
                 (
                     "Check Failing Tests",
-                    lambda: check_failing_tests_all(ontology_domains),
+                    lambda: check_failing_tests_all(ontology_domains, jobs=jobs),
                 )
             ],
         }
@@ -717,7 +1006,8 @@ def main():
     print(f"\n🚀 Running check mode: {args.run.upper()} ...", flush=True)
 
     for name, phase_func in checks_to_run:
-        rc = phase_func()
+        with profile_section(profile_name(name)):
+            rc = phase_func()
         if rc != 0:
             print(
                 f"\n❌ {name} phase failed (code {rc}). Aborting.",
@@ -727,6 +1017,8 @@ def main():
             sys.exit(rc)
 
     print(f"\n✅ {args.run.upper()} checks completed successfully!", flush=True)
+    if args.profile:
+        print(f"📊 Profiles written to {args.profile}", flush=True)
 
 
 if __name__ == "__main__":
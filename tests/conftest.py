@@ -360,6 +360,37 @@ def mock_registry(temp_dir) -> Dict:
     return registry
 
 
+@pytest.fixture
+def minimal_repo(temp_dir) -> Path:
+    """
+    Minimal repository layout with one cataloged domain ("minimal").
+
+    Creates docs/registry.json, artifacts/catalog-v001.xml and the minimal
+    OWL + SHACL files so that RegistryResolver and ShaclValidator can run
+    against temp_dir as repository root.
+    """
+    (temp_dir / "docs").mkdir(parents=True, exist_ok=True)
+    (temp_dir / "docs" / "registry.json").write_text(
+        '{"version":"1.0.0","ontologies":{}}'
+    )
+
+    domain_dir = temp_dir / "artifacts" / "minimal"
+    domain_dir.mkdir(parents=True, exist_ok=True)
+    (domain_dir / "minimal.owl.ttl").write_text(MINIMAL_OWL_ONTOLOGY)
+    (domain_dir / "minimal.shacl.ttl").write_text(MINIMAL_SHACL_SHAPES)
+    (temp_dir / "artifacts" / "catalog-v001.xml").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE catalog PUBLIC "-//OASIS//DTD Entity Resolution XML Catalog V1.0//EN"
+  "http://www.oasis-open.org/committees/entity/release/1.0/catalog.dtd">
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+  <uri name="http://test.example.org/minimal/v1/" uri="minimal/minimal.owl.ttl"/>
+  <uri name="http://test.example.org/minimal/v1/shapes" uri="minimal/minimal.shacl.ttl"/>
+</catalog>
+"""
+    )
+    return temp_dir
+
+
 # =============================================================================
 # Test Data Discovery Fixtures
 # =============================================================================
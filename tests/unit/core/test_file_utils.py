@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.core.file_utils.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from src.tools.core.file_utils import (
+    atomic_write,
+    file_sha256,
+    file_stamp,
+    file_stamps,
+)
+
+
+def test_file_sha256_is_memoized_per_stamp(temp_dir: Path, monkeypatch):
+    path = temp_dir / "data.ttl"
+    path.write_text("first")
+    assert file_sha256(path) == hashlib.sha256(b"first").hexdigest()
+
+    # Unchanged stamp: the file is not read again
+    monkeypatch.setattr(Path, "open", None)
+    assert file_sha256(path) == hashlib.sha256(b"first").hexdigest()
+    monkeypatch.undo()
+
+    path.write_text("second")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    assert file_sha256(path) == hashlib.sha256(b"second").hexdigest()
+
+
+def test_missing_files(temp_dir: Path):
+    missing = temp_dir / "missing.ttl"
+    assert file_sha256(missing) is None
+    assert file_stamp(missing) == (-1, -1)
+    assert file_stamps([missing]) == {str(missing): (-1, -1)}
+
+
+def test_atomic_write_cleans_up_on_error(temp_dir: Path):
+    target = temp_dir / "record.json"
+    atomic_write(target, lambda p: p.write_text("ok"))
+    assert target.read_text() == "ok"
+
+    def fail(path: Path) -> None:
+        path.write_text("partial")
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        atomic_write(target, fail)
+    assert target.read_text() == "ok"
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["record.json"]
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.core.metrics module.
+"""
+
+import json
+from pathlib import Path
+
+
+class TestValidationMetrics:
+    """Tests for ValidationMetrics stage measurement."""
+
+    def test_stage_records_wall_and_cpu_time(self):
+        """Entering a stage should record its timings."""
+        from src.tools.core.metrics import ValidationMetrics
+
+        metrics = ValidationMetrics()
+        with metrics.stage("load_data"):
+            sum(range(10000))
+
+        stage = metrics.stages["load_data"]
+        assert stage.wall_seconds > 0
+        assert stage.cpu_seconds >= 0
+
+    def test_repeated_stage_accumulates(self):
+        """Entering a stage twice should add up its wall time."""
+        from src.tools.core.metrics import ValidationMetrics
+
+        metrics = ValidationMetrics()
+        with metrics.stage("inference"):
+            pass
+        first = metrics.stages["inference"].wall_seconds
+        with metrics.stage("inference"):
+            pass
+
+        assert metrics.stages["inference"].wall_seconds > first
+
+    def test_stage_recorded_when_block_raises(self):
+        """A failing stage should still be recorded."""
+        from src.tools.core.metrics import ValidationMetrics
+
+        metrics = ValidationMetrics()
+        try:
+            with metrics.stage("validation"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        assert "validation" in metrics.stages
+
+    def test_to_dict_is_json_serializable(self):
+        """to_dict should contain stages, triples and files_parsed."""
+        from src.tools.core.metrics import ValidationMetrics
+
+        metrics = ValidationMetrics()
+        with metrics.stage("formatting"):
+            pass
+        metrics.triples["data"] = 3
+        metrics.files_parsed["data"] = 1
+
+        data = json.loads(json.dumps(metrics.to_dict()))
+
+        assert set(data["stages"]["formatting"]) == {
+            "wall_seconds",
+            "cpu_seconds",
+            "peak_rss_kb",
+            "tracemalloc_peak_kb",
+        }
+        assert data["triples"] == {"data": 3}
+        assert data["files_parsed"] == {"data": 1}
+
+
+class TestMetricsOutput:
+    """Tests for the JSON Lines metrics output."""
+
+    def test_append_metrics_writes_one_line_per_record(self, temp_dir: Path):
+        """Each record should be appended as a separate JSON line."""
+        from src.tools.core.metrics import append_metrics
+
+        out = temp_dir / "nested" / "metrics.jsonl"
+        append_metrics(out, {"run": 1})
+        append_metrics(out, {"run": 2})
+
+        lines = out.read_text().splitlines()
+        assert [json.loads(line)["run"] for line in lines] == [1, 2]
+
+    def test_get_metrics_out_reads_environment(self, monkeypatch):
+        """get_metrics_out should follow ONTOLOGY_METRICS_OUT."""
+        from src.tools.core.metrics import METRICS_OUT_ENV, get_metrics_out
+
+        monkeypatch.delenv(METRICS_OUT_ENV, raising=False)
+        assert get_metrics_out() is None
+
+        monkeypatch.setenv(METRICS_OUT_ENV, "out/metrics.jsonl")
+        assert get_metrics_out() == Path("out/metrics.jsonl")
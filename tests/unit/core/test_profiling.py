@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.core.profiling module.
+"""
+
+import io
+from pathlib import Path
+
+
+class TestProfileSection:
+    """Tests for profile_section."""
+
+    def test_disabled_without_directory(self, monkeypatch):
+        """profile_section should do nothing without a profile directory."""
+        from src.tools.core.profiling import PROFILE_DIR_ENV, profile_section
+
+        monkeypatch.delenv(PROFILE_DIR_ENV, raising=False)
+        with profile_section("phase") as path:
+            pass
+
+        assert path is None
+
+    def test_nested_sections_write_separate_profiles(self, temp_dir: Path):
+        """Nested sections should each write their own .prof file."""
+        from src.tools.core.profiling import profile_name, profile_section
+
+        with profile_section("check-syntax", temp_dir):
+            with profile_section(profile_name("check-syntax", "manifest"), temp_dir):
+                sum(range(1000))
+
+        assert sorted(p.name for p in temp_dir.glob("*.prof")) == [
+            "check-syntax.manifest.prof",
+            "check-syntax.prof",
+        ]
+
+    def test_directory_from_environment(self, temp_dir: Path, monkeypatch):
+        """ONTOLOGY_PROFILE_DIR should enable profiling."""
+        from src.tools.core.profiling import PROFILE_DIR_ENV, profile_section
+
+        monkeypatch.setenv(PROFILE_DIR_ENV, str(temp_dir / "profiles"))
+        with profile_section("phase") as path:
+            pass
+
+        assert path == temp_dir / "profiles" / "phase.prof"
+        assert path.exists()
+
+    def test_profile_is_readable_by_pstats(self, temp_dir: Path):
+        """print_profile should report the profiled calls."""
+        from src.tools.core.profiling import print_profile, profile_section
+
+        with profile_section("phase", temp_dir) as path:
+            sorted(range(100))
+        buffer = io.StringIO()
+        print_profile(path, top=5, file=buffer)
+
+        assert "function calls" in buffer.getvalue()
+
+
+class TestProfileName:
+    """Tests for profile_name."""
+
+    def test_joins_sanitized_parts(self):
+        """Parts should be lowercased, sanitized and joined with dots."""
+        from src.tools.core.profiling import profile_name
+
+        assert profile_name("Check Syntax", "my/domain") == "check-syntax.my-domain"
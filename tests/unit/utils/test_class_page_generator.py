@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.utils.class_page_generator.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.tools.utils import class_page_generator
+from src.tools.utils.class_page_generator import generate_all_class_pages
+
+OWL_TTL = """@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix {domain}: <https://example.org/{domain}/v1/> .
+
+{domain}:Thing a owl:Class ;
+    rdfs:comment "{comment}" .
+"""
+
+SHACL_TTL = """@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix a: <https://example.org/a/v1/> .
+@prefix b: <https://example.org/b/v1/> .
+
+b:ThingShape a sh:NodeShape ;
+    sh:targetClass b:Thing ;
+    sh:property [ sh:path b:{path} ; sh:class a:Thing ] .
+"""
+
+
+@pytest.fixture
+def artifacts(temp_dir: Path, monkeypatch):
+    artifacts_dir = temp_dir / "artifacts"
+    classes_dir = temp_dir / "classes"
+    monkeypatch.setattr(class_page_generator, "ARTIFACTS_DIR", artifacts_dir)
+    monkeypatch.setattr(class_page_generator, "CLASSES_DIR", classes_dir)
+
+    for domain in ("a", "b"):
+        _write(artifacts_dir / domain / f"{domain}.owl.ttl", domain, "First")
+    (artifacts_dir / "b" / "b.shacl.ttl").write_text(SHACL_TTL.format(path="uses"))
+    return artifacts_dir
+
+
+def _write(owl_file: Path, domain: str, comment: str) -> None:
+    owl_file.parent.mkdir(parents=True, exist_ok=True)
+    owl_file.write_text(OWL_TTL.format(domain=domain, comment=comment))
+
+
+def test_unchanged_inputs_are_not_rendered(artifacts: Path):
+    first = generate_all_class_pages()
+    second = generate_all_class_pages()
+
+    # a and b: index + Thing page; gx redirect; main index
+    assert (first.rendered, first.written) == (6, 6)
+    assert (second.rendered, second.written) == (0, 0)
+    assert generate_all_class_pages(force=True).written == 0
+
+
+def test_changed_domain_renders_its_pages_only(artifacts: Path):
+    generate_all_class_pages()
+    _write(artifacts / "b" / "b.owl.ttl", "b", "Second")
+
+    writer = generate_all_class_pages()
+
+    assert writer.rendered == 2
+    assert writer.written == 2
+    page = class_page_generator.CLASSES_DIR / "b" / "Thing.md"
+    assert "Second" in page.read_text()
+
+
+def test_usages_change_renders_referenced_page(artifacts: Path):
+    generate_all_class_pages()
+    (artifacts / "b" / "b.shacl.ttl").write_text(SHACL_TTL.format(path="needs"))
+
+    writer = generate_all_class_pages()
+
+    # b changed; a/Thing.md lists the new usage, a/index.md is unchanged
+    assert writer.rendered == 3
+    assert "needs" in (class_page_generator.CLASSES_DIR / "a" / "Thing.md").read_text()
+
+
+def test_changed_source_artifact_renders_its_domain(artifacts: Path):
+    context_file = artifacts / "b" / "b.context.jsonld"
+    context_file.write_text('{"@context": {}}')
+    generate_all_class_pages()
+    context_file.write_text('{"@context": {"b": "https://example.org/b/v1/"}}')
+
+    writer = generate_all_class_pages()
+
+    # The Source section only names the file, so the pages stay the same
+    assert (writer.rendered, writer.written) == (2, 0)
+
+
+def test_generator_key_covers_docs_model():
+    sources = class_page_generator.GENERATOR_SOURCES
+    assert {path.name for path in sources} == {
+        "class_page_generator.py",
+        "docs_model.py",
+    }
+    assert all(path.is_file() for path in sources)
+
+
+def test_pages_no_longer_generated_are_removed(artifacts: Path):
+    generate_all_class_pages()
+    (artifacts / "b" / "b.owl.ttl").write_text(
+        (artifacts / "b" / "b.owl.ttl").read_text().replace("b:Thing", "b:Other")
+    )
+
+    writer = generate_all_class_pages()
+
+    assert writer.removed == 1
+    assert not (class_page_generator.CLASSES_DIR / "b" / "Thing.md").exists()
+    assert (class_page_generator.CLASSES_DIR / "b" / "Other.md").exists()
+
+
+def test_parallel_rendering_matches_serial(artifacts: Path):
+    generate_all_class_pages(jobs=1)
+    pages = sorted(class_page_generator.CLASSES_DIR.rglob("*.md"))
+    serial = {page: page.read_text() for page in pages}
+
+    writer = generate_all_class_pages(force=True, jobs=2)
+
+    assert writer.rendered == len(pages)
+    assert writer.written == 0
+    assert {page: page.read_text() for page in pages} == serial
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.utils.docs_model.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.tools.utils import class_page_generator, properties_updater
+from src.tools.utils.docs_model import DOCS_JOBS_ENV, DocsModel, get_docs_jobs
+
+OWL_TTL = """@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix demo: <http://example.org/demo/v1/> .
+
+demo:Thing a owl:Class ;
+    rdfs:label "Thing" .
+"""
+
+SHACL_TTL = """@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix demo: <http://example.org/demo/v1/> .
+
+demo:ThingShape a sh:NodeShape ;
+    sh:targetClass demo:Thing ;
+    sh:property [ sh:path demo:name ; sh:datatype xsd:string ] .
+"""
+
+
+def _write_domain(artifacts_dir: Path) -> Path:
+    domain_dir = artifacts_dir / "demo"
+    domain_dir.mkdir(parents=True)
+    (domain_dir / "demo.owl.ttl").write_text(OWL_TTL)
+    (domain_dir / "demo.shacl.ttl").write_text(SHACL_TTL)
+    return domain_dir
+
+
+def test_graph_is_parsed_once_per_file(temp_dir: Path):
+    domain_dir = _write_domain(temp_dir)
+    model = DocsModel(temp_dir)
+
+    first = model.graph(domain_dir / "demo.owl.ttl")
+    second = model.graph(temp_dir / "demo" / ".." / "demo" / "demo.owl.ttl")
+
+    assert first is second
+    assert model.parses == 1
+    assert model.domain_dirs() == [domain_dir]
+
+
+def test_generators_share_the_model(temp_dir: Path, monkeypatch):
+    artifacts_dir = temp_dir / "artifacts"
+    domain_dir = _write_domain(artifacts_dir)
+    classes_dir = temp_dir / "classes"
+    monkeypatch.setattr(properties_updater, "ARTIFACTS_DIR", artifacts_dir)
+    monkeypatch.setattr(class_page_generator, "ARTIFACTS_DIR", artifacts_dir)
+    monkeypatch.setattr(class_page_generator, "CLASSES_DIR", classes_dir)
+
+    model = DocsModel(artifacts_dir)
+    properties_updater.generate_properties_docs(model)
+    class_page_generator.generate_all_class_pages(model=model)
+
+    assert model.parses == 2
+    assert (
+        "|Thing|http://example.org/demo/v1/Thing|"
+        in (domain_dir / "PROPERTIES.md").read_text()
+    )
+    assert "## Slots" in (classes_dir / "demo" / "Thing.md").read_text()
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("", 1), ("4", 4), ("0", 0), ("many", 1), ("-2", 1)]
+)
+def test_get_docs_jobs_reads_environment(monkeypatch, value, expected):
+    monkeypatch.setenv(DOCS_JOBS_ENV, value)
+    assert get_docs_jobs() == expected
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.utils.graph_cache.
+"""
+
+import os
+from pathlib import Path
+
+from rdflib import Graph, Literal, Namespace
+
+from src.tools.utils import graph_cache, graph_loader
+
+EX = Namespace("http://example.org/")
+
+TTL_CONTENT = """@prefix ex: <http://example.org/> .
+ex:a ex:p ex:o ;
+    ex:label "A" .
+"""
+
+
+def test_parse_into_populates_and_reuses_cache(temp_dir: Path):
+    ttl_file = temp_dir / "data.ttl"
+    ttl_file.write_text(TTL_CONTENT)
+    cache = graph_cache.GraphCache(temp_dir / "cache")
+
+    first = Graph()
+    cache.parse_into(first, ttl_file)
+    second = Graph()
+    cache.parse_into(second, ttl_file)
+
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert set(first) == set(second)
+    assert (EX.a, EX.label, Literal("A")) in second
+
+
+def test_lookup_survives_touch_with_same_content(temp_dir: Path):
+    ttl_file = temp_dir / "data.ttl"
+    ttl_file.write_text(TTL_CONTENT)
+    cache = graph_cache.GraphCache(temp_dir / "cache")
+    cache.parse_into(Graph(), ttl_file)
+
+    stat = ttl_file.stat()
+    os.utime(ttl_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    assert cache.lookup(ttl_file) is not None
+
+
+def test_lookup_misses_after_content_change(temp_dir: Path):
+    ttl_file = temp_dir / "data.ttl"
+    ttl_file.write_text(TTL_CONTENT)
+    cache = graph_cache.GraphCache(temp_dir / "cache")
+    cache.parse_into(Graph(), ttl_file)
+
+    ttl_file.write_text(TTL_CONTENT + "ex:b ex:p ex:o .\n")
+
+    assert cache.lookup(ttl_file) is None
+    graph = Graph()
+    cache.parse_into(graph, ttl_file)
+    assert (EX.b, EX.p, EX.o) in graph
+    # Payload of the previous revision is dropped
+    assert len(list((temp_dir / "cache").glob("*.nt"))) == 1
+
+
+def test_get_graph_cache_disabled_by_env(temp_dir: Path, monkeypatch):
+    monkeypatch.setenv(graph_cache.GRAPH_CACHE_ENV, "0")
+    assert graph_cache.get_graph_cache(temp_dir) is None
+
+    monkeypatch.setenv(graph_cache.GRAPH_CACHE_ENV, "1")
+    cache = graph_cache.get_graph_cache(temp_dir)
+    assert cache.cache_dir == temp_dir / graph_cache.GRAPH_CACHE_DIRNAME
+
+
+def test_load_turtle_files_uses_cache(temp_dir: Path):
+    ttl_file = temp_dir / "data.ttl"
+    ttl_file.write_text(TTL_CONTENT)
+
+    cold = graph_loader.load_turtle_files([ttl_file], temp_dir)
+    warm = graph_loader.load_turtle_files([ttl_file], temp_dir)
+
+    assert len(cold) == len(warm) == 2
+    assert list((temp_dir / graph_cache.GRAPH_CACHE_DIRNAME).glob("*.nt"))
+
+
+def test_parse_into_restores_prefix_bindings(temp_dir: Path):
+    ttl_file = temp_dir / "data.ttl"
+    ttl_file.write_text(TTL_CONTENT)
+    cache = graph_cache.GraphCache(temp_dir / "cache")
+
+    cache.parse_into(Graph(), ttl_file)
+    warm = Graph()
+    cache.parse_into(warm, ttl_file)
+
+    assert cache.hits == 1
+    assert ("ex", str(EX)) in {(p, str(n)) for p, n in warm.namespaces()}
+
+
+def test_identical_sources_keep_their_payloads(temp_dir: Path):
+    first = temp_dir / "first.ttl"
+    second = temp_dir / "second.ttl"
+    first.write_text(TTL_CONTENT)
+    second.write_text(TTL_CONTENT)
+    cache = graph_cache.GraphCache(temp_dir / "cache")
+    cache.parse_into(Graph(), first)
+    cache.parse_into(Graph(), second)
+
+    # A new revision of one file must not evict the other file's payload
+    first.write_text(TTL_CONTENT + "ex:b ex:p ex:o .\n")
+    cache.parse_into(Graph(), first)
+
+    assert cache.lookup(second) is not None
+    assert cache.lookup(first) is not None
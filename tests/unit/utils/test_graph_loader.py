@@ -109,3 +109,26 @@ def test_load_fixtures_for_iris(temp_dir: Path):
     )
     assert loaded == 1
     assert len(g) >= 1
+
+
+def test_load_jsonld_files_converts_large_graph_in_slices(temp_dir: Path, monkeypatch):
+    document = {
+        "@context": {"ex": "http://example.org/"},
+        "@graph": [
+            {"@id": f"ex:n{i}", "ex:next": {"@id": f"ex:n{i + 1}"}, "ex:tag": "_:b"}
+            for i in range(5)
+        ],
+    }
+    jsonld_file = temp_dir / "large.json"
+    jsonld_file.write_text(json.dumps(document))
+
+    expected = Graph()
+    expected.parse(str(jsonld_file), format="json-ld")
+
+    monkeypatch.setattr(graph_loader, "JSONLD_GRAPH_CHUNK_SIZE", 2)
+    g, prefixes = graph_loader.load_jsonld_files(
+        [jsonld_file], temp_dir, store="default"
+    )
+
+    assert set(g) == set(expected)
+    assert prefixes == {"ex": "http://example.org/"}
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.utils.graph_store.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from rdflib import Graph, Literal, Namespace
+
+from src.tools.utils import graph_store
+
+pytestmark = pytest.mark.skipif(
+    graph_store.ox is None, reason="pyoxigraph is not installed"
+)
+
+EX = Namespace("http://example.org/")
+
+TTL_CONTENT = """@prefix ex: <http://example.org/> .
+ex:a ex:p ex:o ;
+    ex:label "A" .
+"""
+
+
+@pytest.fixture
+def store_root(temp_dir: Path):
+    root = temp_dir.resolve()
+    (root / "a.ttl").write_text(TTL_CONTENT)
+    (root / "b.ttl").write_text(
+        "@prefix ex: <http://example.org/> .\nex:b ex:p ex:o .\n"
+    )
+    graph_store._open_stores.clear()
+    yield root
+    graph_store._open_stores.clear()
+
+
+def _build(root: Path, files, **kwargs) -> bool:
+    return graph_store.build_graph_store(
+        SimpleNamespace(root_dir=root), files=files, **kwargs
+    )
+
+
+def test_build_stores_one_named_graph_per_file(store_root: Path):
+    assert _build(store_root, ["a.ttl", "b.ttl"]) is True
+
+    store = graph_store.get_graph_store(store_root)
+    view = store.graph(store_root / "a.ttl")
+    expected = Graph().parse(store_root / "a.ttl", format="turtle")
+
+    # Oxigraph returns plain literals as explicit xsd:string literals
+    assert {(s, p, str(o)) for s, p, o in view} == {
+        (s, p, str(o)) for s, p, o in expected
+    }
+    assert (EX.b, EX.p, EX.o) not in view
+    assert str(dict(view.namespaces())["ex"]) == str(EX)
+
+
+def test_build_is_skipped_when_current(store_root: Path):
+    assert _build(store_root, ["a.ttl"]) is True
+    assert _build(store_root, ["a.ttl"]) is False
+    # A different file set or force rebuilds
+    assert _build(store_root, ["a.ttl", "b.ttl"]) is True
+    assert _build(store_root, ["a.ttl", "b.ttl"], force=True) is True
+
+
+def test_read_graph_parses_changed_and_unknown_files(store_root: Path):
+    _build(store_root, ["a.ttl"])
+    (store_root / "a.ttl").write_text(
+        '@prefix ex: <http://example.org/> .\nex:a ex:label "changed" .\n'
+    )
+
+    changed = graph_store.read_graph(store_root / "a.ttl", store_root)
+    unknown = graph_store.read_graph(store_root / "b.ttl", store_root)
+
+    assert (EX.a, EX.label, Literal("changed")) in changed
+    assert (EX.b, EX.p, EX.o) in unknown
+
+
+def test_read_graph_respects_disable_env(store_root: Path, monkeypatch):
+    _build(store_root, ["a.ttl"])
+    monkeypatch.setenv(graph_store.GRAPH_STORE_ENV, "0")
+
+    graph = graph_store.read_graph(store_root / "a.ttl", store_root)
+
+    assert graph_store.get_graph_store(store_root) is None
+    assert (EX.a, EX.label, Literal("A")) in graph
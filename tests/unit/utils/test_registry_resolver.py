@@ -4,9 +4,14 @@ Unit tests for src.tools.utils.registry_resolver catalog resolution.
 """
 
 import json
+import os
 from pathlib import Path
 
-from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.utils.registry_resolver import (
+    IriPrefixTrie,
+    RegistryResolver,
+    get_registry_resolver,
+)
 
 
 def _write_registry(root: Path, registry: dict) -> None:
@@ -110,6 +115,19 @@ def test_artifacts_catalog_drives_domain_resolution(temp_dir):
     )
 
 
+def test_iri_prefix_trie_matches_all_and_longest_prefix():
+    trie = IriPrefixTrie()
+    trie.add("http://example.org/", "root")
+    trie.add("http://example.org/demo/", "demo")
+    trie.add("http://example.org/demo/", "demo-alias")
+
+    iri = "http://example.org/demo/Thing"
+    assert list(trie.matches(iri)) == ["root", "demo", "demo-alias"]
+    assert trie.longest_match(iri) == "demo"
+    assert trie.longest_match("http://example.org/other") == "root"
+    assert trie.longest_match("https://example.org/demo/Thing") is None
+
+
 def test_base_ontology_filtering_by_iris(temp_dir):
     registry = {
         "version": "1.0.0",
@@ -177,3 +195,26 @@ def test_base_ontology_filtering_normalizes_http_https(temp_dir):
     filtered = resolver.get_base_ontology_paths_for_iris({"https://schema.org/name"})
 
     assert filtered == ["imports/schema/schema.owl.ttl"]
+
+
+def test_get_registry_resolver_reuses_until_catalog_changes(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    catalog = """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+  <uri name="http://example.org/rdf" uri="rdf/rdf.owl.ttl"/>
+</catalog>
+"""
+    _write_imports_catalog(temp_dir, catalog)
+    _write_artifacts_catalog(temp_dir, catalog)
+
+    first = get_registry_resolver(temp_dir)
+    assert get_registry_resolver(temp_dir) is first
+
+    catalog_path = temp_dir / "imports" / "catalog-v001.xml"
+    catalog_path.write_text(catalog.replace("rdf/rdf.owl.ttl", "rdfs/rdfs.owl.ttl"))
+    stat = catalog_path.stat()
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = get_registry_resolver(temp_dir)
+    assert second is not first
+    assert second.get_base_ontology_paths() == ["imports/rdfs/rdfs.owl.ttl"]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.utils.schema_index.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.utils.schema_index import (
+    SCHEMA_INDEX_PATH,
+    build_schema_index,
+    load_schema_index,
+    render_schema_index,
+)
+
+PREFIXES = """@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix base: <http://example.org/base/v1/> .
+@prefix app: <http://example.org/app/v1/> .
+"""
+
+
+def _write_repo(root: Path) -> None:
+    """Create domain "app" whose shapes reference a class of domain "base"."""
+    (root / "docs").mkdir(parents=True, exist_ok=True)
+    (root / "docs" / "registry.json").write_text(
+        json.dumps({"version": "1.0.0", "ontologies": {}})
+    )
+    (root / "artifacts" / "catalog-v001.xml").parent.mkdir(parents=True)
+    (root / "artifacts" / "catalog-v001.xml").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+  <uri name="http://example.org/base/v1" uri="base/base.owl.ttl"/>
+  <uri name="http://example.org/base/v1/shapes" uri="base/base.shacl.ttl"/>
+  <uri name="http://example.org/app/v1" uri="app/app.owl.ttl"/>
+  <uri name="http://example.org/app/v1/shapes" uri="app/app.shacl.ttl"/>
+</catalog>
+"""
+    )
+    files = {
+        "base/base.owl.ttl": "base:Thing a owl:Class .\n",
+        "base/base.shacl.ttl": "base:ThingShape a sh:NodeShape ; "
+        "sh:targetClass base:Thing .\n",
+        "app/app.owl.ttl": "app:Asset a owl:Class .\n"
+        "app:name a owl:DatatypeProperty .\n",
+        "app/app.shacl.ttl": "app:AssetShape a sh:NodeShape ; "
+        "sh:targetClass app:Asset ; sh:property [ sh:path app:part ; "
+        "sh:class base:Thing ] .\n",
+    }
+    for rel_path, content in files.items():
+        path = root / "artifacts" / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(PREFIXES + content)
+
+
+def _write_index(root: Path) -> dict:
+    index = build_schema_index(RegistryResolver(root))
+    (root / SCHEMA_INDEX_PATH).write_text(render_schema_index(index))
+    return index
+
+
+def test_build_schema_index_follows_sh_class_references(temp_dir: Path):
+    _write_repo(temp_dir)
+
+    index = build_schema_index(RegistryResolver(temp_dir))
+
+    app = index["domains"]["app"]
+    assert app["closure"]["domains"] == ["app", "base"]
+    assert app["closure"]["shacl"] == [
+        "artifacts/app/app.shacl.ttl",
+        "artifacts/base/base.shacl.ttl",
+    ]
+    assert app["classes"] == ["http://example.org/app/v1/Asset"]
+    assert app["properties"] == [
+        "http://example.org/app/v1/name",
+        "http://example.org/app/v1/part",
+    ]
+    assert "http://example.org/base/v1/" in app["namespaces"]
+    assert index["domains"]["base"]["closure"]["domains"] == ["base"]
+
+
+def test_load_schema_index_ignores_stale_index(temp_dir: Path):
+    _write_repo(temp_dir)
+    index = _write_index(temp_dir)
+    assert load_schema_index(temp_dir) == index
+
+    with (temp_dir / "artifacts" / "base" / "base.owl.ttl").open("a") as f:
+        f.write("base:Other a owl:Class .\n")
+
+    with pytest.warns(UserWarning, match="out of date"):
+        assert load_schema_index(temp_dir) is None
+
+
+def test_discover_required_schemas_uses_closure(temp_dir: Path):
+    _write_repo(temp_dir)
+    asset = {"http://example.org/app/v1/Asset"}
+
+    ontology_paths, _ = RegistryResolver(temp_dir).discover_required_schemas(asset)
+    assert ontology_paths == ["artifacts/app/app.owl.ttl"]
+
+    _write_index(temp_dir)
+    ontology_paths, shacl_paths = RegistryResolver(temp_dir).discover_required_schemas(
+        asset
+    )
+    assert ontology_paths == [
+        "artifacts/app/app.owl.ttl",
+        "artifacts/base/base.owl.ttl",
+    ]
+    # Shapes of referenced domains are not applied
+    assert shacl_paths == ["artifacts/app/app.shacl.ttl"]
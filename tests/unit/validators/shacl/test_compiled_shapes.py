@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.validators.shacl.compiled_shapes.
+"""
+
+import os
+from pathlib import Path
+
+from pyshacl import validate
+from rdflib import RDF, Graph, Literal, Namespace
+
+from src.tools.validators.shacl import compiled_shapes
+
+EX = Namespace("http://test.example.org/minimal/v1/")
+
+
+def _load(files):
+    graph = Graph()
+    for f in files:
+        graph.parse(str(f), format="turtle")
+    return graph
+
+
+def test_compiled_shapes_match_pyshacl(sample_shacl: Path):
+    compiled = compiled_shapes.CompiledShapes(_load([sample_shacl]), [sample_shacl])
+
+    data = Graph()
+    data.add((EX.ok, RDF.type, EX.TestClass))
+    data.add((EX.ok, EX.testProperty, Literal("value")))
+    data.add((EX.bad, RDF.type, EX.TestClass))
+
+    conforms, _, text = compiled.validate(data)
+    expected_conforms, _, expected_text = validate(
+        data, shacl_graph=_load([sample_shacl]), advanced=True
+    )
+
+    assert conforms is expected_conforms is False
+    assert text == expected_text
+
+    # Shapes are reused for the next data graph
+    data.remove((EX.bad, None, None))
+    assert compiled.validate(data)[0] is True
+
+
+def test_get_compiled_shapes_reuses_and_invalidates(sample_shacl: Path):
+    compiled_shapes.clear_compiled_shapes()
+    loads = []
+
+    def loader(files):
+        loads.append(files)
+        return _load(files)
+
+    first = compiled_shapes.get_compiled_shapes([sample_shacl], loader)
+    second = compiled_shapes.get_compiled_shapes([sample_shacl], loader)
+    assert first is second
+    assert len(loads) == 1
+
+    stat = sample_shacl.stat()
+    os.utime(sample_shacl, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    third = compiled_shapes.get_compiled_shapes([sample_shacl], loader)
+    assert third is not first
+    assert len(loads) == 2
+    compiled_shapes.clear_compiled_shapes()
+
+
+def test_for_data_prunes_and_reuses_shapes(sample_shacl: Path):
+    compiled = compiled_shapes.CompiledShapes(_load([sample_shacl]), [sample_shacl])
+
+    # No data type matches a target: nothing to validate
+    unrelated = Graph()
+    unrelated.add((EX.other, RDF.type, EX.OtherClass))
+    pruned = compiled.for_data(unrelated)
+    assert pruned is not compiled
+    assert len(pruned.graph) < len(compiled.graph)
+    assert pruned.validate(unrelated)[0] is True
+    assert compiled.for_data(unrelated) is pruned
+
+    # All targeted shapes apply: the full compiled shapes are used
+    data = Graph()
+    data.add((EX.bad, RDF.type, EX.TestClass))
+    assert compiled.for_data(data) is compiled
+
+
+def test_validate_falls_back_without_pyshacl_internals(sample_shacl: Path, monkeypatch):
+    compiled_shapes.clear_compiled_shapes()
+    monkeypatch.setattr(compiled_shapes, "PYSHACL_AVAILABLE", False)
+    monkeypatch.setattr(compiled_shapes, "_pyshacl_prepared", False)
+
+    def no_internals(*args, **kwargs):
+        raise AssertionError("pyshacl internals must not be used")
+
+    monkeypatch.setattr(compiled_shapes, "apply_patches", no_internals, raising=False)
+    monkeypatch.setattr(compiled_shapes, "ShapesGraph", no_internals, raising=False)
+
+    compiled = compiled_shapes.get_compiled_shapes([sample_shacl], _load)
+    data = Graph()
+    data.add((EX.bad, RDF.type, EX.TestClass))
+
+    conforms, _, text = compiled.validate(data)
+    _, _, expected_text = validate(
+        data, shacl_graph=_load([sample_shacl]), advanced=True
+    )
+
+    assert conforms is False
+    assert text == expected_text
+    compiled_shapes.clear_compiled_shapes()
@@ -3,9 +3,17 @@
 Unit tests for src.tools.validators.shacl.inference.
 """
 
-from rdflib import RDF, RDFS, Graph, Namespace
+from rdflib import RDF, RDFS, Graph, Literal, Namespace
 
-from src.tools.validators.shacl.inference import apply_rdfs_inference
+from src.tools.validators.shacl.inference import (
+    RdfsClosure,
+    apply_rdfs_inference,
+    apply_rdfs_inference_sparql,
+    extract_ontology_module,
+    get_ontology_module,
+    module_signature,
+    rdfs_inference_overlay,
+)
 
 
 def test_apply_rdfs_inference_subclass_and_domain():
@@ -23,3 +31,125 @@ def test_apply_rdfs_inference_subclass_and_domain():
     assert (ex.instance, RDF.type, ex.Super) in combined
     assert (ex.instance, RDF.type, ex.DomainClass) in combined
     assert inferred >= 1
+
+
+def test_apply_rdfs_inference_matches_sparql_engine():
+    ex = Namespace("http://example.org/")
+    data = Graph()
+    ont = Graph()
+
+    data.add((ex.instance, ex.subProp, ex.target))
+    data.add((ex.instance, ex.subProp, Literal("text")))
+    data.add((ex.instance, RDF.type, ex.Leaf))
+
+    ont.add((ex.Leaf, RDFS.subClassOf, ex.Mid))
+    ont.add((ex.Mid, RDFS.subClassOf, ex.Root))
+    ont.add((ex.subProp, RDFS.subPropertyOf, ex.superProp))
+    ont.add((ex.superProp, RDFS.domain, ex.DomainClass))
+    ont.add((ex.superProp, RDFS.range, ex.RangeClass))
+    ont.add((ex.individual, RDF.type, ex.Leaf))
+
+    combined, inferred = apply_rdfs_inference(data, ont)
+    expected, expected_inferred = apply_rdfs_inference_sparql(data, ont)
+
+    assert set(combined) == set(expected)
+    assert inferred == expected_inferred
+    assert (ex.instance, ex.superProp, ex.target) in combined
+    assert (ex.instance, RDF.type, ex.Root) in combined
+    assert (ex.target, RDF.type, ex.RangeClass) in combined
+    assert (ex.individual, RDF.type, ex.Root) in combined
+
+
+def test_rdfs_closure_is_bounded_by_depth():
+    ex = Namespace("http://example.org/")
+    ont = Graph()
+    ont.add((ex.A, RDFS.subClassOf, ex.B))
+    ont.add((ex.B, RDFS.subClassOf, ex.C))
+    ont.add((ex.C, RDFS.subClassOf, ex.A))
+
+    closure = RdfsClosure.from_graphs(ont, max_depth=1)
+    assert closure.superclasses[ex.A] == {ex.B}
+
+    closure = RdfsClosure.from_graphs(ont)
+    assert closure.superclasses[ex.A] == {ex.B, ex.C}
+
+
+def test_rdfs_inference_overlay_matches_combined_graph_and_restores():
+    ex = Namespace("http://example.org/")
+    data = Graph()
+    ont = Graph()
+
+    data.add((ex.instance, ex.subProp, ex.target))
+    data.add((ex.instance, RDF.type, ex.Leaf))
+    data.add((ex.Leaf, RDFS.seeAlso, ex.doc))
+
+    ont.add((ex.Leaf, RDFS.subClassOf, ex.Root))
+    ont.add((ex.Leaf, RDFS.seeAlso, ex.doc))
+    ont.add((ex.subProp, RDFS.subPropertyOf, ex.superProp))
+    ont.add((ex.superProp, RDFS.range, ex.RangeClass))
+
+    with rdfs_inference_overlay(Graph(), ont) as (overlay, inferred):
+        entailed_size = len(overlay)
+        assert inferred == 0
+
+    expected, expected_inferred = apply_rdfs_inference(data, ont)
+    with rdfs_inference_overlay(data, ont) as (overlay, inferred):
+        assert set(overlay) == set(expected)
+        assert inferred == expected_inferred
+
+    # Data triples are removed again; the ontology entailments stay cached
+    with rdfs_inference_overlay(Graph(), ont) as (overlay, _):
+        assert len(overlay) == entailed_size
+        assert (ex.instance, RDF.type, ex.Root) not in overlay
+
+
+def test_ontology_module_keeps_axioms_reachable_from_data():
+    ex = Namespace("http://example.org/")
+    data = Graph()
+    ont = Graph()
+
+    data.add((ex.instance, RDF.type, ex.Leaf))
+    data.add((ex.instance, ex.subProp, ex.target))
+
+    ont.add((ex.Leaf, RDFS.subClassOf, ex.Mid))
+    ont.add((ex.Mid, RDFS.subClassOf, ex.Root))
+    ont.add((ex.subProp, RDFS.subPropertyOf, ex.superProp))
+    ont.add((ex.superProp, RDFS.range, ex.RangeClass))
+    ont.add((ex.RangeClass, RDFS.subClassOf, ex.Root))
+    ont.add((ex.Unused, RDFS.subClassOf, ex.Root))
+    ont.add((ex.unusedProp, RDFS.domain, ex.Unused))
+
+    assert module_signature(ont, data) == {ex.Leaf, ex.subProp}
+
+    module = extract_ontology_module(ont, module_signature(ont, data))
+    assert len(module) == 5
+    assert (ex.Unused, RDFS.subClassOf, ex.Root) not in module
+
+    # Entailments of the data are the same as with the whole ontology
+    combined, _ = apply_rdfs_inference(data, ont)
+    pruned, _ = apply_rdfs_inference(data, module)
+    assert {t for t in combined if t[0] in (ex.instance, ex.target)} == {
+        t for t in pruned if t[0] in (ex.instance, ex.target)
+    }
+
+
+def test_get_ontology_module_is_cached_per_signature():
+    ex = Namespace("http://example.org/")
+    ont = Graph()
+    ont.add((ex.A, RDFS.subClassOf, ex.Root))
+    ont.add((ex.B, RDFS.subClassOf, ex.Root))
+
+    first = Graph()
+    first.add((ex.one, RDF.type, ex.A))
+    second = Graph()
+    second.add((ex.two, RDF.type, ex.A))
+    other = Graph()
+    other.add((ex.three, RDF.type, ex.B))
+
+    module = get_ontology_module(ont, first)
+    assert get_ontology_module(ont, second) is module
+    assert get_ontology_module(ont, other) is not module
+
+    # Changing the ontology invalidates its modules
+    ont.add((ex.A, RDFS.label, Literal("A")))
+    assert get_ontology_module(ont, first) is not module
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.validators.shacl.shape_pruning.
+"""
+
+from pyshacl import validate
+from rdflib import RDF, RDFS, Graph, Literal, Namespace
+
+from src.tools.validators.shacl.shape_pruning import ShapeIndex
+
+EX = Namespace("http://test.example.org/pruning/v1/")
+
+SHAPES = """
+@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix ex: <http://test.example.org/pruning/v1/> .
+
+ex:PersonShape a sh:NodeShape ;
+    sh:targetClass ex:Person ;
+    sh:property [ sh:path ex:name ; sh:minCount 1 ] ;
+    sh:property [ sh:path ex:address ; sh:node ex:AddressShape ] .
+
+ex:AddressShape a sh:NodeShape ;
+    sh:or ( ex:StreetShape [ sh:path ex:poBox ; sh:minCount 1 ] ) .
+
+ex:StreetShape a sh:NodeShape ;
+    sh:property [ sh:path ex:street ; sh:minCount 1 ] .
+
+ex:CarShape a sh:NodeShape ;
+    sh:targetClass ex:Car ;
+    sh:property [ sh:path ex:wheels ; sh:datatype xsd:integer ] .
+
+ex:OwnerShape a sh:NodeShape ;
+    sh:targetSubjectsOf ex:owns ;
+    sh:property [ sh:path ex:owns ; sh:class ex:Car ] .
+"""
+
+
+def _shapes():
+    return Graph().parse(data=SHAPES, format="turtle")
+
+
+def test_relevant_shapes_follow_targets():
+    index = ShapeIndex(_shapes())
+
+    data = Graph()
+    data.add((EX.alice, RDF.type, EX.Person))
+    assert index.relevant_shapes(data) == {EX.PersonShape}
+
+    data.add((EX.alice, EX.owns, EX.beetle))
+    assert index.relevant_shapes(data) == {EX.PersonShape, EX.OwnerShape}
+
+
+def test_relevant_shapes_include_superclass_targets():
+    index = ShapeIndex(_shapes())
+
+    data = Graph()
+    data.add((EX.Employee, RDFS.subClassOf, EX.Person))
+    data.add((EX.bob, RDF.type, EX.Employee))
+    assert index.relevant_shapes(data) == {EX.PersonShape}
+
+
+def test_extract_keeps_referenced_shapes():
+    index = ShapeIndex(_shapes())
+    pruned = index.extract(index.relevant_shapes(_person_data()))
+
+    subjects = set(pruned.subjects())
+    assert {EX.PersonShape, EX.AddressShape, EX.StreetShape} <= subjects
+    assert EX.CarShape not in subjects
+    assert EX.OwnerShape not in subjects
+
+
+def test_pruned_validation_matches_full_validation():
+    index = ShapeIndex(_shapes())
+    data = _person_data()
+    pruned = index.extract(index.relevant_shapes(data))
+
+    full_conforms, full_report, _ = validate(data, shacl_graph=_shapes())
+    conforms, report, _ = validate(data, shacl_graph=pruned)
+
+    assert conforms is full_conforms is False
+    assert len(report) == len(full_report)
+
+
+def _person_data():
+    data = Graph()
+    data.add((EX.alice, RDF.type, EX.Person))
+    data.add((EX.alice, EX.address, EX.home))
+    data.add((EX.home, EX.city, Literal("Berlin")))
+    return data
@@ -3,8 +3,10 @@
 Unit tests for src.tools.validators.shacl.validator.
 """
 
+import contextlib
 from pathlib import Path
 
+import pytest
 from rdflib import RDF, RDFS, Graph, Namespace
 
 from src.tools.validators.shacl.validator import ShaclValidator
@@ -52,3 +54,80 @@ def test_apply_inference_rdfs_adds_inferred(tmp_path: Path):
     combined, inferred = validator._apply_inference(data, ont)
     assert (ex.a, RDF.type, ex.Super) in combined
     assert inferred >= 1
+
+
+def test_validate_many_returns_per_file_results(
+    minimal_repo: Path, sample_instance: Path, invalid_instance: Path
+):
+    validator = ShaclValidator(minimal_repo, verbose=False)
+
+    results = validator.validate_many([sample_instance, invalid_instance])
+
+    assert [r.conforms for r in results] == [True, False]
+    assert [r.files_validated for r in results] == [
+        [validator._rel_path(sample_instance)],
+        [validator._rel_path(invalid_instance)],
+    ]
+    single = validator.validate([invalid_instance])
+    assert results[1].report_text == single.report_text
+    assert results[1].return_code == single.return_code == 210
+
+
+def test_validate_records_stage_metrics(minimal_repo: Path, sample_instance: Path):
+    validator = ShaclValidator(minimal_repo, verbose=False)
+
+    result = validator.validate([sample_instance])
+    validator.format_result(result)
+
+    metrics = result.metrics
+    assert set(metrics.stages) == {
+        "load_data",
+        "schema_discovery",
+        "inference",
+        "validation",
+        "formatting",
+    }
+    assert metrics.files_parsed["data"] == 1
+    assert metrics.files_parsed["ontology"] >= 1
+    assert metrics.triples["validated"] == result.triples_count
+    assert metrics.triples["inferred"] == result.inferred_count
+
+
+def test_validate_reports_schema_files(minimal_repo: Path, sample_instance: Path):
+    validator = ShaclValidator(minimal_repo, verbose=False, schema_cache_size=1)
+    domain_dir = minimal_repo / "artifacts" / "minimal"
+    expected = {
+        (domain_dir / name).resolve()
+        for name in ("minimal.owl.ttl", "minimal.shacl.ttl")
+    }
+
+    first = validator.validate([sample_instance])
+    cached = validator.validate([sample_instance])
+
+    assert expected <= {path.resolve() for path in first.schema_files}
+    assert cached.schema_files == first.schema_files
+
+
+def test_validate_leaves_inference_context_on_error(
+    minimal_repo: Path, sample_instance: Path, monkeypatch
+):
+    validator = ShaclValidator(minimal_repo, verbose=False)
+    events = []
+
+    @contextlib.contextmanager
+    def inference_context(data_graph, ontology_graph):
+        events.append("enter")
+        try:
+            yield data_graph, 0
+        finally:
+            events.append("exit")
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("validation failed")
+
+    monkeypatch.setattr(validator, "_inference_context", inference_context)
+    monkeypatch.setattr(validator, "_run_validation", fail)
+
+    with pytest.raises(RuntimeError):
+        validator.validate([sample_instance])
+    assert events == ["enter", "exit"]
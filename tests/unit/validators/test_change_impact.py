@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.validators.change_impact.
+"""
+
+import json
+from pathlib import Path
+
+from src.tools.utils.registry_resolver import RegistryResolver
+from src.tools.validators.change_impact import (
+    get_affected_domains,
+    get_import_dependents,
+)
+
+CATALOG_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+"""
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _impact_repo(root: Path) -> RegistryResolver:
+    """Repository with domain 'ext' importing 'base' and a fixture user 'other'."""
+    _write(root / "docs" / "registry.json", '{"version":"1.0.0","ontologies":{}}')
+    _write(root / "artifacts" / "base" / "base.owl.ttl", "# base ontology\n")
+    _write(root / "artifacts" / "base" / "base.shacl.ttl", "# base shapes\n")
+    _write(
+        root / "artifacts" / "ext" / "ext.owl.ttl",
+        "<http://example.org/ext/v1/> a owl:Ontology ;\n"
+        "    owl:imports <http://example.org/base/v1/> .\n",
+    )
+    _write(
+        root / "artifacts" / "catalog-v001.xml",
+        CATALOG_HEADER
+        + '  <uri name="http://example.org/base/v1/" uri="base/base.owl.ttl"/>\n'
+        + '  <uri name="http://example.org/base/v1/shapes" uri="base/base.shacl.ttl"/>\n'
+        + '  <uri name="http://example.org/ext/v1/" uri="ext/ext.owl.ttl"/>\n'
+        + "</catalog>\n",
+    )
+
+    fixture_iri = "did:web:fixture.example.org:Thing:one"
+    _write(root / "tests" / "fixtures" / "thing.json", json.dumps({"@id": fixture_iri}))
+    for domain, reference in (("base", ""), ("ext", ""), ("other", fixture_iri)):
+        _write(
+            root / "tests" / "data" / domain / "valid" / f"{domain}_instance.json",
+            json.dumps({"@id": f"urn:{domain}", "urn:p": {"@id": reference}}),
+        )
+    _write(
+        root / "tests" / "catalog-v001.xml",
+        CATALOG_HEADER
+        + "".join(
+            f'  <uri name="urn:test:{d}" uri="tests/data/{d}/valid/{d}_instance.json"'
+            f' domain="{d}" test-type="valid" category="test-data"/>\n'
+            for d in ("base", "ext", "other")
+        )
+        + f'  <uri name="{fixture_iri}" uri="tests/fixtures/thing.json"'
+        ' domain="fixture" test-type="fixture" category="fixture"/>\n' + "</catalog>\n",
+    )
+    return RegistryResolver(root)
+
+
+def test_get_import_dependents_reads_owl_imports(temp_dir: Path):
+    resolver = _impact_repo(temp_dir)
+
+    assert get_import_dependents(resolver) == {"base": {"ext"}}
+
+
+def test_artifact_change_affects_importing_domains(temp_dir: Path):
+    resolver = _impact_repo(temp_dir)
+
+    affected = get_affected_domains(["artifacts/base/base.shacl.ttl"], resolver)
+
+    assert affected == ["base", "ext"]
+
+
+def test_fixture_and_test_data_changes_map_to_their_domains(temp_dir: Path):
+    resolver = _impact_repo(temp_dir)
+
+    assert get_affected_domains(["tests/fixtures/thing.json"], resolver) == ["other"]
+    assert get_affected_domains(
+        ["tests/data/ext/invalid/fail01.expected"], resolver
+    ) == ["ext"]
+    assert get_affected_domains(["README.md"], resolver) == []
+
+
+def test_global_changes_affect_all_domains(temp_dir: Path):
+    resolver = _impact_repo(temp_dir)
+
+    for path in ("imports/rdf/rdf.owl.ttl", "tests/catalog-v001.xml"):
+        assert get_affected_domains([path], resolver) == ["base", "ext", "other"]
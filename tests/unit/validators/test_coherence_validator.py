@@ -3,13 +3,18 @@
 Unit tests for coherence_validator behavior.
 """
 
+import hashlib
 from pathlib import Path
+from types import SimpleNamespace
 
 from src.tools.core.iri_utils import get_local_name
 from src.tools.core.result import ReturnCodes
+from src.tools.validators import coherence_validator
 from src.tools.validators.coherence_validator import (
+    BASE_CLASSES_CACHE_PATH,
     extract_ontology_classes,
     extract_shacl_classes_from_file,
+    get_base_ontology_classes,
     validate_artifact_coherence,
 )
 
@@ -77,3 +82,55 @@ ex:Thing a owl:Class .
     classes, labels = extract_ontology_classes(str(owl_file))
     assert "thing" in classes
     assert labels == {}
+
+
+def _write_base_ontology(root: Path, classes: str) -> SimpleNamespace:
+    (root / "imports").mkdir(parents=True, exist_ok=True)
+    (root / "imports" / "catalog-v001.xml").write_text("<catalog/>")
+    (root / "imports" / "base.owl.ttl").write_text(
+        "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+        "@prefix ex: <http://example.org/> .\n"
+        f"{classes}\n"
+    )
+    return SimpleNamespace(
+        get_base_ontology_paths=lambda: ["imports/base.owl.ttl"],
+        to_absolute=lambda rel_path: root / rel_path,
+    )
+
+
+def test_base_ontology_classes_are_computed_once(temp_dir: Path, monkeypatch):
+    resolver = _write_base_ontology(temp_dir, "ex:Base a owl:Class .")
+    monkeypatch.setattr(coherence_validator, "_base_classes", {})
+
+    assert get_base_ontology_classes(resolver, temp_dir) == {"base"}
+    assert (temp_dir / BASE_CLASSES_CACHE_PATH).exists()
+
+    # Neither the process memo nor the persisted set parse the file again
+    monkeypatch.setattr(coherence_validator, "read_graph", None)
+    assert get_base_ontology_classes(resolver, temp_dir) == {"base"}
+    monkeypatch.setattr(coherence_validator, "_base_classes", {})
+    assert get_base_ontology_classes(resolver, temp_dir) == {"base"}
+
+
+def test_base_ontology_classes_follow_catalog_hash(temp_dir: Path, monkeypatch):
+    resolver = _write_base_ontology(temp_dir, "ex:Base a owl:Class .")
+    monkeypatch.setattr(coherence_validator, "_base_classes", {})
+    assert get_base_ontology_classes(resolver, temp_dir) == {"base"}
+
+    _write_base_ontology(temp_dir, "ex:Other a owl:Class .")
+    assert get_base_ontology_classes(resolver, temp_dir) == {"other"}
+
+
+def test_base_catalog_hash_is_computed_once_per_stamps(temp_dir: Path, monkeypatch):
+    resolver = _write_base_ontology(temp_dir, "ex:Base a owl:Class .")
+    monkeypatch.setattr(coherence_validator, "_catalog_hashes", {})
+    first = coherence_validator._base_catalog_hash(resolver)
+
+    # Unchanged stamps: the files are not hashed again
+    monkeypatch.setattr(coherence_validator, "hashlib", None)
+    assert coherence_validator._base_catalog_hash(resolver) == first
+
+    # Changed stamps: the files are hashed again
+    monkeypatch.setattr(coherence_validator, "hashlib", hashlib)
+    _write_base_ontology(temp_dir, "ex:Other a owl:Class .")
+    assert coherence_validator._base_catalog_hash(resolver) != first
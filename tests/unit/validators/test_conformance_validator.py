@@ -3,11 +3,13 @@
 Unit tests for src.tools.validators.conformance_validator.
 """
 
+import json
 from pathlib import Path
 
 from src.tools.core.result import ReturnCodes
 from src.tools.validators.conformance_validator import (
     collect_jsonld_files,
+    validate_data_conformance,
     validate_files,
 )
 
@@ -20,3 +22,18 @@ def test_validate_files_no_files_returns_error(temp_dir: Path):
     result = validate_files([str(temp_dir)])
     assert result.return_code == ReturnCodes.GENERAL_ERROR
     assert "No JSON-LD files found" in result.report_text
+
+
+def test_validate_data_conformance_appends_metrics(
+    minimal_repo: Path, sample_instance: Path, temp_dir: Path
+):
+    metrics_out = temp_dir / "metrics.jsonl"
+
+    return_code, _ = validate_data_conformance(
+        [sample_instance], minimal_repo, metrics_out=metrics_out
+    )
+
+    record = json.loads(metrics_out.read_text())
+    assert record["return_code"] == return_code == ReturnCodes.SUCCESS
+    assert record["files_parsed"]["data"] == 1
+    assert "validation" in record["stages"]
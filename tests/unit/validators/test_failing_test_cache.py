@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.validators.failing_test_cache.
+"""
+
+from pathlib import Path
+
+from src.tools.validators import failing_test_cache
+
+
+def _inputs(root: Path):
+    test_file = root / "fail01.json"
+    expected_file = root / "fail01.expected"
+    schema_file = root / "domain.shacl.ttl"
+    test_file.write_text('{"@id": "urn:test"}')
+    expected_file.write_text("Validation FAILED")
+    schema_file.write_text("# shapes\n")
+    return test_file, expected_file, schema_file
+
+
+def test_lookup_hits_only_after_store(temp_dir: Path):
+    test_file, expected_file, schema_file = _inputs(temp_dir)
+    cache = failing_test_cache.FailingTestCache(temp_dir / "cache", temp_dir)
+
+    assert not cache.lookup(test_file, expected_file)
+    cache.store(test_file, expected_file, [schema_file])
+
+    assert cache.lookup(test_file, expected_file)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_any_changed_input_invalidates_entry(temp_dir: Path):
+    inputs = _inputs(temp_dir)
+    cache = failing_test_cache.FailingTestCache(temp_dir / "cache", temp_dir)
+
+    for changed in inputs:
+        cache.store(inputs[0], inputs[1], [inputs[2]])
+        changed.write_text(changed.read_text() + " ")
+        assert not cache.lookup(inputs[0], inputs[1]), changed.name
+
+
+def test_tool_version_change_invalidates_entry(temp_dir: Path, monkeypatch):
+    test_file, expected_file, schema_file = _inputs(temp_dir)
+    cache = failing_test_cache.FailingTestCache(temp_dir / "cache", temp_dir)
+    cache.store(test_file, expected_file, [schema_file])
+
+    monkeypatch.setitem(
+        failing_test_cache._tool_versions, temp_dir.resolve(), "other-version"
+    )
+
+    assert not cache.lookup(test_file, expected_file)
+
+
+def test_get_failing_test_cache_disabled_by_env(temp_dir: Path, monkeypatch):
+    monkeypatch.setenv(failing_test_cache.FAILING_TEST_CACHE_ENV, "0")
+    assert failing_test_cache.get_failing_test_cache(temp_dir) is None
+
+    monkeypatch.setenv(failing_test_cache.FAILING_TEST_CACHE_ENV, "1")
+    cache = failing_test_cache.get_failing_test_cache(temp_dir)
+    assert cache.cache_dir == temp_dir / failing_test_cache.FAILING_TEST_CACHE_DIRNAME
+
+
+def test_repeated_lookups_do_not_rehash(temp_dir: Path, monkeypatch):
+    test_file, expected_file, schema_file = _inputs(temp_dir)
+    cache = failing_test_cache.FailingTestCache(temp_dir / "cache", temp_dir)
+    cache.store(test_file, expected_file, [schema_file])
+    assert cache.lookup(test_file, expected_file)
+
+    def no_binary_reads(self, mode="r", *args, **kwargs):
+        assert "b" not in mode, f"re-hashed {self}"
+        return open_text(self, mode, *args, **kwargs)
+
+    def no_tree_walk(self, pattern):
+        raise AssertionError("tool version re-computed")
+
+    open_text = Path.open
+    monkeypatch.setattr(Path, "open", no_binary_reads)
+    monkeypatch.setattr(Path, "rglob", no_tree_walk)
+
+    other = failing_test_cache.FailingTestCache(temp_dir / "cache", temp_dir)
+    assert other.lookup(test_file, expected_file)
@@ -48,3 +48,70 @@ def test_check_turtle_syntax_error(temp_dir: Path):
     code, msg = syntax_validator.check_turtle_syntax(file_path)
     assert code == ReturnCodes.TURTLE_SYNTAX_ERROR
     assert "Syntax Error" in msg or "Unexpected error" in msg
+
+
+def test_verify_turtle_syntax_pooled_keeps_sorted_order(temp_dir: Path):
+    triple = "<http://example.org/a> <http://example.org/p> <http://example.org/o> ."
+    for name in ("c.ttl", "a.ttl", "b.ttl"):
+        (temp_dir / name).write_text(triple)
+    (temp_dir / "b.ttl").write_text("not turtle")
+
+    sequential = syntax_validator.verify_turtle_syntax([str(temp_dir)], temp_dir)
+    pooled = syntax_validator.verify_turtle_syntax([str(temp_dir)], temp_dir, jobs=2)
+
+    assert pooled == sequential
+    code, results = pooled
+    assert code == ReturnCodes.TURTLE_SYNTAX_ERROR
+    assert [msg.split()[-1] for msg in (results[0][1], results[2][1])] == [
+        "a.ttl",
+        "c.ttl",
+    ]
+    assert results[1][0] == ReturnCodes.TURTLE_SYNTAX_ERROR
+
+
+def test_check_turtle_syntax_only_reports_position(temp_dir: Path, monkeypatch):
+    ok_path = temp_dir / "ok.ttl"
+    ok_path.write_text("@prefix ex: <http://example.org/> .\nex:a ex:p <o> .\n")
+    bad_path = temp_dir / "bad.ttl"
+    bad_path.write_text('@prefix ex: <http://example.org/> .\nex:a ex:p "open .\n')
+
+    for oxigraph in {syntax_validator.OXIGRAPH_PARSER_AVAILABLE, False}:
+        monkeypatch.setattr(syntax_validator, "OXIGRAPH_PARSER_AVAILABLE", oxigraph)
+        code, msg = syntax_validator.check_turtle_syntax_only(ok_path)
+        assert code == ReturnCodes.SUCCESS
+        assert "Syntax OK" in msg
+
+        code, msg = syntax_validator.check_turtle_syntax_only(bad_path)
+        assert code == ReturnCodes.TURTLE_SYNTAX_ERROR
+        assert "Line 2, Col " in msg
+
+
+def test_check_turtle_syntax_only_matches_full_check(temp_dir: Path, monkeypatch):
+    # rdflib accepts IRIs with spaces and language tags over 8 characters
+    lax_path = temp_dir / "lax.ttl"
+    lax_path.write_text(
+        "@prefix ex: <http://example.org/> .\n"
+        "ex:a ex:p <http://example.org/with space> .\n"
+        'ex:a ex:label "x"@abcdefghijk .\n'
+    )
+
+    full_code, _ = syntax_validator.check_turtle_syntax(lax_path)
+    assert full_code == ReturnCodes.SUCCESS
+    for oxigraph in {syntax_validator.OXIGRAPH_PARSER_AVAILABLE, False}:
+        monkeypatch.setattr(syntax_validator, "OXIGRAPH_PARSER_AVAILABLE", oxigraph)
+        code, msg = syntax_validator.check_turtle_syntax_only(lax_path)
+        assert code == full_code, msg
+
+
+def test_syntax_error_position_without_private_attributes():
+    class ChangedBadSyntax(SyntaxError):
+        """rdflib error that no longer has _str, _i, _why or lines."""
+
+    line, col, reason = syntax_validator._syntax_error_position(
+        ChangedBadSyntax("unexpected token")
+    )
+    assert (line, col, reason) == (0, 0, "unexpected token")
+
+    partial = ChangedBadSyntax("bad")
+    partial.lines, partial._i, partial._str = 1, "?", None
+    assert syntax_validator._syntax_error_position(partial) == (2, 0, "bad")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src.tools.validators.validation_server.
+"""
+
+import json
+import threading
+import urllib.request
+from pathlib import Path
+
+from src.tools.validators.validation_server import ValidationService, create_server
+
+
+def test_validate_document_reuses_cached_schemas(
+    minimal_repo: Path, sample_instance: Path, invalid_instance: Path
+):
+    service = ValidationService(minimal_repo, schema_cache_size=4)
+    body = sample_instance.read_bytes()
+
+    status, payload = service.validate_document(body, "valid.json")
+    assert status == 200
+    assert payload["conforms"] is True
+    assert service.health()["cached_schema_sets"] == 1
+
+    status, payload = service.validate_document(
+        invalid_instance.read_bytes(), "invalid.json"
+    )
+    assert status == 200
+    assert payload["conforms"] is False
+    assert payload["return_code"] == 210
+    assert service.health()["cached_schema_sets"] == 1
+    assert service.health()["requests_served"] == 2
+
+
+def test_validate_document_rejects_malformed_json(minimal_repo: Path):
+    service = ValidationService(minimal_repo)
+    status, payload = service.validate_document(b"{broken", "broken.json")
+    assert status == 400
+    assert payload["conforms"] is False
+
+
+def test_http_server_validate_endpoint(minimal_repo: Path, sample_instance: Path):
+    service = ValidationService(minimal_repo)
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        request = urllib.request.Request(
+            f"http://{host}:{port}/validate",
+            data=sample_instance.read_bytes(),
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            payload = json.loads(response.read())
+        assert payload["conforms"] is True
+
+        with urllib.request.urlopen(
+            f"http://{host}:{port}/health", timeout=10
+        ) as response:
+            assert json.loads(response.read())["status"] == "ok"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_validate_document_reloads_edited_schemas(
+    minimal_repo: Path, sample_instance: Path
+):
+    service = ValidationService(minimal_repo, schema_cache_size=4)
+    body = sample_instance.read_bytes()
+
+    status, payload = service.validate_document(body, "valid.json")
+    assert status == 200
+    assert payload["conforms"] is True
+
+    # The sample instance's testProperty is a string
+    shacl_file = minimal_repo / "artifacts" / "minimal" / "minimal.shacl.ttl"
+    shacl_file.write_text(shacl_file.read_text().replace("xsd:string", "xsd:integer"))
+
+    status, payload = service.validate_document(body, "valid.json")
+    assert status == 200
+    assert payload["conforms"] is False
+    assert service.health()["cached_schema_sets"] == 1
@@ -27,3 +27,50 @@ def test_parse_gitignore_patterns(temp_dir: Path):
     assert "dist" in ignored
     assert "build" in ignored
     assert "file.txt" not in ignored
+
+
+def _echo_domain_check(domain: str) -> int:
+    print(f"checked {domain}")
+    return 7 if domain == "broken" else 0
+
+
+def test_run_domains_parallel_output_is_ordered(capsys):
+    domains = ["alpha", "beta", "gamma", "delta"]
+
+    assert validation_suite._run_domains(_echo_domain_check, domains, jobs=1) == 0
+    sequential = capsys.readouterr().out
+
+    assert validation_suite._run_domains(_echo_domain_check, domains, jobs=3) == 0
+    parallel = capsys.readouterr().out
+
+    checked = [line for line in parallel.splitlines() if line.startswith("checked")]
+    assert checked == [line for line in sequential.splitlines()]
+    assert checked == [f"checked {d}" for d in domains]
+
+
+def test_run_domains_parallel_stops_at_first_failure(capsys):
+    domains = ["alpha", "broken", "gamma"]
+
+    assert validation_suite._run_domains(_echo_domain_check, domains, jobs=2) == 7
+    out = capsys.readouterr().out
+    assert "checked broken" in out
+    assert "checked gamma" not in out
+
+
+def test_run_domains_writes_profile_per_domain(temp_dir: Path, monkeypatch):
+    monkeypatch.setenv(validation_suite.PROFILE_DIR_ENV, str(temp_dir))
+    domains = ["alpha", "beta"]
+
+    for jobs in (1, 2):
+        assert (
+            validation_suite._run_domains(
+                _echo_domain_check, domains, jobs=jobs, phase="check-syntax"
+            )
+            == 0
+        )
+        assert sorted(p.name for p in temp_dir.glob("*.prof")) == [
+            "check-syntax.alpha.prof",
+            "check-syntax.beta.prof",
+        ]
+        for profile in temp_dir.glob("*.prof"):
+            profile.unlink()